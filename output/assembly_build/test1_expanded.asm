@@ -0,0 +1,7 @@
+; Test file 1
+.org 0xA0020000
+
+start1:
+    MOV D[0], 0x1234
+    
+end1:
\ No newline at end of file
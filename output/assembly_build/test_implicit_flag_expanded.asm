@@ -0,0 +1,4 @@
+start:
+    ld.bu d15,[a15], 4
+    st.w [a15], 10, d15
+    lea a2, [a15], 8
@@ -0,0 +1,9 @@
+; Test Intel HEX output format
+; Expected output at 0x08000000-0x08000007:
+; 0x12, 0x34, 0x56, 0x78, 0x9A, 0xBC, 0xDE, 0xF0
+
+.ORG 0x80000000
+
+test_data:
+    DB 0x12, 0x34, 0x56, 0x78
+    DB 0x9A, 0xBC, 0xDE, 0xF0
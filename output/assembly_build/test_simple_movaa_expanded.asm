@@ -0,0 +1,5 @@
+; Simple MOV.AA test
+mov.aa a15, a4
+mov.aa a13, a7
+mov.aa a4, a15
+mov.aa a2, a5
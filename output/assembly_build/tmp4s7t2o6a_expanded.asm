@@ -0,0 +1,3 @@
+; Test optimization flags
+mov d0, #0x20
+st.w [a0], d0
@@ -0,0 +1,2 @@
+; Combined options test
+mov d0, #0x20
@@ -0,0 +1,2 @@
+; Minimal test
+nop
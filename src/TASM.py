@@ -12,41 +12,82 @@ Compatible command-line interface with NASM for seamless integration.
 
 import sys
 import os
+import re
+import time
+import json
+import hashlib
+import importlib
+import mmap
 from pathlib import Path
-import argparse
-from typing import List, Optional, Dict, Any, Tuple
-from datetime import datetime
+from typing import List, Optional, Dict, Any, Tuple, TYPE_CHECKING
+from dataclasses import dataclass, field
 
 # Add src directory to Python path
 src_path = Path(__file__).parent
 sys.path.insert(0, str(src_path))
 
 from logger import (
-    initialize_logger, log_info, log_error, log_warning, log_debug, log_abort, log_fatal,
-    print_build_summary, export_build_summary_json, get_logger, LogLevel
+    initialize_logger, log_info, log_error, log_warning, log_debug, log_abort,
+    log_file_phase, print_build_summary, export_build_summary_json, get_logger, LogLevel, LogEntry,
+    INFO_VERBOSITY_LEVELS
 )
 from utils import create_output_dir
-from macro import MacroExpander
-from assembler import AssemblerEngine
-from linker import Linker
 from config_loader import get_config
 
+# The macro, assembly and link phase modules are imported on first use (the
+# assembler pulls in the instruction set loader and pandas), so -h / -v,
+# argument errors and -E stay fast.
+if TYPE_CHECKING:
+    from macro import MacroExpander, Macro
+    from assembler import AssemblerEngine
+    from linker import Linker
+
 # Version information
 TASM_VERSION = "1.0.0"
 TASM_DATE = "2025-11-01"
 
+# On-disk cache of assembled object files, keyed by the expanded source and
+# everything else the assembler output depends on (see _obj_cache_salt).
+# Bump OBJ_CACHE_VERSION whenever the object file format changes.
+OBJ_CACHE_VERSION = 1
+OBJ_CACHE_DIR = Path.home() / '.cache' / 'tasm' / 'objs'
+
+# On-disk cache of expanded sources (single-file builds and -E), keyed by the
+# source file, the macro files and the macro expander version
+EXPAND_CACHE_VERSION = 1
+EXPAND_CACHE_DIR = Path.home() / '.cache' / 'tasm' / 'expanded'
+
+# Bounds of each on-disk cache directory; the least recently used entries
+# (by atime, refreshed on every hit) are evicted beyond them
+CACHE_MAX_ENTRIES = 512
+CACHE_MAX_BYTES = 64 << 20
+
+# In-process cache of the macro definitions loaded from a set of macro files,
+# keyed by the path, mtime and size of each file (see _macro_set_key)
+MACRO_SET_CACHE_SIZE = 8
+_macro_sets: Dict[Tuple[Tuple[str, int, int], ...], Dict[str, 'Macro']] = {}
+
+# ANSI color codes (green, red, reset), disabled when stdout is not a terminal
+_COLORS = (('\033[92m', '\033[91m', '\033[0m')
+           if sys.stdout is not None and sys.stdout.isatty() else ('', '', ''))
+
 # Console output functions
 def print_header():
     """Print custom TASM header"""
-    print(f"TASM version {TASM_VERSION} compiled on {TASM_DATE}-- Created by Gino Latino")
-    print()
+    sys.stdout.write(f"TASM version {TASM_VERSION} compiled on {TASM_DATE}-- Created by Gino Latino\n\n")
+
+def _phase_line(phase_name: str, details: str = "") -> str:
+    """Format one phase progress line"""
+    return f"{phase_name}... {details}\n" if details else f"{phase_name}...\n"
 
 def print_phase(phase_name: str, details: str = ""):
     """Print phase progress"""
-    if details:
-        print(f"{phase_name}... {details}")
-    else:
-        print(f"{phase_name}...")
+    sys.stdout.write(_phase_line(phase_name, details))
+
+def print_link_phases():
+    """Print both linking phase lines with a single write"""
+    sys.stdout.write(_phase_line("Linking, 1st pass", "Resolving symbols") +
+                     _phase_line("Linking, 2nd pass", "Finalizing"))
 
 def print_enhanced_summary(output_file_path: Optional[Path] = None, instruction_count: int = 0,
                           linker: Optional['Linker'] = None, output_format: str = 'bin'):
@@ -54,65 +95,63 @@ def print_enhanced_summary(output_file_path: Optional[Path] = None, instruction_
     logger = get_logger()
     
     # Get timing information
-    start_time = getattr(logger, 'start_time', datetime.now())
-    end_time = datetime.now()
-    duration = (end_time - start_time).total_seconds()
+    duration = logger.elapsed()
     
-    print("============================================================")
-    print("COMPILATION SUMMARY") 
-    print("============================================================")
+    # Build the whole summary and write it once
+    parts = [
+        "============================================================\n"
+        "COMPILATION SUMMARY\n"
+        "============================================================\n"
+    ]
     
     # Calculate stats
     stats = logger.stats
     total_messages = sum(stats.values())
     
-    # ANSI color codes
-    GREEN = '\033[92m'
-    RED = '\033[91m'
-    RESET = '\033[0m'
+    GREEN, RED, RESET = _COLORS
     
     # Build status
-    error_count = stats[LogLevel.ERROR] + stats[LogLevel.ABORT] + stats[LogLevel.FATAL]
+    error_count = logger.error_total
     
     if error_count == 0:
-        print(f"{GREEN}BUILD SUCCEEDED{RESET}")
+        parts.append(f"{GREEN}BUILD SUCCEEDED{RESET}\n")
         
-        # Get file size information
-        file_size = 0
-        if output_file_path and output_file_path.exists():
-            file_size = output_file_path.stat().st_size
+        # Get file size information (reported by the linker, no stat needed)
+        file_size = linker.bytes_written if linker else 0
         
         # Calculate performance metrics
         msec_per_byte = (duration * 1000 / file_size) if file_size > 0 else 0
         msec_per_opcode = (duration * 1000 / instruction_count) if instruction_count > 0 else 0
         
-        print(f"Size: {file_size} bytes in {duration:.3f}s ({msec_per_byte:.1f} msec/byte)")
-        print(f"Opcodes: {instruction_count} opcodes in {duration:.3f}s ({msec_per_opcode:.1f} msec/opcode)")
-        print()
+        parts.append(f"Size: {file_size} bytes in {duration:.3f}s ({msec_per_byte:.1f} msec/byte)\n"
+                     f"Opcodes: {instruction_count} opcodes in {duration:.3f}s ({msec_per_opcode:.1f} msec/opcode)\n"
+                     "\n")
         
         # Print linker information if available
         if linker:
-            print(f"Memory range: 0x{linker.min_addr:08X} - 0x{linker.max_addr:08X}")
-            print(f"Instructions: {linker.instruction_count}")
+            parts.append(f"Memory range: 0x{linker.min_addr:08X} - 0x{linker.max_addr:08X}\n"
+                         f"Instructions: {linker.instruction_count}\n")
             if linker.map_file_path:
-                print(f"Map file generated: {linker.map_file_path}")
+                parts.append(f"Map file generated: {linker.map_file_path}\n")
             # Print output file information
             if output_file_path:
                 format_name = output_format.upper() if output_format != 'bin' else 'Binary'
-                print(f"Output ({format_name}) file generated: {output_file_path}")
+                parts.append(f"Output ({format_name}) file generated: {output_file_path}\n")
     else:
-        print(f"{RED}BUILD FAILED{RESET}")
-    
-    print()
-    print("STATISTICS:")
-    print(f"  Errors:        {stats[LogLevel.ERROR]}")
-    print(f"  Warnings:      {stats[LogLevel.WARNING]}")  
-    print(f"  Info:          {stats[LogLevel.INFO]}")
-    print(f"  Debug:         {stats[LogLevel.DEBUG]}")
-    print(f"  Aborts:        {stats[LogLevel.ABORT]}")
-    print(f"  Fatal:         {stats[LogLevel.FATAL]}")
-    print(f"  Total:         {total_messages}")
-    print()
+        parts.append(f"{RED}BUILD FAILED{RESET}\n")
+    
+    parts.append("\n"
+                 "STATISTICS:\n"
+                 f"  Errors:        {stats[LogLevel.ERROR]}\n"
+                 f"  Warnings:      {stats[LogLevel.WARNING]}\n"
+                 f"  Info:          {stats[LogLevel.INFO]}\n"
+                 f"  Debug:         {stats[LogLevel.DEBUG]}\n"
+                 f"  Aborts:        {stats[LogLevel.ABORT]}\n"
+                 f"  Fatal:         {stats[LogLevel.FATAL]}\n"
+                 f"  Total:         {total_messages}\n"
+                 "\n")
+    
+    sys.stdout.write(''.join(parts))
 
 # Output format mapping (NASM-compatible)
 OUTPUT_FORMATS = {
@@ -121,134 +160,442 @@ OUTPUT_FORMATS = {
     'txt': 'Plain text with addresses and opcodes'
 }
 
-def check_for_errors() -> bool:
-    """Check if there are any errors that should stop compilation"""
-    logger = get_logger()
-    error_count = (logger.stats[LogLevel.ERROR] + 
-                  logger.stats[LogLevel.ABORT] + 
-                  logger.stats[LogLevel.FATAL])
-    return error_count == 0
+# Output format -> file extension of the linker output
+_FORMAT_EXT = {'bin': '.bin', 'hex': '.hex', 'txt': '.txt'}
 
-def compile_assembly_file(source_file: Path, output_file: Optional[Path] = None, 
-                         base_address: int = 0x80000000, 
-                         output_format: str = 'bin',
-                         listing_file: Optional[Path] = None,
-                         preprocess_only: bool = False,
-                         output_dir: Optional[Path] = None,
-                         instruction_set_file: Optional[Path] = None,
-                         macro_files: Optional[List[str]] = None,
-                         force_32bit: bool = False,
-                         no_implicit: bool = False,
-                         no_macros: bool = False) -> Tuple[bool, Optional['Linker']]:
+# Output format -> file extension of the default final output (no -o given)
+_DEFAULT_OUTPUT_EXT = {'bin': '', 'hex': '.hex', 'txt': '.txt', 'obj': '.obj'}
+
+def _join(out: str, stem: str, suffix: str) -> str:
+    """Build an artifact path string without intermediate Path objects"""
+    return os.path.join(out, stem + suffix)
+
+def _count_lines(path) -> int:
     """
-    Compile a single assembly file through all three phases
+    Count the lines of a file in one pass over its bytes
     
-    Args:
-        source_file: Source assembly file
-        output_dir: Directory for intermediate and output files
-        base_address: Base address for linking
-        
-    Returns:
-        Tuple of (success status, linker instance or None)
+    The file is read into a single reusable 1 MB buffer and newlines are
+    counted in place, so no line strings or per-chunk bytes are created.
     """
-    log_info(f"=== COMPILATION STARTED ===")
-    log_info(f"Source file: {source_file}")
-    log_info(f"Output directory: {output_dir}")
-    log_info(f"Base address: 0x{base_address:08X}")
-    if instruction_set_file:
-        log_info(f"Instruction set: {instruction_set_file}")
-    else:
-        log_info(f"Instruction set: (from config)")
+    lines = 0
+    buf = bytearray(1 << 20)
+    last = 0x0A  # An empty file has no unterminated last line
+    with open(path, 'rb', buffering=0) as f:
+        while n := f.readinto(buf):
+            lines += buf.count(b'\n', 0, n)
+            last = buf[n - 1]
+    if last != 0x0A:
+        lines += 1  # Last line without a newline
+    return lines
+
+def _program_output(output_dir: Path, output_format: str) -> Path:
+    """Linker output of a multi-file build"""
+    return output_dir / ("program" + _FORMAT_EXT.get(output_format, '.bin'))
+
+def _install(src: Path, dst: Path) -> None:
+    """Move a build output to its final location (rename, hard link or copy)"""
+    try:
+        os.replace(src, dst)
+        return
+    except OSError:
+        pass
+    try:
+        os.link(src, dst)
+        return
+    except OSError:
+        pass
+    import shutil
+    shutil.copy2(src, dst)
+
+@dataclass
+class SourceJob:
+    """Source file and the build artifact paths derived from it"""
+    src: Path
+    stem: str
+    expanded: Path
+    obj: Path
+    bin: Path
+    listing: Path
     
-    # File paths for intermediate stages
-    expanded_file = output_dir / f"{source_file.stem}_expanded.asm"
-    object_file = output_dir / f"{source_file.stem}.obj"
+    @classmethod
+    def create(cls, source_file: Path, output_dir: Path, output_format: str = 'bin') -> 'SourceJob':
+        """Compute all artifact paths for a source file once"""
+        stem = source_file.stem
+        out = str(output_dir)
+        return cls(src=source_file,
+                   stem=stem,
+                   expanded=Path(_join(out, stem, '_expanded.asm')),
+                   obj=Path(_join(out, stem, '.obj')),
+                   bin=Path(_join(out, stem, _FORMAT_EXT.get(output_format, '.bin'))),
+                   listing=Path(_join(out, stem, '.lst')))
+
+def check_for_errors() -> bool:
+    """Check if there are any errors that should stop compilation"""
+    return get_logger().error_total == 0
+
+# ---------------------------------------------------------------------------
+# Three-phase build pipeline
+# ---------------------------------------------------------------------------
+# Single- and multi-file builds run the same phases; they only differ in the
+# log banner, the listing names and the name of the linked output.
+
+@dataclass
+class _Build:
+    """Settings and intermediate results threaded through the build phases"""
+    jobs: List[SourceJob]
+    binary_file: Path
+    listings: List[Optional[Path]]
+    base_address: int
+    output_format: str
+    instruction_set_file: Optional[Path]
+    macro_files: List[str]
+    force_32bit: bool
+    no_implicit: bool
+    no_macros: bool
+    use_cache: bool = True
+    max_jobs: Optional[int] = None
+    expanded_files: List[Path] = field(default_factory=list)
+    linker: Optional['Linker'] = None
+
+def _cache_fetch(cache_file: Path, target: Path) -> bool:
+    """Copy a cached artifact to its build location. Returns False on a miss."""
+    try:
+        target.write_bytes(cache_file.read_bytes())
+    except OSError:
+        return False
+    try:
+        # Mark the entry as recently used (atime updates are often disabled)
+        os.utime(cache_file)
+    except OSError:
+        pass
+    return True
+
+def _cache_store(artifact: Path, cache_file: Path) -> None:
+    """Copy a build artifact into the cache (best effort)"""
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_bytes(artifact.read_bytes())
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        log_debug(f"Could not write cache file {cache_file}: {e}")
+        try:
+            tmp_file.unlink()
+        except OSError:
+            pass
+
+def _prune_cache(cache_dir: Path, suffix: str) -> None:
+    """Evict least recently used cache entries beyond CACHE_MAX_ENTRIES / CACHE_MAX_BYTES"""
+    try:
+        entries = []
+        total_bytes = 0
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith(suffix):
+                    st = entry.stat()
+                    entries.append((st.st_atime_ns, st.st_size, entry.path))
+                    total_bytes += st.st_size
+    except OSError:
+        return
+    if len(entries) <= CACHE_MAX_ENTRIES and total_bytes <= CACHE_MAX_BYTES:
+        return
+    entries.sort()
+    count = len(entries)
+    for _, size, path in entries:
+        if count <= CACHE_MAX_ENTRIES and total_bytes <= CACHE_MAX_BYTES:
+            break
+        try:
+            os.unlink(path)
+        except OSError:
+            continue
+        count -= 1
+        total_bytes -= size
+
+def _macro_set_key(macro_files: List[str]) -> Optional[Tuple[Tuple[str, int, int], ...]]:
+    """Key of a macro file set in _macro_sets, or None if a file is missing"""
+    key = []
+    for macro_file in macro_files:
+        try:
+            st = os.stat(macro_file)
+        except OSError:
+            return None
+        key.append((os.path.abspath(macro_file), st.st_mtime_ns, st.st_size))
+    return tuple(key)
+
+def _remember_macro_set(key: Tuple[Tuple[str, int, int], ...], macros: Dict[str, 'Macro']) -> None:
+    """Keep the macros loaded from a macro file set, evicting the oldest set"""
+    if len(_macro_sets) >= MACRO_SET_CACHE_SIZE:
+        del _macro_sets[next(iter(_macro_sets))]
+    _macro_sets[key] = dict(macros)
+
+def _hash_file(digest, path) -> None:
+    """Feed a file's size and contents to a digest, straight from a read-only memory map"""
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        digest.update(f"{size}:".encode())
+        if size:  # Empty files cannot be mapped
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                digest.update(mapped)
+
+def _expansion_cache_file(source_file: Path, macro_files: List[str]) -> Optional[Path]:
+    """Cache file for the expansion of a source file, or None if an input is unreadable"""
+    try:
+        digest = hashlib.blake2b(digest_size=16)
+        for path in [source_file, *macro_files]:
+            _hash_file(digest, path)
+        macro_module = Path(__file__).with_name('macro.py')
+        digest.update(f"{EXPAND_CACHE_VERSION}:{TASM_VERSION}:"
+                      f"{macro_module.stat().st_mtime_ns}".encode())
+    except OSError:
+        return None
+    return EXPAND_CACHE_DIR / f"{digest.hexdigest()}.asm"
+
+def _run_macros(build: _Build) -> bool:
+    """Phase 1: load the macro files and expand every source file"""
+    # Single-file builds reuse the cached expansion of unchanged inputs. With
+    # several files the macros of one file carry over to the next, so every
+    # file is expanded.
+    cache_file = None
+    if build.use_cache and not build.no_macros and len(build.jobs) == 1:
+        job = build.jobs[0]
+        cache_file = _expansion_cache_file(job.src, build.macro_files)
+        if cache_file is not None and _cache_fetch(cache_file, job.expanded):
+            build.expanded_files = [job.expanded]
+            log_file_phase("Macro expansion", job.src, "cached", 0.0)
+            log_info("Macro expansion completed successfully")
+            return True
     
-    # Set binary file extension based on output format
-    if output_format == 'hex':
-        binary_file = output_dir / f"{source_file.stem}.hex"
-    elif output_format == 'txt':
-        binary_file = output_dir / f"{source_file.stem}.txt"
-    else:  # bin format
-        binary_file = output_dir / f"{source_file.stem}.bin"
+    from macro import MacroExpander
     
-    # Phase 1: Macro Expansion
-    log_info("=== PHASE 1: MACRO EXPANSION ===")
+    logger = get_logger()
+    warnings_before = logger.stats[LogLevel.WARNING]
     macro_expander = MacroExpander()
     
-    # Process macro files first (if any)
-    if macro_files:
-        log_info(f"Processing {len(macro_files)} macro file(s)")
-        for macro_file in macro_files:
+    # Macro files are shared across all source files
+    macro_key = _macro_set_key(build.macro_files) if build.macro_files else None
+    if macro_key in _macro_sets:
+        macro_expander.macros.update(_macro_sets[macro_key])
+        log_info(f"Reusing macro definitions from {len(build.macro_files)} macro file(s)")
+    else:
+        if build.macro_files:
+            log_info(f"Processing {len(build.macro_files)} macro file(s)")
+        for macro_file in build.macro_files:
             macro_file_path = Path(macro_file)
             if not macro_file_path.exists():
                 log_error(f"Macro file not found: {macro_file}", error_code="MACRO_FILE_NOT_FOUND")
-                return False, None
+                return False
             
             log_info(f"Loading macro file: {macro_file_path}")
             if not macro_expander.process_macro_file(macro_file_path):
                 log_abort(f"Failed to process macro file: {macro_file}", error_code="MACRO_FILE_FAILED")
                 log_error(f"Check macro definitions in {macro_file} for syntax errors")
-                return False, None
+                return False
+        # Sets that loaded with warnings are reloaded so the warnings repeat
+        if macro_key is not None and logger.stats[LogLevel.WARNING] == warnings_before:
+            _remember_macro_set(macro_key, macro_expander.macros)
     
-    # Process main source file with accumulated macros (if enabled)
-    if no_macros:
+    if build.no_macros:
         log_info("Macro expansion disabled (--no-macros)")
-        # Use source file directly without expansion
-        expanded_file = source_file
-    else:
-        if not macro_expander.process_file(source_file, expanded_file):
-            log_abort("Macro expansion failed", error_code="MACRO_EXPANSION_FAILED")
-            return False, None
+        # Assemble the source files directly without expansion
+        build.expanded_files = [job.src for job in build.jobs]
+        return True
+    
+    for job in build.jobs:
+        started = time.perf_counter()
         
-        if not check_for_errors():
-            log_error("Compilation halted due to errors in macro expansion phase", 
-                     error_code="COMPILATION_HALTED")
-            return False, None
+        if not macro_expander.process_file(job.src, job.expanded):
+            log_abort(f"Macro expansion failed for {job.src}", error_code="MACRO_EXPANSION_FAILED")
+            return False
         
-        log_info("Macro expansion completed successfully")
+        build.expanded_files.append(job.expanded)
+        log_file_phase("Macro expansion", job.src, "completed", time.perf_counter() - started)
     
-    # Phase 2: Assembly
-    log_info("=== PHASE 2: ASSEMBLY ===")
-    assembler = AssemblerEngine(instruction_set_file, force_32bit=force_32bit, no_implicit=no_implicit)
+    # Only cache clean expansions so a cached build never hides a warning
+    if cache_file is not None and logger.stats[LogLevel.WARNING] == warnings_before:
+        _cache_store(build.expanded_files[0], cache_file)
+        _prune_cache(EXPAND_CACHE_DIR, '.asm')
     
-    # Generate listing file name if requested
-    actual_listing_file = None
-    if listing_file:
-        if listing_file == True:  # Auto-generate name
-            actual_listing_file = output_dir / f"{source_file.stem}.lst"
-        else:
-            actual_listing_file = Path(listing_file)
+    log_info("Macro expansion completed successfully")
+    return True
+
+def _obj_cache_salt(build: _Build) -> Optional[bytes]:
+    """Digest of everything besides the source that affects an object file"""
+    try:
+        salt = hashlib.blake2b(digest_size=16)
+        _hash_file(salt, build.instruction_set_file)
+        # Any change to the assembler modules invalidates cached objects
+        for module in sorted(Path(__file__).parent.glob('*.py')):
+            salt.update(f"{module.name}:{module.stat().st_mtime_ns};".encode())
+    except (OSError, TypeError):
+        return None
+    config = json.dumps(get_config()._config, sort_keys=True)
+    salt.update(f"{OBJ_CACHE_VERSION}:{TASM_VERSION}:{build.force_32bit}:"
+                f"{build.no_implicit}:{config}".encode())
+    return salt.digest()
+
+def _obj_cache_file(expanded_file: Path, salt: bytes) -> Optional[Path]:
+    """Cache file for the object of an expanded source, or None if not cacheable"""
+    try:
+        source = expanded_file.read_bytes()
+    except OSError:
+        return None
+    # INCBIN sizes depend on files outside the source
+    if b'INCBIN' in source.upper():
+        return None
+    digest = hashlib.blake2b(source, digest_size=16, key=salt)
+    # The object file records the path of its source
+    digest.update(str(expanded_file).encode())
+    return OBJ_CACHE_DIR / f"{digest.hexdigest()}.obj"
+
+def _run_assembly(build: _Build) -> bool:
+    """Phase 2: assemble every expanded file into its object file"""
+    # (expanded_file, object_file, listing_file) per source file
+    tasks = [(expanded_file, job.obj, listing) for job, expanded_file, listing
+             in zip(build.jobs, build.expanded_files, build.listings)]
     
-    if not assembler.assemble_file(expanded_file, object_file, actual_listing_file):
-        log_fatal("Assembly failed - compilation terminated", error_code="ASSEMBLY_FATAL")
-        return False, None
+    # Reuse the cached objects of unchanged files. Listings are written by
+    # the assembler, so files with a listing are always assembled.
+    cache_files: Dict[int, Path] = {}
+    salt = _obj_cache_salt(build) if build.use_cache else None
+    if salt is not None:
+        pending = []
+        for expanded_file, object_file, listing in tasks:
+            cache_file = None if listing else _obj_cache_file(expanded_file, salt)
+            if cache_file is not None:
+                if _cache_fetch(cache_file, object_file):
+                    log_file_phase("Assembly", expanded_file, "cached", 0.0)
+                    continue
+                cache_files[len(pending)] = cache_file
+            pending.append((expanded_file, object_file, listing))
+        tasks = pending
     
-    if not check_for_errors():
-        log_error("Compilation halted due to errors in assembly phase", 
-                 error_code="COMPILATION_HALTED")
-        return False, None
+    logger = get_logger()
+    warnings_before = logger.stats[LogLevel.WARNING]
+    if tasks and not _assemble_tasks(build, tasks):
+        return False
+    
+    # Only cache clean objects so a cached build never hides a warning
+    if logger.stats[LogLevel.WARNING] == warnings_before and cache_files:
+        for index, cache_file in cache_files.items():
+            _cache_store(tasks[index][1], cache_file)
+        _prune_cache(OBJ_CACHE_DIR, '.obj')
     
     log_info("Assembly completed successfully")
+    return True
+
+def _assemble_tasks(build: _Build, tasks: List[Tuple[Path, Path, Optional[Path]]]) -> bool:
+    """Assemble (expanded_file, object_file, listing_file) tasks, in parallel if possible"""
+    from instruction_loader import set_instruction_set_cache
     
-    # Phase 3: Linking
-    log_info("=== PHASE 3: LINKING ===")
-    linker = Linker()
+    # --no-cache also bypasses the parsed instruction set cache (assembler and linker)
+    set_instruction_set_cache(build.use_cache)
     
-    if not linker.link_files([object_file], binary_file, base_address, output_format, force_32bit=force_32bit, no_implicit=no_implicit):
+    assembled = None
+    max_workers = min(len(tasks), build.max_jobs or os.cpu_count() or 1)
+    if max_workers > 1:
+        log_info(f"Assembling {len(tasks)} files with {max_workers} worker processes")
+        assembled = _assemble_parallel(tasks, max_workers, build.instruction_set_file,
+                                       build.force_32bit, build.no_implicit, build.use_cache)
+    
+    if assembled is None:
+        from assembler import AssemblerEngine
+        
+        # Load the instruction set once; per-file state is reset before each file
+        assembler = AssemblerEngine(build.instruction_set_file, force_32bit=build.force_32bit,
+                                    no_implicit=build.no_implicit)
+        
+        for expanded_file, object_file, listing in tasks:
+            started = time.perf_counter()
+            assembler.reset_state()
+            
+            if not assembler.assemble_file(expanded_file, object_file, listing):
+                log_abort(f"Assembly failed for {expanded_file}", error_code="ASSEMBLY_FAILED")
+                return False
+            
+            log_file_phase("Assembly", expanded_file, "completed", time.perf_counter() - started)
+        assembled = True
+    
+    return assembled
+
+def _run_link(build: _Build) -> bool:
+    """Phase 3: link the object files into the final output"""
+    object_files = [job.obj for job in build.jobs]
+    log_info(f"Starting linking process with {len(object_files)} object files")
+    
+    from linker import Linker
+    build.linker = Linker()
+    if not build.linker.link_files(object_files, build.binary_file, build.base_address,
+                                   build.output_format, force_32bit=build.force_32bit,
+                                   no_implicit=build.no_implicit):
         log_abort("Linking failed", error_code="LINKING_FAILED")
-        return False, None
+        return False
+    
+    log_info("Linking completed successfully")
+    return True
+
+_PHASES = (
+    ("MACRO EXPANSION", _run_macros),
+    ("ASSEMBLY", _run_assembly),
+    ("LINKING", _run_link),
+)
+
+def _drive(build: _Build) -> bool:
+    """Run the build phases in order, stopping at the first failing phase"""
+    for number, (name, run) in enumerate(_PHASES, 1):
+        log_info(f"=== PHASE {number}: {name} ===")
+        if not run(build):
+            return False
+        if not check_for_errors():
+            log_error(f"Compilation halted due to errors in {name.lower()} phase",
+                     error_code="COMPILATION_HALTED")
+            return False
+    return True
+
+def compile_assembly_file(job: SourceJob, output_file: Optional[Path] = None, 
+                         base_address: int = 0x80000000, 
+                         output_format: str = 'bin',
+                         listing_file: Optional[Path] = None,
+                         preprocess_only: bool = False,
+                         output_dir: Optional[Path] = None,
+                         instruction_set_file: Optional[Path] = None,
+                         macro_files: Optional[List[str]] = None,
+                         force_32bit: bool = False,
+                         no_implicit: bool = False,
+                         no_macros: bool = False,
+                         use_cache: bool = True) -> Tuple[bool, Optional['Linker']]:
+    """
+    Compile a single assembly file through all three phases
     
-    if not check_for_errors():
-        log_fatal("Compilation halted due to errors in linking phase", 
-                 error_code="COMPILATION_HALTED")
+    Args:
+        job: Source file and its artifact paths
+        output_dir: Directory for intermediate and output files
+        base_address: Base address for linking
+        
+    Returns:
+        Tuple of (success status, linker instance or None)
+    """
+    log_info(f"=== COMPILATION STARTED ===")
+    log_info(f"Source file: {job.src}")
+    log_info(f"Output directory: {output_dir}")
+    log_info(f"Base address: 0x{base_address:08X}")
+    if instruction_set_file:
+        log_info(f"Instruction set: {instruction_set_file}")
+    else:
+        log_info(f"Instruction set: (from config)")
+    
+    # An explicit listing name (-l file.lst) applies to the single source file
+    listing = job.listing if listing_file == True else (Path(listing_file) if listing_file else None)
+    build = _Build(jobs=[job], binary_file=job.bin, listings=[listing],
+                   base_address=base_address, output_format=output_format,
+                   instruction_set_file=instruction_set_file, macro_files=macro_files or [],
+                   force_32bit=force_32bit, no_implicit=no_implicit, no_macros=no_macros,
+                   use_cache=use_cache)
+    if not _drive(build):
         return False, None
     
-    log_info("Linking completed successfully")
     log_info(f"=== COMPILATION COMPLETED SUCCESSFULLY ===")
-    log_info(f"Final binary: {binary_file}")
-    
-    return True, linker
+    log_info(f"Final binary: {job.bin}")
+    return True, build.linker
 
 def show_help():
     """Show NASM-compatible help message"""
@@ -292,6 +639,9 @@ usage: TASM [-@ response_file] [-f format] [-o outfile] [-l listfile]
  -E              preprocess only (writes output to stdout)
  -a              suppress preprocessor
  --no-macros     disable macro expansion (use source as-is)
+ --no-cache      ignore cached macro expansions, object files and instruction sets
+ -j n            assemble multiple files with at most n worker processes
+ --jobs n        (default: number of CPUs)
 
  -M              generate Makefile dependencies on stdout
  -MG             d:o, missing files assumed generated
@@ -329,7 +679,111 @@ usage: TASM [-@ response_file] [-f format] [-o outfile] [-l listfile]
     
     print(help_text)
 
-def compile_multiple_files(source_files: List[Path], output_file: Optional[Path] = None,
+# ---------------------------------------------------------------------------
+# Parallel assembly (Phase 2) for multi-file builds
+# ---------------------------------------------------------------------------
+# Macro expansion stays sequential: macros defined in one source file are
+# visible to the following files. Assembly of the expanded files is
+# independent per file, so it is fanned out to worker processes. Each worker
+# loads the instruction set once and returns its log entries, which the
+# parent merges into the build log in source order.
+
+_worker_settings: Optional[Dict[str, Any]] = None
+_worker_assembler: Optional['AssemblerEngine'] = None
+
+def _assembly_worker_init(settings: Dict[str, Any]):
+    """Initialize a worker process (config, quiet logger, engine settings)"""
+    global _worker_settings
+    _worker_settings = settings
+    if settings['config_path']:
+        from config_loader import set_config_path
+        set_config_path(str(settings['config_path']))
+    if not settings['use_cache']:
+        from instruction_loader import set_instruction_set_cache
+        set_instruction_set_cache(False)
+    initialize_logger(None, console_output=False, verbosity_level=settings['verbosity'])
+
+def _assembly_worker(expanded_file: Path, object_file: Path,
+                     listing_file: Optional[Path]) -> Tuple[bool, List[LogEntry], float]:
+    """Assemble one expanded file in a worker process"""
+    global _worker_assembler
+    logger = get_logger()
+    logger.entries = []
+    started = time.perf_counter()
+    try:
+        if _worker_assembler is None:
+            from assembler import AssemblerEngine
+            _worker_assembler = AssemblerEngine(_worker_settings['instruction_set_file'],
+                                                force_32bit=_worker_settings['force_32bit'],
+                                                no_implicit=_worker_settings['no_implicit'])
+        _worker_assembler.reset_state()
+        success = _worker_assembler.assemble_file(expanded_file, object_file, listing_file)
+    except Exception as e:
+        log_error(f"Unexpected error during assembly: {str(e)}",
+                 str(expanded_file), error_code="ASSEMBLY_ERROR")
+        success = False
+    return success, logger.entries, time.perf_counter() - started
+
+def _assemble_parallel(tasks: List[Tuple[Path, Path, Optional[Path]]], max_workers: int,
+                       instruction_set_file: Optional[Path], force_32bit: bool,
+                       no_implicit: bool, use_cache: bool = True) -> Optional[bool]:
+    """
+    Assemble (expanded_file, object_file, listing_file) tasks in worker processes
+    
+    Returns:
+        True if all files assembled, False on the first assembly failure,
+        None if worker processes are not available
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    from concurrent.futures.process import BrokenProcessPool
+    import multiprocessing
+    
+    # Forked workers inherit the already imported modules instead of
+    # re-importing them; other platforms keep their default start method
+    mp_context = multiprocessing.get_context('fork') if sys.platform.startswith('linux') else None
+    
+    settings = {
+        'instruction_set_file': instruction_set_file,
+        'force_32bit': force_32bit,
+        'no_implicit': no_implicit,
+        'use_cache': use_cache,
+        'config_path': get_config()._custom_config_path,
+        'verbosity': get_logger().verbosity_level,
+    }
+    
+    results: Dict[int, Tuple[bool, List[LogEntry], float]] = {}
+    # Forked workers must not inherit unwritten build log output
+    get_logger().flush()
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context,
+                                 initializer=_assembly_worker_init,
+                                 initargs=(settings,)) as executor:
+            futures = {executor.submit(_assembly_worker, *task): index
+                       for index, task in enumerate(tasks)}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+                if not results[futures[future]][0]:
+                    # Stop scheduling the remaining files
+                    for pending in futures:
+                        pending.cancel()
+                    break
+    except (OSError, NotImplementedError, BrokenProcessPool) as e:
+        log_warning(f"Parallel assembly unavailable ({e}), assembling sequentially")
+        return None
+    
+    # Merge worker logs in source order so build.log is deterministic
+    logger = get_logger()
+    for index in sorted(results):
+        success, entries, duration = results[index]
+        logger.merge_entries(entries)
+        expanded_file = tasks[index][0]
+        if not success:
+            log_abort(f"Assembly failed for {expanded_file}", error_code="ASSEMBLY_FAILED")
+            return False
+        log_file_phase("Assembly", expanded_file, "completed", duration)
+    return True
+
+def compile_multiple_files(jobs: List[SourceJob], output_file: Optional[Path] = None,
                           base_address: int = 0x80000000, 
                           output_format: str = 'bin',
                           listing_file: Optional[Path] = None,
@@ -338,12 +792,15 @@ def compile_multiple_files(source_files: List[Path], output_file: Optional[Path]
                           instruction_set_file: Optional[Path] = None,
                           macro_files: Optional[List[str]] = None,
                           force_32bit: bool = False,
-                          no_implicit: bool = False) -> Tuple[bool, Optional['Linker']]:
+                          no_implicit: bool = False,
+                          no_macros: bool = False,
+                          use_cache: bool = True,
+                          max_jobs: Optional[int] = None) -> Tuple[bool, Optional['Linker']]:
     """
     Compile multiple assembly files and link them together
     
     Args:
-        source_files: List of source assembly files
+        jobs: Source files and their artifact paths
         output_dir: Directory for intermediate and output files
         base_address: Base address for linking
         
@@ -351,93 +808,230 @@ def compile_multiple_files(source_files: List[Path], output_file: Optional[Path]
         Tuple of (success: bool, linker: Optional[Linker])
     """
     log_info(f"=== MULTI-FILE COMPILATION STARTED ===")
-    log_info(f"Source files: {[str(f) for f in source_files]}")
+    log_info(f"Source files: {[str(job.src) for job in jobs]}")
     log_info(f"Output directory: {output_dir}")
     log_info(f"Base address: 0x{base_address:08X}")
     if instruction_set_file:
         log_info(f"Instruction set: {instruction_set_file}")
     
-    # Phase 1: Macro expansion for all files
-    log_info("=== PHASE 1: MACRO EXPANSION ===")
-    expanded_files = []
-    
-    if macro_files:
-        log_info(f"Processing {len(macro_files)} macro file(s)")
-    
-    macro_expander = MacroExpander()
+    # Generate listing file for each source file if requested (one .LST per .ASM)
+    build = _Build(jobs=jobs,
+                   binary_file=_program_output(output_dir, output_format),
+                   listings=[job.listing if listing_file else None for job in jobs],
+                   base_address=base_address, output_format=output_format,
+                   instruction_set_file=instruction_set_file, macro_files=macro_files or [],
+                   force_32bit=force_32bit, no_implicit=no_implicit, no_macros=no_macros,
+                   use_cache=use_cache, max_jobs=max_jobs)
+    if not _drive(build):
+        return False, None
     
-    # Load macro files first (shared across all source files)
-    if macro_files:
-        for macro_file in macro_files:
-            macro_file_path = Path(macro_file)
-            log_info(f"Loading macro file: {macro_file_path}")
-            if not macro_expander.process_macro_file(macro_file_path):
-                log_abort(f"Failed to process macro file: {macro_file}", error_code="MACRO_FILE_FAILED")
-                return False, None
+    log_info(f"=== MULTI-FILE COMPILATION COMPLETED SUCCESSFULLY ===")
+    return True, build.linker
+
+# ---------------------------------------------------------------------------
+# Command-line option dispatch
+# ---------------------------------------------------------------------------
+# Each option handler receives the option dictionary and the option value
+# (None for flags). A handler returns an error message or None on success.
+
+# Option arity
+_FLAG = 0          # Option takes no argument
+_ARG = 1           # Option requires the next argument
+_OPTIONAL_ARG = 2  # Option may consume the next argument (-l)
+
+
+def _default_options() -> Dict[str, Any]:
+    """Return the default values of all command-line options"""
+    return {
+        'input_files': [],
+        'output_file': None,
+        'output_format': 'bin',
+        'listing_file': None,
+        'preprocess_only': False,
+        'verbose': "standard",  # "standard", "info", "verbose", or "debug"
+        'user_specified_output': False,
+        'instruction_set_file': None,  # None uses instruction set from config
+        'macro_files': [],  # List of macro files to include
+        'force_32bit': False,  # -O32 (force 32-bit variants)
+        'no_implicit': False,  # -Ono-implicit (disable implicit A[10]/A[15] operands)
+        'no_macros': False,  # --no-macros (disable macro expansion)
+        'use_cache': True,  # --no-cache (bypass the expansion, object and instruction set caches)
+        'max_jobs': None,  # -j/--jobs N (assembly worker processes, None = CPU count)
+        'output_dir_override': None,  # Override for output directory path
+    }
+
+
+def _opt_output(opts: Dict[str, Any], value: str) -> Optional[str]:
+    opts['output_file'] = value
+    opts['user_specified_output'] = True
+    return None
+
+
+def _opt_format(opts: Dict[str, Any], value: str) -> Optional[str]:
+    if not value:  # Handle case where -f has no format attached
+        return "-f requires an argument"
+    if value not in OUTPUT_FORMATS:
+        return f"unknown output format '{value}'"
+    opts['output_format'] = value
+    return None
+
+
+def _opt_listing(opts: Dict[str, Any], value) -> Optional[str]:
+    # True means auto-generate listing file name from the input file
+    opts['listing_file'] = value
+    return None
+
+
+def _opt_instruction_set(opts: Dict[str, Any], value: str) -> Optional[str]:
+    opts['instruction_set_file'] = value
+    return None
+
+
+def _opt_macro_file(opts: Dict[str, Any], value: str) -> Optional[str]:
+    opts['macro_files'].append(value)
+    return None
+
+
+def _opt_config(opts: Dict[str, Any], value: str) -> Optional[str]:
+    # Set custom config path before any config access
+    from config_loader import set_config_path
+    set_config_path(value)
+    return None
+
+
+def _opt_output_dir(opts: Dict[str, Any], value: str) -> Optional[str]:
+    opts['output_dir_override'] = value
+    return None
+
+
+def _opt_jobs(opts: Dict[str, Any], value: str) -> Optional[str]:
+    if not value.isdigit() or int(value) < 1:
+        return f"invalid number of jobs '{value}'"
+    opts['max_jobs'] = int(value)
+    return None
+
+
+def _opt_setter(key: str, value: Any):
+    """Build a handler for a flag that sets a single option"""
+    def handler(opts: Dict[str, Any], _value) -> Optional[str]:
+        opts[key] = value
+        return None
+    return handler
+
+
+# Exact option name -> (arity, handler)
+_OPT_HANDLERS = {
+    '-o': (_ARG, _opt_output),
+    '-f': (_ARG, _opt_format),
+    '-l': (_OPTIONAL_ARG, _opt_listing),
+    '-E': (_FLAG, _opt_setter('preprocess_only', True)),
+    '--verbose': (_FLAG, _opt_setter('verbose', "verbose")),
+    '--info': (_FLAG, _opt_setter('verbose', "info")),
+    '--debug': (_FLAG, _opt_setter('verbose', "debug")),
+    '--no-macros': (_FLAG, _opt_setter('no_macros', True)),
+    '--no-cache': (_FLAG, _opt_setter('use_cache', False)),
+    '--instruction-set': (_ARG, _opt_instruction_set),
+    '-s': (_ARG, _opt_instruction_set),
+    '-m': (_ARG, _opt_macro_file),
+    '--macro-file': (_ARG, _opt_macro_file),
+    '--macros': (_ARG, _opt_macro_file),
+    '-c': (_ARG, _opt_config),
+    '--config': (_ARG, _opt_config),
+    '-O32': (_FLAG, _opt_setter('force_32bit', True)),
+    '-Ono-implicit': (_FLAG, _opt_setter('no_implicit', True)),
+    '-D': (_ARG, _opt_output_dir),
+    '--output-dir': (_ARG, _opt_output_dir),
+    '-j': (_ARG, _opt_jobs),
+    '--jobs': (_ARG, _opt_jobs),
+}
+
+# Options with an attached value (-ofile.bin, -fbin, --config=file.json, ...)
+# keyed on the prefix matched by _OPT_RE
+_PREFIX_HANDLERS = {
+    '-o': _opt_output,
+    '-f': _opt_format,
+    '-l': _opt_listing,
+    '-s': _opt_instruction_set,
+    '-m': _opt_macro_file,
+    '-c': _opt_config,
+    '-D': _opt_output_dir,
+    '--instruction-set=': _opt_instruction_set,
+    '--macro-file=': _opt_macro_file,
+    '--macros=': _opt_macro_file,
+    '--config=': _opt_config,
+    '-j': _opt_jobs,
+    '--output-dir=': _opt_output_dir,
+    '--jobs=': _opt_jobs,
+}
+_OPT_RE = re.compile(r'(--(?:instruction-set|macro-file|macros|config|output-dir|jobs)=|-[oflsmcDj])(.*)', re.DOTALL)
+
+# NASM options accepted for compatibility but ignored
+_IGNORED_FLAG_OPTIONS = frozenset(['-g', '-a', '-t', '-M', '-MG', '-W'])
+_IGNORED_ARG_OPTIONS = frozenset(['-F', '-I', '-i', '-p', '-P', '-d', '-u', '-U',
+                                  '-MF', '-MD', '-MT', '-MQ', '-w', '-O', '-Z'])
+
+
+def parse_arguments(argv: List[str]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Parse NASM-style command line arguments.
     
-    # Expand each source file
-    for source_file in source_files:
-        log_info(f"Starting macro expansion for {source_file.name}")
-        expanded_file = output_dir / f"{source_file.stem}_expanded.asm"
+    Args:
+        argv: Argument list without the program name
         
-        if not macro_expander.process_file(source_file, expanded_file):
-            log_abort(f"Macro expansion failed for {source_file}", error_code="MACRO_EXPANSION_FAILED")
-            return False, None
-            
-        expanded_files.append(expanded_file)
-        log_info(f"Macro expansion completed for {source_file.name}")
-    
-    log_info("Macro expansion completed for all files")
-    
-    # Phase 2: Assembly for all files
-    log_info("=== PHASE 2: ASSEMBLY ===")
-    object_files = []
+    Returns:
+        Tuple of (options dictionary, error message). Options are None on error.
+    """
+    opts = _default_options()
+    argc = len(argv)
     
-    for i, expanded_file in enumerate(expanded_files):
-        source_file = source_files[i]
-        log_info(f"Starting assembly of {expanded_file.name}")
-        object_file = output_dir / f"{source_file.stem}.obj"
+    i = 0
+    while i < argc:
+        arg = argv[i]
+        i += 1
         
-        # Create a fresh assembler instance for each file to avoid state conflicts
-        assembler = AssemblerEngine(instruction_set_file, force_32bit=force_32bit, no_implicit=no_implicit)
+        if not arg.startswith('-'):
+            # Input file
+            opts['input_files'].append(arg)
+            continue
         
-        # Generate listing file for this source file if requested (one .LST per .ASM)
-        source_listing_file = None
-        if listing_file:
-            source_listing_file = output_dir / f"{source_file.stem}.lst"
+        # Option names are compared against the literal table keys, which
+        # are interned; interning the argument lets lookups match by identity
+        arg = sys.intern(arg)
+        entry = _OPT_HANDLERS.get(arg)
+        if entry is not None:
+            arity, handler = entry
+            value = None
+            if arity == _ARG:
+                if i >= argc:
+                    return None, f"{arg} requires an argument"
+                value = argv[i]
+                i += 1
+            elif arity == _OPTIONAL_ARG:
+                # Next argument is the value unless it is an .asm file or an option
+                if i < argc and not argv[i].startswith('-') and not argv[i].endswith('.asm'):
+                    value = argv[i]
+                    i += 1
+                else:
+                    value = True
+            error = handler(opts, value)
+        elif (match := _OPT_RE.match(arg)) is not None:
+            error = _PREFIX_HANDLERS[match.group(1)](opts, match.group(2))
+        elif arg in _IGNORED_FLAG_OPTIONS:
+            continue
+        elif arg in _IGNORED_ARG_OPTIONS:
+            # Skip the option argument if present
+            if i < argc and not argv[i].startswith('-'):
+                i += 1
+            continue
+        else:
+            print(f"TASM: warning: unknown option '{arg}'", file=sys.stderr)
+            continue
         
-        if not assembler.assemble_file(expanded_file, object_file, source_listing_file):
-            log_abort(f"Assembly failed for {expanded_file}", error_code="ASSEMBLY_FAILED")
-            return False, None
-            
-        object_files.append(object_file)
-        log_info(f"Assembly completed for {expanded_file.name}")
-    
-    log_info("Assembly completed for all files")
-    
-    # Phase 3: Linking
-    log_info("=== PHASE 3: LINKING ===")
-    linker = Linker()
-    
-    # Set program file extension based on output format
-    if output_format == 'hex':
-        program_bin = output_dir / "program.hex"
-    elif output_format == 'txt':
-        program_bin = output_dir / "program.txt"
-    else:  # bin format
-        program_bin = output_dir / "program.bin"
-    
-    log_info(f"Starting linking process with {len(object_files)} object files")
-    log_info(f"Base address: 0x{base_address:08X}")
-    
-    if not linker.link_files(object_files, program_bin, base_address, output_format, force_32bit=force_32bit, no_implicit=no_implicit):
-        log_abort("Linking failed", error_code="LINKING_FAILED")
-        return False, None
-    
-    log_info("Linking completed successfully")
-    log_info(f"=== MULTI-FILE COMPILATION COMPLETED SUCCESSFULLY ===")
+        if error:
+            return None, error
     
-    return True, linker
+    return opts, None
+
 
 def main():
     """Main entry point with NASM-compatible command line"""
@@ -456,206 +1050,27 @@ def main():
             return 0
     
     # Parse NASM-style arguments manually for maximum compatibility
-    input_files = []
-    output_file = None
-    output_format = 'bin'
-    listing_file = None
-    preprocess_only = False
-    verbose = "standard"  # "standard", "info", "verbose", or "debug"
+    opts, error = parse_arguments(sys.argv[1:])
+    if error:
+        print(f"TASM: error: {error}", file=sys.stderr)
+        return 1
+    
+    input_files = opts['input_files']
+    output_file = opts['output_file']
+    output_format = opts['output_format']
+    listing_file = opts['listing_file']
+    preprocess_only = opts['preprocess_only']
+    verbose = opts['verbose']
     base_address = 0x80000000  # TriCore default base address
-    user_specified_output = False
-    instruction_set_file = None  # Default to None, will use instruction set from config
-    macro_files = []  # List of macro files to include
-    force_32bit = False  # Flag for -O32 optimization (force 32-bit variants)
-    no_implicit = False  # Flag for -Ono-implicit optimization (disable implicit A[10]/A[15] operands)
-    no_macros = False  # Flag for --no-macros (disable macro expansion)
-    output_dir_override = None  # Override for output directory path
-    
-    # Debug: print arguments
-    # print(f"DEBUG: sys.argv = {sys.argv}", file=sys.stderr)
-    
-    i = 1
-    while i < len(sys.argv):
-        arg = sys.argv[i]
-        
-        if arg.startswith('-'):
-            if arg == '-o':
-                if i + 1 >= len(sys.argv):
-                    print("TASM: error: -o requires an argument", file=sys.stderr)
-                    return 1
-                output_file = sys.argv[i + 1]
-                user_specified_output = True
-                i += 2
-            elif arg.startswith('-o'):
-                output_file = arg[2:]  # -ofile.bin
-                user_specified_output = True
-                i += 1
-            elif arg == '-f':
-                if i + 1 >= len(sys.argv):
-                    print("TASM: error: -f requires an argument", file=sys.stderr)
-                    return 1
-                output_format = sys.argv[i + 1]
-                if output_format not in OUTPUT_FORMATS:
-                    print(f"TASM: error: unknown output format '{output_format}'", file=sys.stderr)
-                    return 1
-                i += 2
-            elif arg.startswith('-f'):
-                output_format = arg[2:]  # -fbin
-                if not output_format:  # Handle case where -f has no format attached
-                    print("TASM: error: -f requires an argument", file=sys.stderr)
-                    return 1
-                if output_format not in OUTPUT_FORMATS:
-                    print(f"TASM: error: unknown output format '{output_format}'", file=sys.stderr)
-                    return 1
-                i += 1
-            elif arg == '-l':
-                # Check if next argument is a listing filename (not an .asm file or option)
-                if (i + 1 < len(sys.argv) and 
-                    not sys.argv[i + 1].startswith('-') and 
-                    not sys.argv[i + 1].endswith('.asm')):
-                    listing_file = sys.argv[i + 1]
-                    i += 2
-                else:
-                    # Auto-generate listing file name (will be set later based on input file)
-                    listing_file = True
-                    i += 1
-            elif arg.startswith('-l'):
-                listing_file = arg[2:]  # -lfile.lst
-                i += 1
-            elif arg == '-E':
-                preprocess_only = True
-                i += 1
-            elif arg == '--verbose':
-                verbose = "verbose"
-                i += 1
-            elif arg == '--info':
-                verbose = "info"
-                i += 1
-            elif arg == '--debug':
-                verbose = "debug"
-                i += 1
-            elif arg == '--no-macros':
-                no_macros = True
-                i += 1
-            elif arg == '--instruction-set':
-                if i + 1 >= len(sys.argv):
-                    print("TASM: error: --instruction-set requires an argument", file=sys.stderr)
-                    return 1
-                instruction_set_file = sys.argv[i + 1]
-                i += 2
-            elif arg.startswith('--instruction-set='):
-                instruction_set_file = arg[18:]  # --instruction-set=file.csv
-                i += 1
-            elif arg == '-s':
-                # Short option for instruction set specification
-                if i + 1 >= len(sys.argv):
-                    print("TASM: error: -s requires an argument", file=sys.stderr)
-                    return 1
-                instruction_set_file = sys.argv[i + 1]
-                i += 2
-            elif arg.startswith('-s') and len(arg) > 2:
-                instruction_set_file = arg[2:]  # -sfile.csv
-                i += 1
-            elif arg == '-m':
-                # Short option for macro file
-                if i + 1 >= len(sys.argv):
-                    print("TASM: error: -m requires an argument", file=sys.stderr)
-                    return 1
-                macro_files.append(sys.argv[i + 1])
-                i += 2
-            elif arg.startswith('-m') and len(arg) > 2:
-                macro_files.append(arg[2:])  # -mfile.asm
-                i += 1
-            elif arg == '--macro-file':
-                if i + 1 >= len(sys.argv):
-                    print("TASM: error: --macro-file requires an argument", file=sys.stderr)
-                    return 1
-                macro_files.append(sys.argv[i + 1])
-                i += 2
-            elif arg.startswith('--macro-file='):
-                macro_files.append(arg[13:])  # --macro-file=file.asm
-                i += 1
-            elif arg == '--macros':
-                if i + 1 >= len(sys.argv):
-                    print("TASM: error: --macros requires an argument", file=sys.stderr)
-                    return 1
-                macro_files.append(sys.argv[i + 1])
-                i += 2
-            elif arg.startswith('--macros='):
-                macro_files.append(arg[9:])  # --macros=file.asm
-                i += 1
-            elif arg == '-c':
-                # Short option for config file
-                if i + 1 >= len(sys.argv):
-                    print("TASM: error: -c requires an argument", file=sys.stderr)
-                    return 1
-                config_file = sys.argv[i + 1]
-                # Set custom config path before any config access
-                from config_loader import set_config_path
-                set_config_path(config_file)
-                i += 2
-            elif arg.startswith('-c') and len(arg) > 2:
-                config_file = arg[2:]  # -cconfig.json
-                from config_loader import set_config_path
-                set_config_path(config_file)
-                i += 1
-            elif arg == '--config':
-                if i + 1 >= len(sys.argv):
-                    print("TASM: error: --config requires an argument", file=sys.stderr)
-                    return 1
-                config_file = sys.argv[i + 1]
-                from config_loader import set_config_path
-                set_config_path(config_file)
-                i += 2
-            elif arg.startswith('--config='):
-                config_file = arg[9:]  # --config=config.json
-                from config_loader import set_config_path
-                set_config_path(config_file)
-                i += 1
-            elif arg == '-O32':
-                # Force 32-bit instruction variants (no 16-bit optimization)
-                force_32bit = True
-                i += 1
-            elif arg == '-Ono-implicit':
-                # Disable implicit operand variants (no A[10]/A[15] shortcuts)
-                no_implicit = True
-                i += 1
-            elif arg == '-D':
-                if i + 1 >= len(sys.argv):
-                    print("TASM: error: -D requires an argument", file=sys.stderr)
-                    return 1
-                output_dir_override = sys.argv[i + 1]
-                i += 2
-            elif arg.startswith('-D') and len(arg) > 2:
-                output_dir_override = arg[2:]  # -Doutput/custom
-                i += 1
-            elif arg == '--output-dir':
-                if i + 1 >= len(sys.argv):
-                    print("TASM: error: --output-dir requires an argument", file=sys.stderr)
-                    return 1
-                output_dir_override = sys.argv[i + 1]
-                i += 2
-            elif arg.startswith('--output-dir='):
-                output_dir_override = arg[13:]  # --output-dir=output/custom
-                i += 1
-            else:
-                # Skip other options for now
-                if arg in ['-g', '-a', '-t', '-M', '-MG', '-W', '--verbose']:
-                    i += 1
-                elif arg in ['-F', '-I', '-i', '-p', '-P', '-d', '-D', '-u', '-U',
-                           '-MF', '-MD', '-MT', '-MQ', '-w', '-O', '-s', '-Z']:
-                    # Options that take arguments
-                    if i + 1 < len(sys.argv) and not sys.argv[i + 1].startswith('-'):
-                        i += 2
-                    else:
-                        i += 1
-                else:
-                    print(f"TASM: warning: unknown option '{arg}'", file=sys.stderr)
-                    i += 1
-        else:
-            # Input file
-            input_files.append(arg)
-            i += 1
+    user_specified_output = opts['user_specified_output']
+    instruction_set_file = opts['instruction_set_file']
+    macro_files = opts['macro_files']
+    force_32bit = opts['force_32bit']
+    no_implicit = opts['no_implicit']
+    no_macros = opts['no_macros']
+    use_cache = opts['use_cache']
+    max_jobs = opts['max_jobs']
+    output_dir_override = opts['output_dir_override']
     
     # Validate input
     if not input_files:
@@ -677,31 +1092,24 @@ def main():
     build_output_dir = create_output_dir(override_path=output_dir_override)
     build_output_dir.mkdir(parents=True, exist_ok=True)
     
-    # Handle final output file location
+    # Compute per-file artifact paths once
+    jobs = [SourceJob.create(source_file, build_output_dir, output_format) for source_file in source_files]
+    
+    # Handle final output file location; final_output_path is the -o target
+    # the build output is moved to, None when it stays in the build directory
+    final_output_path = None
     if output_file:
-        output_path = Path(output_file)
-        if output_path.is_absolute():
-            final_output_dir = output_path.parent
+        final_output_path = Path(output_file)
+        if final_output_path.is_absolute():
+            final_output_dir = final_output_path.parent
         else:
             # Relative path - use current directory as base
-            final_output_dir = Path.cwd() / output_path.parent
+            final_output_dir = Path.cwd() / final_output_path.parent
         final_output_dir.mkdir(parents=True, exist_ok=True)
-        final_output_file = output_path
     else:
         # Auto-generate output filename based on format in build directory
         # Use first source file name as base for multiple files
-        primary_source = source_files[0]
-        if output_format == 'bin':
-            final_output_file = build_output_dir / primary_source.stem
-        elif output_format == 'hex':
-            final_output_file = build_output_dir / f"{primary_source.stem}.hex"
-        elif output_format == 'txt':
-            final_output_file = build_output_dir / f"{primary_source.stem}.txt"
-        elif output_format in ['obj']:
-            final_output_file = build_output_dir / f"{primary_source.stem}.obj"
-        else:
-            final_output_file = build_output_dir / f"{primary_source.stem}.out"
-        output_file = str(final_output_file)
+        output_file = _join(str(build_output_dir), jobs[0].stem, _DEFAULT_OUTPUT_EXT.get(output_format, '.out'))
     
     # Use build_output_dir for all intermediate files
     output_dir = build_output_dir
@@ -718,17 +1126,15 @@ def main():
         print_header()
         
         # Count lines of code
-        source_lines = 0
         try:
-            with open(source_files[0], 'r', encoding='utf-8') as f:
-                source_lines = len(f.readlines())
-        except:
+            source_lines = _count_lines(source_files[0])
+        except OSError:
             source_lines = 0
             
         print_phase("Pre-processing the source code file", f"{source_lines} lines of code loaded")
     
     # Log detailed info to files only (unless --info or higher verbosity)
-    if verbose in ["info", "verbose", "debug"]:
+    if verbose in INFO_VERBOSITY_LEVELS:
         log_debug(f"Logging verbosity: {verbose}")
         log_info(f"TASM {TASM_VERSION} - Three-Phase Assembler")
         log_info(f"Input file: {source_file}")
@@ -747,46 +1153,77 @@ def main():
     linker = None  # Will hold linker instance for statistics
     
     try:
-        # Add start time to logger for duration calculation
-        logger.start_time = datetime.now()
+        if not preprocess_only:
+            # Resolve the phase modules (the assembler pulls in the instruction
+            # set loader and pandas) before the build timer starts, so reported
+            # durations measure the build alone. Every full build needs them:
+            # linking re-encodes instructions through the instruction loader
+            for module in ('macro', 'assembler', 'linker'):
+                importlib.import_module(module)
+        
+        # Time the build from here; the wall-clock start_time stays for display
+        logger.start_perf_ns = time.perf_counter_ns()
         
         if preprocess_only:
             # Only do macro expansion phase
             log_info("=== PREPROCESS ONLY MODE ===")
-            macro_expander = MacroExpander()
-            
-            # Process macro files first (if any)
-            if macro_files:
-                log_info(f"Processing {len(macro_files)} macro file(s)")
-                for macro_file in macro_files:
-                    macro_file_path = Path(macro_file)
-                    if not macro_file_path.exists():
-                        print(f"TASM: error: macro file not found: {macro_file}", file=sys.stderr)
-                        return 1
-                    
-                    log_info(f"Loading macro file: {macro_file_path}")
-                    if not macro_expander.process_macro_file(macro_file_path):
-                        print(f"TASM: error: failed to process macro file: {macro_file}", file=sys.stderr)
-                        print(f"TASM: check the macro definitions in {macro_file} for syntax errors", file=sys.stderr)
-                        print(f"TASM: use --verbose for detailed debugging information", file=sys.stderr)
-                        return 1
-            
-            # Output to stdout or specified file
             if len(source_files) > 1:
                 print("TASM: error: preprocessing multiple files not supported with -E", file=sys.stderr)
                 return 1
-                
+            
             source_file = source_files[0]  # Only one file for preprocessing
-            if user_specified_output and output_file and output_file != '-':
-                expanded_file = Path(output_file)
-                success = macro_expander.process_file(source_file, expanded_file)
-            else:
-                # Output to stdout (NASM -E behavior)
-                expanded_file = output_dir / f"{source_file.stem}_expanded.asm"
-                if macro_expander.process_file(source_file, expanded_file):
-                    with open(expanded_file, 'r') as f:
-                        print(f.read(), end='')
+            # Output to stdout (NASM -E behavior) or the specified file
+            to_stdout = not (user_specified_output and output_file and output_file != '-')
+            expanded_file = None if to_stdout else Path(output_file)
+            
+            cache_file = _expansion_cache_file(source_file, macro_files) if use_cache else None
+            if cache_file is not None and to_stdout:
+                try:
+                    cached = cache_file.read_bytes()
+                except OSError:
+                    pass
+                else:
+                    sys.stdout.flush()
+                    sys.stdout.buffer.write(cached)
                     success = True
+            elif cache_file is not None:
+                success = _cache_fetch(cache_file, expanded_file)
+            
+            if not success:
+                from macro import MacroExpander
+                macro_expander = MacroExpander()
+                warnings_before = logger.stats[LogLevel.WARNING]
+                
+                # Process macro files first (if any)
+                macro_key = _macro_set_key(macro_files) if macro_files else None
+                if macro_key in _macro_sets:
+                    macro_expander.macros.update(_macro_sets[macro_key])
+                    log_info(f"Reusing macro definitions from {len(macro_files)} macro file(s)")
+                elif macro_files:
+                    log_info(f"Processing {len(macro_files)} macro file(s)")
+                    for macro_file in macro_files:
+                        macro_file_path = Path(macro_file)
+                        if not macro_file_path.exists():
+                            print(f"TASM: error: macro file not found: {macro_file}", file=sys.stderr)
+                            return 1
+                        
+                        log_info(f"Loading macro file: {macro_file_path}")
+                        if not macro_expander.process_macro_file(macro_file_path):
+                            print(f"TASM: error: failed to process macro file: {macro_file}", file=sys.stderr)
+                            print(f"TASM: check the macro definitions in {macro_file} for syntax errors", file=sys.stderr)
+                            print(f"TASM: use --verbose for detailed debugging information", file=sys.stderr)
+                            return 1
+                    if macro_key is not None and logger.stats[LogLevel.WARNING] == warnings_before:
+                        _remember_macro_set(macro_key, macro_expander.macros)
+                
+                if to_stdout:
+                    # Stream straight to stdout; expansions are cached by -o and full builds
+                    success = macro_expander.process_stream(source_file, sys.stdout)
+                else:
+                    success = macro_expander.process_file(source_file, expanded_file)
+                    if success and cache_file is not None and logger.stats[LogLevel.WARNING] == warnings_before:
+                        _cache_store(expanded_file, cache_file)
+                        _prune_cache(EXPAND_CACHE_DIR, '.asm')
         else:
             # Full three-phase compilation
             # Get instruction set path from config if not specified
@@ -803,24 +1240,19 @@ def main():
                 if console_output:
                     print_phase("Compiling, 1st pass", "Macro expansion and Assembly")
                     
-                success, linker = compile_assembly_file(source_files[0], base_address=base_address, 
+                success, linker = compile_assembly_file(jobs[0], base_address=base_address, 
                                               output_dir=output_dir, instruction_set_file=instruction_set_path,
                                               macro_files=macro_files, output_format=output_format,
                                               listing_file=listing_file, force_32bit=force_32bit,
-                                              no_implicit=no_implicit, no_macros=no_macros)
+                                              no_implicit=no_implicit, no_macros=no_macros,
+                                              use_cache=use_cache)
                                               
                 if console_output and success:
-                    print_phase("Linking, 1st pass", "Resolving symbols")
-                    print_phase("Linking, 2nd pass", "Finalizing")
+                    print_link_phases()
                     
                 # Set output file path for summary
                 if success:
-                    if output_format == 'hex':
-                        output_file_path = output_dir / f"{source_files[0].stem}.hex"
-                    elif output_format == 'txt':
-                        output_file_path = output_dir / f"{source_files[0].stem}.txt"  
-                    else:
-                        output_file_path = output_dir / f"{source_files[0].stem}.bin"
+                    output_file_path = jobs[0].bin
                     
                     # Get instruction count from linker
                     instruction_count = linker.instruction_count if linker else 0
@@ -829,58 +1261,33 @@ def main():
                 if console_output:
                     print_phase("Compiling, 1st pass", "Multiple files macro expansion and Assembly")
                     
-                success, linker = compile_multiple_files(source_files, base_address=base_address,
+                success, linker = compile_multiple_files(jobs, base_address=base_address,
                                                output_dir=output_dir, instruction_set_file=instruction_set_path,
                                                macro_files=macro_files, output_format=output_format,
                                                listing_file=listing_file, force_32bit=force_32bit,
-                                               no_implicit=no_implicit)
+                                               no_implicit=no_implicit, no_macros=no_macros,
+                                               use_cache=use_cache, max_jobs=max_jobs)
                                                
                 if console_output and success:
-                    print_phase("Linking, 1st pass", "Resolving symbols")
-                    print_phase("Linking, 2nd pass", "Finalizing")
+                    print_link_phases()
                     
                 # Set output file path for summary  
                 if success:
-                    if output_format == 'hex':
-                        output_file_path = output_dir / "program.hex"
-                    elif output_format == 'txt':
-                        output_file_path = output_dir / "program.txt"
-                    else:
-                        output_file_path = output_dir / "program.bin"
+                    output_file_path = _program_output(output_dir, output_format)
                         
                     # Get instruction count from linker
                     instruction_count = linker.instruction_count if linker else 0
             
             # Move final binary to specified output location if different from build directory
-            if success and output_file and user_specified_output:
-                final_output_path = Path(output_file)
+            if success and final_output_path is not None:
+                # output_file_path is the linker output chosen by the branch above
+                built_output = output_file_path
                 output_file_path = final_output_path  # Store for summary
-                program_bin = output_dir / "program.bin"
                 
-                # If output file is different from where program.bin is created
-                if final_output_path != program_bin:
-                    if program_bin.exists():
-                        # Copy/move to final location
-                        import shutil
-                        shutil.copy2(program_bin, final_output_path)
-                        log_info(f"Output copied to: {final_output_path}")
-                    else:
-                        # Look for the actual output file that was created
-                        # Use first source file name as base for multiple files
-                        primary_source = source_files[0]
-                        
-                        # Choose correct file extension based on format
-                        if output_format == 'hex':
-                            binary_file = output_dir / f"{primary_source.stem}.hex"
-                        elif output_format == 'txt':
-                            binary_file = output_dir / f"{primary_source.stem}.txt"
-                        else:  # bin format
-                            binary_file = output_dir / f"{primary_source.stem}.bin"
-                            
-                        if binary_file.exists():
-                            import shutil
-                            shutil.copy2(binary_file, final_output_path)
-                            log_info(f"Output copied to: {final_output_path}")
+                if final_output_path != built_output and os.path.exists(built_output):
+                    # Move to final location
+                    _install(built_output, final_output_path)
+                    log_info(f"Output moved to: {final_output_path}")
         
     except KeyboardInterrupt:
         log_error("Compilation interrupted by user", error_code="USER_INTERRUPT")
@@ -900,10 +1307,11 @@ def main():
         # Always export files (logs are automatically saved during execution)
         export_build_summary_json(json_file)
         
-        if verbose in ["info", "verbose", "debug"]:
+        if verbose in INFO_VERBOSITY_LEVELS:
             log_info(f"Build log: {log_file}")
             log_info(f"Build summary: {json_file}")
     
+    logger.flush()
     return 0 if success else 1
 
 if __name__ == "__main__":
@@ -6,10 +6,12 @@ into machine code instructions and handling labels, addressing modes, and direct
 """
 
 import re
+import struct
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Union
-from dataclasses import dataclass
+from typing import Dict, List, Set, Tuple, Optional, Union, TextIO
+from dataclasses import dataclass, replace
 from enum import Enum
+from operator import itemgetter
 from datetime import datetime
 
 from logger import log_info, log_error, log_warning, log_debug, get_logger
@@ -21,6 +23,31 @@ from instruction_encoder import InstructionEncoder, ParsedInstruction, EncodedIn
 from data_directives import DataDirective
 from numeric_parser import parse_numeric
 
+# Write buffer for listing output, matching the linker's writers
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Blank address and opcode columns of a preliminary listing row
+_LS1_NO_ADDRESS = " " * 8
+_LS1_NO_CODE = " " * 12
+
+# SYMBOL EQU value (the EQU keyword in any case)
+_EQU_RE = re.compile(r'^\s*(\w+)\s+EQU\s+', re.IGNORECASE)
+
+# TOBJ object file records (little endian). Instruction record: address,
+# opcode (low 32 bits), size (clamped to 255), source line, then the source
+# text length ahead of the UTF-8 text. Label/symbol record: address, line.
+_OBJ_HEADER = struct.Struct('<4s2sH')
+_OBJ_INSTRUCTION = struct.Struct('<IIBIH')
+_OBJ_SYMBOL = struct.Struct('<II')
+_OBJ_U16 = struct.Struct('<H')
+_OBJ_U32 = struct.Struct('<I')
+
+# Branch mnemonics that use relative addressing (legacy addressing-mode helper)
+_BRANCH_MNEMONICS = frozenset({'BEQ', 'BNE', 'BCC', 'BCS', 'BPL', 'BMI', 'BVC', 'BVS'})
+
+# Label names: letter, underscore or dot first (GCC .L labels)
+_LABEL_RE = re.compile(r'^[a-zA-Z_\.][a-zA-Z0-9_\.]*$')
+
 class AddressingMode(Enum):
     """Supported addressing modes"""
     IMMEDIATE = "immediate"      # #value
@@ -32,6 +59,9 @@ class AddressingMode(Enum):
 @dataclass
 class Instruction:
     """Represents an assembled instruction"""
+    # One instance per emitted instruction: no per-instance __dict__
+    __slots__ = ('address', 'opcode', 'operand', 'size', 'source_line', 'source_text')
+    
     address: int
     opcode: int
     operand: Optional[int]
@@ -42,6 +72,8 @@ class Instruction:
 @dataclass
 class Label:
     """Represents a label definition"""
+    __slots__ = ('name', 'address', 'line_defined')
+    
     name: str
     address: int
     line_defined: int
@@ -67,6 +99,40 @@ class AssemblerEngine:
             force_32bit: If True, forces use of 32-bit instruction variants when available.
             no_implicit: If True, disables implicit operand variants (A[10]/A[15] shortcuts).
         """
+        self._load_instruction_set(instruction_set_file, force_32bit, no_implicit)
+        
+        # Create instruction encoder
+        self.instruction_encoder = InstructionEncoder(self.instruction_loader)
+        
+        # Parsed instruction by line text; parsing depends only on the text, so
+        # identical lines (e.g. from macro expansion) are parsed once per engine
+        self._parse_cache: Dict[str, Optional[ParsedInstruction]] = {}
+        
+        # Instruction size in bytes by (mnemonic, operand count); the size
+        # lookup does not depend on operand values, so it is resolved once
+        self._size_cache: Dict[Tuple[str, int], int] = {}
+        
+        # Output directories already created by this engine; object and
+        # listing files of a batch build usually share one directory
+        self._output_dirs: Set[Path] = set()
+        
+        # Byte order for data directives (fixed for the lifetime of the engine)
+        config = get_config()
+        self.endianness = 'little' if config.is_little_endian else 'big'
+        
+        # Assembly state
+        self.reset_state()
+    
+
+    def _load_instruction_set(self, instruction_set_file: Optional[Path], force_32bit: bool, no_implicit: bool):
+        """
+        Load the instruction set (expensive, done once per engine)
+        
+        Args:
+            instruction_set_file: Path to instruction set file, or None to use config
+            force_32bit: Force use of 32-bit instruction variants
+            no_implicit: Disable implicit operand variants
+        """
         # Determine instruction set file path
         if instruction_set_file is None:
             # Get instruction set path from config
@@ -95,34 +161,35 @@ class AssemblerEngine:
         
         log_info(f"Loaded {self.instruction_loader.get_instruction_count()} instructions from {instruction_set_file}")
         log_info(f"Found {self.instruction_loader.get_mnemonic_count()} unique instruction mnemonics")
+    
+    def reset_state(self):
+        """
+        Reset per-file assembly state so the engine can assemble another file
         
-        # Assembly state (initialize first)
+        The loaded instruction set and encoder are kept.
+        """
         self.labels: Dict[str, Label] = {}
+        self.label_addresses: Dict[str, int] = {}  # Name -> address mirror of labels for the encoder
         self.symbols: List[Symbol] = []
         self.instructions: List[Instruction] = []
+        self._code_size_bytes = 0  # Sum of instruction sizes, kept by the second pass
+        # .ORG line number -> (address before the directive, new origin), from the first pass
+        self._org_addresses: Dict[int, Tuple[int, int]] = {}
+        self._labels_sorted_by_name: Optional[List[Tuple[str, Label]]] = None  # Built on first use
         self.current_address = 0x80000000  # Default start address for TriCore
         self.current_file = ""
+        self.listing_file = None
         
-        # Store all source lines with their addresses for listing generation
-        # Format: (line_num, address, opcode_bytes, source_text)
-        self.source_listing: List[Tuple[int, Optional[int], Optional[bytes], str]] = []
-        
-        # Create instruction encoder
-        self.instruction_encoder = InstructionEncoder(self.instruction_loader)
+        # Preliminary listing (.ls1) stream, written row by row during the second pass
+        self._ls1_stream: Optional[TextIO] = None
+        self._ls1_timestamp = ""
         
         # Create data directive handler (pass labels dict for symbol resolution)
-        config = get_config()
         self.data_directive = DataDirective(
-            endianness='little' if config.is_little_endian else 'big',
+            endianness=self.endianness,
             labels=self.labels
         )
-        
-        # Legacy attributes for backward compatibility
-        self.opcodes = {}  # Will be populated as needed for compatibility
-        self.opcode_sizes = {}
-        self.enhanced_encoder = None  # Not needed with new system
     
-
     def assemble_file(self, input_file: Path, output_file: Path, listing_file: Optional[Path] = None) -> bool:
         """
         Assemble the macro-expanded source file
@@ -149,7 +216,7 @@ class AssemblerEngine:
                 return False
             
             with open(input_file, 'r', encoding='utf-8') as f:
-                source_lines = f.readlines()
+                source_lines = f.read().splitlines()
             
             log_info(f"Read {len(source_lines)} lines from expanded source", str(input_file))
             
@@ -157,21 +224,26 @@ class AssemblerEngine:
             if not self._first_pass(source_lines):
                 return False
             
+            # Generate preliminary listing file (.ls1) if requested
+            # This contains all source lines with preliminary addresses, streamed
+            # by the second pass. The linker will update this to .lst with final addresses
+            ls1_file = None
+            if self.listing_file:
+                ls1_file = self.listing_file.with_suffix('.ls1')
+                self._open_preliminary_listing(ls1_file)
+            
             # Second pass: generate machine code
             if not self._second_pass(source_lines):
+                self._close_preliminary_listing(None)
                 return False
             
             # Write object file
             if not self._write_object_file(output_file):
+                self._close_preliminary_listing(None)
                 return False
             
-            # Generate preliminary listing file (.ls1) if requested
-            # This contains all source lines with preliminary addresses
-            # The linker will update this to .lst with final addresses
-            if self.listing_file:
-                ls1_file = self.listing_file.with_suffix('.ls1')
-                if not self._write_preliminary_listing(ls1_file):
-                    log_warning(f"Failed to write preliminary listing file", str(ls1_file))
+            if ls1_file is not None and not self._close_preliminary_listing(ls1_file):
+                log_warning(f"Failed to write preliminary listing file", str(ls1_file))
             
             log_info(f"Assembly completed successfully")
             log_info(f"Generated {len(self.instructions)} instructions")
@@ -180,6 +252,7 @@ class AssemblerEngine:
             return True
             
         except Exception as e:
+            self._close_preliminary_listing(None)
             log_error(f"Unexpected error during assembly: {str(e)}", 
                      str(input_file), error_code="ASSEMBLY_ERROR")
             return False
@@ -194,27 +267,26 @@ class AssemblerEngine:
         for line_num, line in enumerate(source_lines, 1):
             original_line = line.strip()
             
-            # Store ALL source lines for listing (including comments and blank lines)
-            # Address will be None for comments/blank lines, filled in during second pass for instructions
             # Skip GCC line directives (e.g., # 670 "filename" 1) and regular comments (;)
             if not original_line or original_line.startswith(';') or original_line.startswith('#'):
-                self.source_listing.append((line_num, None, None, original_line))
                 continue
             
+            # Code part of the line, comment stripped once for all handlers
+            code = original_line.partition(';')[0].rstrip()
+            
             # Handle origin directive
-            if original_line.upper().startswith('.ORG'):
-                self.source_listing.append((line_num, address, None, original_line))
-                if not self._handle_org_directive(original_line, line_num):
+            if original_line[:4].upper() == '.ORG':
+                if not self._handle_org_directive(code, line_num):
                     return False
+                # The listing shows the .ORG row at the address before the directive
+                self._org_addresses[line_num] = (address, self.current_address)
                 address = self.current_address
                 continue
             
             # Handle EQU directive (defines constants)
             # Must be at start of line (after optional label): SYMBOL EQU value
-            line_upper = original_line.upper()
-            equ_pattern = re.match(r'^\s*(\w+)\s+EQU\s+', line_upper)
+            equ_pattern = _EQU_RE.match(original_line)
             if equ_pattern:
-                self.source_listing.append((line_num, None, None, original_line))
                 try:
                     symbol, value = self.data_directive.process_equ(original_line)
                     log_debug(f"Defined constant {symbol} = {value}")
@@ -226,50 +298,45 @@ class AssemblerEngine:
                              self.current_file, line_num, error_code="INVALID_EQU")
                     return False
             
-            # Check for label (but ignore colons in comments)
-            colon_pos = original_line.find(':')
-            semicolon_pos = original_line.find(';')
-            
-            # Only treat as label if colon comes before any comment
-            if colon_pos != -1 and (semicolon_pos == -1 or colon_pos < semicolon_pos):
-                label_part, instruction_part = original_line.split(':', 1)
-                label_name = label_part.strip()
+            # Check for label (colons in comments are already stripped)
+            colon_pos = code.find(':')
+            if colon_pos != -1:
+                label_name = code[:colon_pos].strip()
                 
                 if not self._validate_label_name(label_name, line_num):
                     return False
                 
-                if label_name in self.labels:
+                label = Label(label_name, address, line_num)
+                previous = self.labels.setdefault(label_name, label)
+                if previous is not label:
                     log_error(f"Label '{label_name}' already defined", 
                              self.current_file, line_num, error_code="DUPLICATE_LABEL")
-                    log_debug(f"Previous definition at line {self.labels[label_name].line_defined}")
+                    log_debug(f"Previous definition at line {previous.line_defined}")
                     return False
                 
-                self.labels[label_name] = Label(label_name, address, line_num)
+                self.label_addresses[label_name] = address
                 label_count += 1
                 log_debug(f"Label '{label_name}' defined at address 0x{address:08X}")
                 
                 # Process instruction part if present
-                instruction_part = instruction_part.strip()
-                if instruction_part and not instruction_part.startswith(';'):
-                    # Check if it's a data directive
-                    if self.data_directive.is_data_directive(instruction_part):
+                instruction_code = code[colon_pos + 1:].strip()
+                if instruction_code:
+                    # Check if it's a data directive (sized from the full text,
+                    # which handles quoted semicolons itself)
+                    if self.data_directive.is_data_directive(instruction_code):
                         try:
+                            instruction_part = original_line[colon_pos + 1:].strip()
                             inst_size = self.data_directive.calculate_size(instruction_part, address)
-                            self.source_listing.append((line_num, address, None, original_line))
                             log_debug(f"Data directive size: {inst_size} bytes at address 0x{address:08X}")
                         except Exception as e:
                             log_error(f"Error calculating data directive size: {e}", 
                                      self.current_file, line_num, error_code="DATA_DIRECTIVE_ERROR")
                             return False
                     else:
-                        inst_size = self._calculate_instruction_size(instruction_part, line_num)
+                        inst_size = self._calculate_instruction_size(instruction_code, line_num)
                         if inst_size is None:
                             return False
-                        self.source_listing.append((line_num, address, None, original_line))
                     address += inst_size
-                else:
-                    # Label only (no instruction on same line)
-                    self.source_listing.append((line_num, address, None, original_line))
             
             else:
                 # Regular instruction or directive
@@ -277,28 +344,23 @@ class AssemblerEngine:
                 if self.data_directive.is_data_directive(original_line):
                     try:
                         inst_size = self.data_directive.calculate_size(original_line, address)
-                        self.source_listing.append((line_num, address, None, original_line))
                         log_debug(f"Data directive size: {inst_size} bytes at address 0x{address:08X}")
                     except Exception as e:
                         log_error(f"Error calculating data directive size: {e}", 
                                  self.current_file, line_num, error_code="DATA_DIRECTIVE_ERROR")
                         return False
                 else:
-                    inst_size = self._calculate_instruction_size(original_line, line_num)
+                    inst_size = self._calculate_instruction_size(code, line_num)
                     if inst_size is None:
                         return False
-                    self.source_listing.append((line_num, address, None, original_line))
                 address += inst_size
         
+        self._labels_sorted_by_name = None  # Labels changed; re-sort on next use
         log_info(f"First pass completed - found {label_count} labels")
         return True
     
     def _handle_org_directive(self, line: str, line_num: int) -> bool:
-        """Handle .ORG directive"""
-        # Remove comments first
-        if ';' in line:
-            line = line.split(';')[0].strip()
-        
+        """Handle .ORG directive (line without its comment)"""
         parts = line.split()
         if len(parts) != 2:
             log_error("Invalid .ORG directive format", 
@@ -339,39 +401,35 @@ class AssemblerEngine:
         # Allow:
         # 1. Standard labels: starting with letter, underscore, or dot (GCC .L labels)
         # 2. GCC numeric local labels: pure digits like 0, 1, 2, etc.
-        if not (re.match(r'^[a-zA-Z_\.][a-zA-Z0-9_\.]*$', label_name) or 
-                re.match(r'^\d+$', label_name)):
+        if not (label_name.isdecimal() or _LABEL_RE.match(label_name)):
             log_error(f"Invalid label name: '{label_name}'", 
                      self.current_file, line_num, error_code="INVALID_LABEL_NAME")
             return False
         
-        # Check if it conflicts with instruction names (skip for numeric labels)
-        if not re.match(r'^\d+$', label_name) and label_name.upper() in self.opcodes:
-            log_warning(f"Label '{label_name}' shadows instruction name", 
-                       self.current_file, line_num, error_code="LABEL_SHADOWS_INSTRUCTION")
-        
         return True
     
     def _calculate_instruction_size(self, line: str, line_num: int) -> Optional[int]:
-        """Calculate the size of an instruction in bytes using external instruction set"""
-        line = line.strip()
+        """Calculate the size of an instruction in bytes using external instruction set
         
-        if not line or line.startswith(';'):
+        The line is the stripped code part, without its comment.
+        """
+        if not line:
             return 0
         
-        # Remove comments first
-        if ';' in line:
-            line = line.split(';')[0].strip()
-        
         # Handle directives
-        if line.upper().startswith('.'):
+        if line.startswith('.'):
             return self._calculate_directive_size(line, line_num)
         
         # Parse instruction using new encoder
-        parsed = self.instruction_encoder.parse_instruction_line(line, line_num)
+        parsed = self._parse_line(line, line_num)
         if parsed is None:
             return 0  # Not a valid instruction line
         
+        key = (parsed.mnemonic, parsed.operand_count)
+        size_bytes = self._size_cache.get(key)
+        if size_bytes is not None:
+            return size_bytes
+        
         # Find matching instruction definition
         definition = self.instruction_loader.find_instruction(parsed.mnemonic, parsed.operand_count)
         if definition is None:
@@ -381,8 +439,22 @@ class AssemblerEngine:
         
         # Convert bits to bytes (Tricore instructions are 32-bit = 4 bytes)
         size_bytes = definition.opcode_size // 8
+        self._size_cache[key] = size_bytes
         return size_bytes
     
+    def _parse_line(self, line: str, line_num: int) -> Optional[ParsedInstruction]:
+        """Parse an instruction line, reusing the parse of an identical line"""
+        try:
+            parsed = self._parse_cache[line]
+        except KeyError:
+            parsed = self.instruction_encoder.parse_instruction_line(line, line_num)
+            self._parse_cache[line] = parsed
+            return parsed
+        if parsed is None or parsed.line_number == line_num:
+            return parsed
+        # Same text on another line: share the operands, report this line number
+        return replace(parsed, line_number=line_num)
+    
     def _calculate_directive_size(self, line: str, line_num: int) -> Optional[int]:
         """Calculate size of assembler directives"""
         parts = line.split()
@@ -411,79 +483,82 @@ class AssemblerEngine:
             return AddressingMode.INDEXED
         else:
             # Check if this is a branch instruction - they use relative addressing
-            if mnemonic and mnemonic.upper() in ['BEQ', 'BNE', 'BCC', 'BCS', 'BPL', 'BMI', 'BVC', 'BVS']:
+            if mnemonic and mnemonic.upper() in _BRANCH_MNEMONICS:
                 return AddressingMode.RELATIVE
             else:
                 return AddressingMode.DIRECT
     
     def _second_pass(self, source_lines: List[str]) -> bool:
-        """Second pass: generate machine code"""
+        """Second pass: generate machine code (and the .ls1 rows, if a listing is open)"""
         log_debug("Starting second pass - generating machine code")
         
         address = self.current_address
         instruction_count = 0
+        listing = self._ls1_stream is not None
         
         for line_num, line in enumerate(source_lines, 1):
             original_line = line.strip()
             
-            # Skip empty lines and comments
-            if not original_line or original_line.startswith(';'):
+            # Skip empty lines, comments and GCC line directives (no address)
+            if not original_line or original_line.startswith(';') or original_line.startswith('#'):
+                if listing:
+                    self._write_listing_row(line_num, None, None, original_line)
                 continue
             
+            code = original_line.partition(';')[0].rstrip()
+            
             # Handle origin directive
-            if original_line.upper().startswith('.ORG'):
-                self._handle_org_directive(original_line, line_num)
-                address = self.current_address
+            if original_line[:4].upper() == '.ORG':
+                # Already parsed and validated by the first pass
+                listed_address, address = self._org_addresses[line_num]
+                if listing:
+                    self._write_listing_row(line_num, listed_address, None, original_line)
                 continue
             
             # Skip EQU directives (already processed in first pass)
-            line_upper = original_line.upper()
-            if re.match(r'^\s*(\w+)\s+EQU\s+', line_upper):
+            if _EQU_RE.match(original_line):
+                if listing:
+                    self._write_listing_row(line_num, None, None, original_line)
                 continue
             
-            # Remove label if present (but ignore colons in comments)
-            colon_pos = original_line.find(':')
-            semicolon_pos = original_line.find(';')
-            
-            if colon_pos != -1 and (semicolon_pos == -1 or colon_pos < semicolon_pos):
-                _, instruction_part = original_line.split(':', 1)
-                instruction_part = instruction_part.strip()
-                
-                if not instruction_part or instruction_part.startswith(';'):
+            # Remove label if present
+            colon_pos = code.find(':')
+            if colon_pos != -1:
+                code = code[colon_pos + 1:].strip()
+                if not code:
+                    # Label only (no instruction on same line): list the label's
+                    # address, as the symbol table does (code is a prefix of
+                    # original_line, so colon_pos still marks the label name)
+                    if listing:
+                        label_address = self.label_addresses[original_line[:colon_pos].strip()]
+                        self._write_listing_row(line_num, label_address, None, original_line)
                     continue
-                
-                original_line = instruction_part
             
             # Check if it's a data directive
-            if self.data_directive.is_data_directive(original_line):
-                instruction = self._assemble_data_directive(original_line, address, line_num)
-                if instruction is None:
-                    return False
-                if instruction.size > 0:
-                    self.instructions.append(instruction)
-                    address += instruction.size
-                    instruction_count += 1
+            if self.data_directive.is_data_directive(code):
+                instruction = self._assemble_data_directive(code, address, line_num)
             else:
-                # Assemble instruction
-                instruction = self._assemble_instruction(original_line, address, line_num)
-                if instruction is None:
-                    return False
-                
-                if instruction.size > 0:
-                    self.instructions.append(instruction)
-                    address += instruction.size
-                    instruction_count += 1
+                instruction = self._assemble_instruction(code, address, line_num)
+            if instruction is None:
+                return False
+            
+            if listing:
+                self._write_listing_row(line_num, address, instruction, original_line)
+            
+            if instruction.size > 0:
+                self.instructions.append(instruction)
+                address += instruction.size
+                self._code_size_bytes += instruction.size
+                instruction_count += 1
         
         log_info(f"Second pass completed - generated {instruction_count} instructions")
         return True
     
     def _assemble_instruction(self, line: str, address: int, line_num: int) -> Optional[Instruction]:
-        """Assemble a single instruction using the new external instruction set system"""
-        # Remove comments first
-        if ';' in line:
-            line = line.split(';')[0]
+        """Assemble a single instruction using the new external instruction set system
         
-        line = line.strip()
+        The line is the stripped code part, without its comment.
+        """
         if not line:
             return Instruction(address, 0, None, 0, line_num, line)
         
@@ -491,17 +566,14 @@ class AssemblerEngine:
         if line.startswith('.'):
             return self._assemble_directive(line, address, line_num)
         
-        # Parse instruction using new encoder
-        parsed = self.instruction_encoder.parse_instruction_line(line, line_num)
+        # Parse instruction using new encoder (reuses the first pass parse)
+        parsed = self._parse_line(line, line_num)
         if parsed is None:
             # Not a valid instruction line (maybe empty or comment)
             return Instruction(address, 0, None, 0, line_num, line)
         
-        # Convert labels dict to address dict for encoder
-        label_addresses = {name: label.address for name, label in self.labels.items()}
-        
         # Encode instruction with label resolution support
-        encoded = self.instruction_encoder.encode_instruction(parsed, address, label_addresses)
+        encoded = self.instruction_encoder.encode_instruction(parsed, address, self.label_addresses)
         if encoded is None:
             # Encoding failed - detailed error already logged by encoder
             return None
@@ -545,11 +617,7 @@ class AssemblerEngine:
         return Instruction(address, 0, None, 0, line_num, line)
     
     def _assemble_data_directive(self, line: str, address: int, line_num: int) -> Optional[Instruction]:
-        """Assemble NASM-compatible data directives"""
-        # Remove comments
-        if ';' in line:
-            line = line.split(';')[0].strip()
-        
+        """Assemble NASM-compatible data directives (line without its comment)"""
         parts = line.split(None, 1)
         if not parts:
             return Instruction(address, 0, None, 0, line_num, line)
@@ -561,8 +629,9 @@ class AssemblerEngine:
             if directive == 'TIMES':
                 count, rest = self.data_directive.process_times(line, address)
                 # For TIMES, we need to recursively process the repeated part
-                # Simplified: just calculate size and store as data
-                data_size = self.data_directive.calculate_size(line, address)
+                # Simplified: just calculate size and store as data (the
+                # count is already resolved, so only the body is sized)
+                data_size = count * self.data_directive.calculate_size(rest, address)
                 # Create a pseudo-instruction for TIMES (will need special handling in linker)
                 return Instruction(address, 0, None, data_size, line_num, line)
             
@@ -645,6 +714,11 @@ class AssemblerEngine:
         """
         value_str = value_str.strip()
         
+        # Plain (optionally signed) ASCII decimal, the common case: int() directly
+        digits = value_str[1:] if value_str[:1] in ('+', '-') else value_str
+        if digits.isdecimal() and digits.isascii():
+            return int(value_str)
+        
         # Support legacy '%' prefix for binary (non-NASM)
         if value_str.startswith('%'):
             return int(value_str[1:].replace('_', ''), 2)
@@ -659,6 +733,13 @@ class AssemblerEngine:
         """Resolve symbol to address"""
         symbol_str = symbol_str.strip()
         
+        # Known label: one dict lookup instead of a failed numeric parse. Names
+        # starting with a digit or '_' can also read as numbers ("1", "_1"),
+        # so those keep the numeric interpretation first
+        label = self.labels.get(symbol_str)
+        if label is not None and not (symbol_str[0].isdigit() or symbol_str[0] == '_'):
+            return label.address
+        
         # Check if it's a numeric value
         try:
             return self._parse_numeric_value(symbol_str)
@@ -675,90 +756,79 @@ class AssemblerEngine:
                    self.current_file, line_num, error_code="UNRESOLVED_SYMBOL")
         return 0  # Placeholder
     
+    def _labels_by_name(self) -> List[Tuple[str, Label]]:
+        """Labels sorted by name, shared by the object and listing writers"""
+        if self._labels_sorted_by_name is None:
+            self._labels_sorted_by_name = sorted(self.labels.items())
+        return self._labels_sorted_by_name
+    
     def _calculate_code_size(self) -> int:
         """Calculate total code size"""
-        return sum(inst.size for inst in self.instructions)
+        return self._code_size_bytes
+    
+    def _ensure_output_dir(self, output_file: Path) -> None:
+        """Create the directory of an output file (once per directory per engine)"""
+        directory = output_file.parent
+        if directory not in self._output_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._output_dirs.add(directory)
     
     def _write_object_file(self, output_file: Path) -> bool:
         """Write object file with machine code and symbol information"""
         try:
-            output_file.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_output_dir(output_file)
+            
+            # Build the whole TOBJ image in memory and write it with one call
+            buf = bytearray()
+            
+            # TOBJ header (TASM Object format): magic number, version 1.0,
+            # source file name length and name
+            source_name = str(self.current_file).encode('utf-8')
+            buf += _OBJ_HEADER.pack(b'TOBJ', b'\x01\x00', len(source_name))
+            buf += source_name
+            
+            # Instruction count and instructions
+            buf += _OBJ_U32.pack(len(self.instructions))
+            pack = _OBJ_INSTRUCTION.pack
+            for instruction in self.instructions:
+                # Already stripped: the second pass hands over the bare code text
+                source_text = instruction.source_text.encode('utf-8')
+                # Opcode is clamped to 4 bytes (two's complement for negative
+                # values); data directives may have opcode=0 with size>4, which is fine
+                buf += pack(instruction.address,
+                            instruction.opcode & 0xFFFFFFFF,
+                            min(instruction.size, 255),
+                            instruction.source_line,
+                            len(source_text))
+                buf += source_text
+            
+            # Label count and labels: name, address, line number
+            buf += _OBJ_U32.pack(len(self.labels))
+            for label_name, label in self._labels_by_name():
+                name_bytes = label_name.encode('utf-8')
+                buf += _OBJ_U16.pack(len(name_bytes))
+                buf += name_bytes
+                buf += _OBJ_SYMBOL.pack(label.address, label.line_defined)
+            
+            # Symbol count and symbols
+            buf += _OBJ_U32.pack(len(self.symbols))
+            for symbol in self.symbols:
+                name_bytes = symbol.name.encode('utf-8')
+                buf += _OBJ_U16.pack(len(name_bytes))
+                buf += name_bytes
+                buf += _OBJ_SYMBOL.pack(symbol.address, symbol.line_referenced)
+            
+            # Constant count and constants (for EQU), stored as their 32-bit
+            # representation (two's complement for negative values)
+            buf += _OBJ_U32.pack(len(self.data_directive.constants))
+            for const_name, const_value in sorted(self.data_directive.constants.items()):
+                name_bytes = const_name.encode('utf-8')
+                buf += _OBJ_U16.pack(len(name_bytes))
+                buf += name_bytes
+                buf += _OBJ_U32.pack(const_value & 0xFFFFFFFF)
             
-            # Write binary object file
             with open(output_file, 'wb') as f:
-                # Write TOBJ header (TASM Object format)
-                f.write(b'TOBJ')  # Magic number
-                f.write(b'\x01\x00')  # Version 1.0
-                
-                # Write source file name length and name
-                source_name = str(self.current_file).encode('utf-8')
-                f.write(len(source_name).to_bytes(2, 'little'))
-                f.write(source_name)
-                
-                # Write instruction count
-                f.write(len(self.instructions).to_bytes(4, 'little'))
-                
-                # Write instructions
-                for instruction in self.instructions:
-                    f.write(instruction.address.to_bytes(4, 'little'))  # Address
-                    # Handle opcode - clamp to 4 bytes for object file format
-                    # Data directives may have opcode=0 with size>4, which is fine
-                    try:
-                        # Handle both positive overflow and negative numbers
-                        if instruction.opcode < 0:
-                            # Negative number - convert to two's complement
-                            opcode_bytes = (instruction.opcode & 0xFFFFFFFF).to_bytes(4, 'little')
-                        else:
-                            opcode_bytes = instruction.opcode.to_bytes(4, 'little')
-                    except (OverflowError, ValueError) as e:
-                        # Opcode too large for 4 bytes, store only lower 4 bytes
-                        opcode_bytes = (instruction.opcode & 0xFFFFFFFF).to_bytes(4, 'little')
-                    f.write(opcode_bytes)   # Machine code
-                    # Handle size - clamp to 255 bytes max for object file format
-                    size_byte = min(instruction.size, 255)
-                    f.write(size_byte.to_bytes(1, 'little'))     # Size
-                    # Write source line number
-                    f.write(instruction.source_line.to_bytes(4, 'little'))  # Source line
-                    # Write source text
-                    source_text = instruction.source_text.strip().encode('utf-8')
-                    f.write(len(source_text).to_bytes(2, 'little'))
-                    f.write(source_text)
-                
-                # Write label count and labels
-                f.write(len(self.labels).to_bytes(4, 'little'))
-                for label_name, label in sorted(self.labels.items()):
-                    name_bytes = label_name.encode('utf-8')
-                    f.write(len(name_bytes).to_bytes(2, 'little'))
-                    f.write(name_bytes)
-                    f.write(label.address.to_bytes(4, 'little'))
-                    f.write(label.line_defined.to_bytes(4, 'little'))  # Line number
-                
-                # Write symbol count and symbols
-                f.write(len(self.symbols).to_bytes(4, 'little'))
-                for symbol in self.symbols:
-                    name_bytes = symbol.name.encode('utf-8')
-                    f.write(len(name_bytes).to_bytes(2, 'little'))
-                    f.write(name_bytes)
-                    f.write(symbol.address.to_bytes(4, 'little'))
-                    f.write(symbol.line_referenced.to_bytes(4, 'little'))
-                
-                # Write constant count and constants (for EQU)
-                f.write(len(self.data_directive.constants).to_bytes(4, 'little'))
-                for const_name, const_value in sorted(self.data_directive.constants.items()):
-                    name_bytes = const_name.encode('utf-8')
-                    f.write(len(name_bytes).to_bytes(2, 'little'))
-                    f.write(name_bytes)
-                    # Handle both signed and unsigned constants - convert to 32-bit representation
-                    try:
-                        if const_value < 0:
-                            # Negative - use signed
-                            f.write(const_value.to_bytes(4, 'little', signed=True))
-                        else:
-                            # Positive - use unsigned (allows full 32-bit range)
-                            f.write(const_value.to_bytes(4, 'little', signed=False))
-                    except (OverflowError, ValueError):
-                        # Value out of range - clamp to 32 bits
-                        f.write((const_value & 0xFFFFFFFF).to_bytes(4, 'little', signed=False))
+                f.write(buf)
             
             log_info(f"Object file written successfully", str(output_file))
             
@@ -772,96 +842,59 @@ class AssemblerEngine:
                      str(output_file), error_code="OBJECT_FILE_WRITE_ERROR")
             return False
     
+    def _iter_source_lines(self):
+        """Yield the current source file's lines one at a time (nothing if unreadable)"""
+        if not self.current_file:
+            return
+        try:
+            src_f = open(self.current_file, 'r', encoding='utf-8')
+        except Exception:
+            return
+        with src_f:
+            try:
+                yield from src_f
+            except UnicodeDecodeError:
+                return
+    
     def _write_listing_file(self, listing_file: Path) -> bool:
         """Write a MASM-style listing file with addresses, opcodes, and source"""
         try:
-            listing_file.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_output_dir(listing_file)
             
-            with open(listing_file, 'w', encoding='utf-8') as f:
+            with open(listing_file, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as f:
                 # Write header
                 f.write(f"TASM Assembler  Version 1.0.0  {datetime.now().strftime('%m/%d/%y  %H:%M:%S')}  Page 1\n\n")
                 
-                # Read original source lines for listing
-                source_lines = []
-                if self.current_file:
-                    try:
-                        with open(self.current_file, 'r', encoding='utf-8') as src_f:
-                            source_lines = src_f.readlines()
-                    except Exception:
-                        pass
+                # Original source lines for listing, streamed from the file
+                source_lines = self._iter_source_lines()
                 
-                # Create instruction map by address
-                instruction_map = {instr.address: instr for instr in self.instructions}
+                # Map each source line to its first instruction
+                line_map: Dict[int, Instruction] = {}
+                for instr in self.instructions:
+                    line_map.setdefault(instr.source_line, instr)
                 
+                byteorder = self.endianness
                 current_address = None
                 for line_num, source_line in enumerate(source_lines, 1):
                     source_line = source_line.rstrip()
                     
                     # Check if this line has an instruction at any address
-                    instruction = None
-                    for instr in self.instructions:
-                        if instr.source_line == line_num:
-                            instruction = instr
-                            break
+                    instruction = line_map.get(line_num)
                     
                     if instruction:
                         # Format opcode as bytes according to endianness and size
-                        config = get_config()
                         opcode = instruction.opcode
                         
                         # Convert opcode to bytes based on instruction size
-                        # For data directives (DB, DW, DD, etc.), show only the actual bytes
-                        if instruction.size == 1:  # 1-byte (DB)
-                            byte0 = opcode & 0xFF
-                            opcode_str = f"{byte0:02X}            "
-                        elif instruction.size == 2:  # 2-byte (DW or 16-bit instruction)
-                            if config.is_little_endian:
-                                byte0 = opcode & 0xFF
-                                byte1 = (opcode >> 8) & 0xFF
-                                opcode_str = f"{byte0:02X} {byte1:02X}         "
-                            else:
-                                byte0 = (opcode >> 8) & 0xFF
-                                byte1 = opcode & 0xFF
-                                opcode_str = f"{byte0:02X} {byte1:02X}         "
-                        elif instruction.size == 3:  # 3-byte
-                            if config.is_little_endian:
-                                byte0 = opcode & 0xFF
-                                byte1 = (opcode >> 8) & 0xFF
-                                byte2 = (opcode >> 16) & 0xFF
-                                opcode_str = f"{byte0:02X} {byte1:02X} {byte2:02X}      "
-                            else:
-                                byte0 = (opcode >> 16) & 0xFF
-                                byte1 = (opcode >> 8) & 0xFF
-                                byte2 = opcode & 0xFF
-                                opcode_str = f"{byte0:02X} {byte1:02X} {byte2:02X}      "
-                        elif instruction.size == 4:  # 4-byte (DD or 32-bit instruction)
-                            if config.is_little_endian:
-                                byte0 = opcode & 0xFF
-                                byte1 = (opcode >> 8) & 0xFF
-                                byte2 = (opcode >> 16) & 0xFF
-                                byte3 = (opcode >> 24) & 0xFF
-                                opcode_str = f"{byte0:02X} {byte1:02X} {byte2:02X} {byte3:02X}"
-                            else:
-                                byte0 = (opcode >> 24) & 0xFF
-                                byte1 = (opcode >> 16) & 0xFF
-                                byte2 = (opcode >> 8) & 0xFF
-                                byte3 = opcode & 0xFF
-                                opcode_str = f"{byte0:02X} {byte1:02X} {byte2:02X} {byte3:02X}"
-                        else:
-                            # For larger sizes, show only first 4 bytes for listing
-                            # (Full data is in the binary, this is just for display)
-                            if config.is_little_endian:
-                                byte0 = opcode & 0xFF
-                                byte1 = (opcode >> 8) & 0xFF
-                                byte2 = (opcode >> 16) & 0xFF
-                                byte3 = (opcode >> 24) & 0xFF
-                                opcode_str = f"{byte0:02X} {byte1:02X} {byte2:02X} {byte3:02X}+"
-                            else:
-                                byte0 = (opcode >> 24) & 0xFF
-                                byte1 = (opcode >> 16) & 0xFF
-                                byte2 = (opcode >> 8) & 0xFF
-                                byte3 = opcode & 0xFF
-                                opcode_str = f"{byte0:02X} {byte1:02X} {byte2:02X} {byte3:02X}+"
+                        # For data directives (DB, DW, DD, etc.), show only the actual bytes;
+                        # larger sizes show the first 4 bytes and a '+' (full data is in the binary)
+                        size = instruction.size
+                        shown = size if size <= 4 else 4
+                        opcode_str = (opcode & ((1 << (shown * 8)) - 1)).to_bytes(shown, byteorder).hex(' ').upper()
+                        if size < 4:
+                            opcode_str = f"{opcode_str:<14}"
+                        elif size > 4:
+                            opcode_str += "+"
                         
                         # Format: Address  Machine Code (bytes)  Source Line
                         f.write(f"{instruction.address:08X}  {opcode_str}  {source_line}\n")
@@ -875,7 +908,7 @@ class AssemblerEngine:
                     f.write("Symbol Table\n")
                     f.write("------------\n\n")
                     
-                    for label_name, label in sorted(self.labels.items()):
+                    for label_name, label in self._labels_by_name():
                         f.write(f"{label_name:<15} {label.address:08X}h\n")
                 
             return True
@@ -885,111 +918,96 @@ class AssemblerEngine:
                      str(listing_file), error_code="LISTING_FILE_WRITE_ERROR")
             return False
     
-    def _write_preliminary_listing(self, listing_file: Path) -> bool:
+    def _open_preliminary_listing(self, listing_file: Path) -> bool:
         """
-        Write preliminary listing file (.ls1) with ALL source lines.
-        This includes comments, blank lines, directives - everything from the source.
-        The linker will convert this to .lst with final addresses.
+        Open the preliminary listing file (.ls1) and write its header.
+        
+        The second pass then streams one row per source line (comments, blank
+        lines, directives - everything from the source), so no per-line
+        listing state is kept in memory. The linker converts this file to
+        .lst with final addresses.
         """
         try:
-            from datetime import datetime
-            
-            listing_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Get config for endianness
-            config = get_config()
-            
-            # Create mapping from line number to instruction
-            line_to_instruction = {}
-            for instruction in self.instructions:
-                line_to_instruction[instruction.source_line] = instruction
+            self._ensure_output_dir(listing_file)
+            f = open(listing_file, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE)
+        except OSError as e:
+            log_warning(f"Could not generate preliminary listing file: {e}")
+            return False
+        
+        self._ls1_timestamp = datetime.now().strftime('%m/%d/%y  %H:%M:%S')
+        f.write(f"TASM Assembler  Version 1.0.0  {self._ls1_timestamp}  Page 1\n")
+        f.write("\n")
+        f.write("ADDR     CODE          LINE     SOURCE CODE\n")
+        self._ls1_stream = f
+        return True
+    
+    def _write_listing_row(self, line_num: int, address: Optional[int],
+                           instruction: Optional[Instruction], source_text: str) -> None:
+        """Write one source line to the preliminary listing"""
+        f = self._ls1_stream
+        if f is None:
+            return
+        
+        if instruction and instruction.size > 0:
+            # Format opcode bytes (masking keeps negative opcodes in two's complement)
+            opcode = instruction.opcode
+            size = instruction.size
+            
+            if size == 1:
+                code_str = f"{opcode:02X}"
+            elif size == 2 or size == 4:
+                code_str = (opcode & ((1 << (size * 8)) - 1)).to_bytes(size, self.endianness).hex(' ').upper()
+            elif size > 4:
+                # Data directive with many bytes: first 8, low byte first
+                code_str = (opcode & 0xFFFFFFFFFFFFFFFF).to_bytes(8, 'little')[:size].hex(' ').upper()
+                if size > 8:
+                    code_str += " ..."
+            else:
+                code_str = ""
             
-            with open(listing_file, 'w', encoding='utf-8') as f:
-                # Write header
-                timestamp = datetime.now().strftime('%m/%d/%y  %H:%M:%S')
-                f.write(f"TASM Assembler  Version 1.0.0  {timestamp}  Page 1\n")
-                f.write("\n")
-                f.write("ADDR     CODE          LINE     SOURCE CODE\n")
-                
-                # Write all source lines from source_listing
-                for line_num, address, opcode_bytes, source_text in self.source_listing:
-                    # Try to get instruction for this line
-                    instruction = line_to_instruction.get(line_num)
-                    
-                    if instruction and instruction.size > 0:
-                        # Format address
-                        addr_str = f"{instruction.address:08X}"
-                        
-                        # Format opcode bytes
-                        opcode = instruction.opcode
-                        size = instruction.size
-                        code_bytes = []
-                        
-                        if size == 1:
-                            code_bytes.append(f"{opcode:02X}")
-                        elif size == 2:
-                            if config.is_little_endian:
-                                code_bytes.append(f"{opcode & 0xFF:02X}")
-                                code_bytes.append(f"{(opcode >> 8) & 0xFF:02X}")
-                            else:
-                                code_bytes.append(f"{(opcode >> 8) & 0xFF:02X}")
-                                code_bytes.append(f"{opcode & 0xFF:02X}")
-                        elif size == 4:
-                            if config.is_little_endian:
-                                code_bytes.append(f"{opcode & 0xFF:02X}")
-                                code_bytes.append(f"{(opcode >> 8) & 0xFF:02X}")
-                                code_bytes.append(f"{(opcode >> 16) & 0xFF:02X}")
-                                code_bytes.append(f"{(opcode >> 24) & 0xFF:02X}")
-                            else:
-                                code_bytes.append(f"{(opcode >> 24) & 0xFF:02X}")
-                                code_bytes.append(f"{(opcode >> 16) & 0xFF:02X}")
-                                code_bytes.append(f"{(opcode >> 8) & 0xFF:02X}")
-                                code_bytes.append(f"{opcode & 0xFF:02X}")
-                        elif size > 4:
-                            # Data directive with many bytes
-                            for i in range(min(size, 8)):
-                                code_bytes.append(f"{(opcode >> (i * 8)) & 0xFF:02X}")
-                            if size > 8:
-                                code_bytes.append("...")
-                        
-                        code_str = ' '.join(code_bytes)
-                        code_str = f"{code_str:<12}"
-                        
-                        # Format line number
-                        line_str = f"{line_num:5d}"
-                        
-                        # Write formatted line
-                        f.write(f"{addr_str} {code_str} {line_str}    {source_text}\n")
-                    
-                    elif address is not None:
-                        # Label or directive with address but no opcode yet
-                        addr_str = f"{address:08X}"
-                        code_str = " " * 12
-                        line_str = f"{line_num:5d}"
-                        f.write(f"{addr_str} {code_str} {line_str}    {source_text}\n")
-                    
-                    else:
-                        # Comment, blank line, or EQU (no address)
-                        addr_str = " " * 8
-                        code_str = " " * 12
-                        line_str = f"{line_num:5d}"
-                        f.write(f"{addr_str} {code_str} {line_str}    {source_text}\n")
-                
+            row = f"{instruction.address:08X} {code_str:<12} {line_num:5d}    {source_text}\n"
+        elif address is not None:
+            # Label or directive with address but no opcode
+            row = f"{address:08X} {_LS1_NO_CODE} {line_num:5d}    {source_text}\n"
+        else:
+            # Comment, blank line, or EQU (no address)
+            row = f"{_LS1_NO_ADDRESS} {_LS1_NO_CODE} {line_num:5d}    {source_text}\n"
+        
+        try:
+            f.write(row)
+        except OSError as e:
+            log_warning(f"Could not generate preliminary listing file: {e}")
+            self._close_preliminary_listing(None)
+    
+    def _close_preliminary_listing(self, listing_file: Optional[Path]) -> bool:
+        """
+        Finish the preliminary listing with the symbol table (Page 2) and close it.
+        
+        With listing_file None the stream is closed without the symbol table
+        (assembly failed or a write error already occurred).
+        """
+        f = self._ls1_stream
+        if f is None:
+            return False
+        self._ls1_stream = None
+        
+        try:
+            if listing_file is not None:
                 # Write symbol table on Page 2
                 f.write(f"\n")
-                f.write(f"TASM Assembler  Version 1.0.0  {timestamp}  Symbols - Page 2\n")
+                f.write(f"TASM Assembler  Version 1.0.0  {self._ls1_timestamp}  Symbols - Page 2\n")
                 f.write("\n")
                 f.write("ADDR     LABEL\n")
                 
                 # Write symbols sorted by address (low to high)
-                for name, label in sorted(self.labels.items(), key=lambda x: x[1].address):
-                    f.write(f"{label.address:08X} {name}\n")
-            
-            log_info(f"Preliminary listing file generated: {listing_file}")
-            return True
-            
-        except Exception as e:
+                for name, address in sorted(self.label_addresses.items(), key=itemgetter(1)):
+                    f.write(f"{address:08X} {name}\n")
+            f.close()
+        except OSError as e:
             log_warning(f"Could not generate preliminary listing file: {e}")
-            import traceback
-            traceback.print_exc()
-            return False
\ No newline at end of file
+            return False
+        
+        if listing_file is None:
+            return False
+        log_info(f"Preliminary listing file generated: {listing_file}")
+        return True
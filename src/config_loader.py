@@ -15,6 +15,9 @@ class TASMConfig:
     _instance: Optional['TASMConfig'] = None
     _config: Dict[str, Any] = {}
     _custom_config_path: Optional[Path] = None
+    is_little_endian: bool = True  # Resolved from architecture.endianness on each load
+    _loaded_path: Optional[Path] = None  # File behind _config, and its mtime when parsed
+    _loaded_mtime_ns: int = 0
     
     def __new__(cls):
         """Singleton pattern - ensure only one config instance exists."""
@@ -41,17 +44,28 @@ class TASMConfig:
             project_root = current_dir.parent
             config_path = project_root / "config" / "tasm_config.json"
         
-        if not config_path.exists():
+        try:
+            mtime_ns = config_path.stat().st_mtime_ns
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Configuration file not found: {config_path}\n"
                 f"Please create config/tasm_config.json in the project root or specify a custom config file."
             )
         
+        # Same file, unchanged on disk: keep the parsed configuration
+        if config_path == self._loaded_path and mtime_ns == self._loaded_mtime_ns:
+            return
+        
         try:
             with open(config_path, 'r', encoding='utf-8') as f:
                 self._config = json.load(f)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in configuration file: {e}")
+        self._loaded_path = config_path
+        self._loaded_mtime_ns = mtime_ns
+        
+        # Read per instruction by the output writers, so resolve it once here
+        self.is_little_endian = self.get('architecture', 'endianness', default='little').lower() == 'little'
     
     def get(self, *keys: str, default: Any = None) -> Any:
         """
@@ -78,11 +92,6 @@ class TASMConfig:
     
     # Convenience properties for commonly used settings
     
-    @property
-    def is_little_endian(self) -> bool:
-        """Check if architecture is little-endian."""
-        return self.get('architecture', 'endianness', default='little').lower() == 'little'
-    
     @property
     def is_big_endian(self) -> bool:
         """Check if architecture is big-endian."""
@@ -158,7 +167,9 @@ class TASMConfig:
 # Global configuration instance
 def get_config() -> TASMConfig:
     """Get the global configuration instance."""
-    return TASMConfig()
+    # Hot path: skip TASMConfig.__new__ once the singleton exists
+    instance = TASMConfig._instance
+    return instance if instance is not None else TASMConfig()
 
 
 def set_config_path(config_path: str) -> None:
@@ -9,6 +9,7 @@ This module implements NASM-style data declaration directives:
 - TIMES: Repeating instructions or data
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Tuple, Optional, Union
 import struct
@@ -16,6 +17,56 @@ import re
 from numeric_parser import parse_numeric
 
 
+# Text before the first ';' outside quotes. Quotes do not escape (NASM '' and
+# "" strings), and an unterminated quote runs to the end of the line
+_CODE_RE = re.compile(r'''(?:[^"';]+|"[^"]*"?|'[^']*'?)*''')
+
+# One non-empty item of a comma-separated list; commas inside quotes do not split
+_LIST_ITEM_RE = re.compile(r'''(?:[^"',]+|"[^"]*"?|'[^']*'?)+''')
+
+# TIMES count instruction/data
+_TIMES_RE = re.compile(r'TIMES\s+(\S+)\s+(.+)', re.IGNORECASE)
+
+
+def _strip_comment(text: str) -> str:
+    """Drop the ';' comment from text, keeping any ';' inside quotes"""
+    if '"' not in text and "'" not in text:
+        # No quotes (most lines): the first ';' starts the comment
+        return text.partition(';')[0]
+    return _CODE_RE.match(text).group()
+
+
+@lru_cache(maxsize=4096)
+def _parse_literal(value_str: str) -> Union[int, float, bytes, None]:
+    """
+    Parse a string, character or floating point literal (None if it is none of them).
+    
+    These depend only on the text, unlike EQU constants and labels, so the
+    results are memoized: data sections repeat the same literals often.
+    """
+    # String literals (double quotes)
+    if value_str.startswith('"') and value_str.endswith('"'):
+        return value_str[1:-1].encode('utf-8')
+    
+    # Character literals (single quotes)
+    if value_str.startswith("'") and value_str.endswith("'"):
+        char_str = value_str[1:-1]
+        if len(char_str) == 1:
+            return ord(char_str)
+        else:
+            # Multiple characters - return as bytes
+            return char_str.encode('utf-8')
+    
+    # Floating point (check before numeric parsing)
+    if '.' in value_str or ('e' in value_str.lower() and 'h' not in value_str.lower()):
+        try:
+            return float(value_str)
+        except ValueError:
+            pass
+    
+    return None
+
+
 class DataDirective:
     """Handles NASM-compatible data directives."""
     
@@ -42,6 +93,9 @@ class DataDirective:
         'RESZ': 64,  # Reserve 64 bytes
     }
     
+    # struct codes (unsigned, signed) for the integer sizes struct can pack
+    PACK_CODES = {1: ('B', 'b'), 2: ('H', 'h'), 4: ('I', 'i'), 8: ('Q', 'q')}
+    
     def __init__(self, endianness: str = 'little', labels: dict = None):
         """
         Initialize data directive handler.
@@ -51,6 +105,12 @@ class DataDirective:
             labels: Dictionary of labels/symbols for resolution
         """
         self.endianness = endianness
+        # Byte order and struct formats for encode_data, resolved once
+        little = endianness == 'little'
+        self._byteorder = 'little' if little else 'big'
+        self._struct_prefix = '<' if little else '>'
+        self._f32_fmt = '<f' if little else '>f'
+        self._f64_fmt = '<d' if little else '>d'
         self.constants = {}  # EQU constants
         self.labels = labels or {}  # Symbol table for label resolution
     
@@ -79,25 +139,10 @@ class DataDirective:
         """
         value_str = value_str.strip()
         
-        # String literals (double quotes)
-        if value_str.startswith('"') and value_str.endswith('"'):
-            return value_str[1:-1].encode('utf-8')
-        
-        # Character literals (single quotes)
-        if value_str.startswith("'") and value_str.endswith("'"):
-            char_str = value_str[1:-1]
-            if len(char_str) == 1:
-                return ord(char_str)
-            else:
-                # Multiple characters - return as bytes
-                return char_str.encode('utf-8')
-        
-        # Floating point (check before numeric parsing)
-        if '.' in value_str or ('e' in value_str.lower() and 'h' not in value_str.lower()):
-            try:
-                return float(value_str)
-            except ValueError:
-                pass
+        # String, character and floating point literals (memoized)
+        literal = _parse_literal(value_str)
+        if literal is not None:
+            return literal
         
         # Check if it's a constant (EQU symbol) before trying numeric parsing
         if value_str in self.constants:
@@ -125,43 +170,12 @@ class DataDirective:
         
         Example: "1, 2, 'A', 0x10, \"Hello\""
         """
-        # Remove comments first
+        # Remove comments first (a ';' inside quotes is data)
         if ';' in operands_str:
-            comment_pos = operands_str.find(';')
-            # Make sure it's not inside quotes
-            in_quotes = False
-            quote_char = None
-            for i, char in enumerate(operands_str):
-                if char in ['"', "'"] and (not in_quotes or char == quote_char):
-                    in_quotes = not in_quotes
-                    if in_quotes:
-                        quote_char = char
-                elif char == ';' and not in_quotes:
-                    operands_str = operands_str[:i]
-                    break
-        
-        values = []
-        
-        # Split by commas, but respect quotes
-        in_quotes = False
-        quote_char = None
-        current = []
-        
-        for char in operands_str:
-            if char in ['"', "'"] and (not in_quotes or char == quote_char):
-                in_quotes = not in_quotes
-                if in_quotes:
-                    quote_char = char
-                current.append(char)
-            elif char == ',' and not in_quotes:
-                if current:
-                    values.append(''.join(current).strip())
-                    current = []
-            else:
-                current.append(char)
+            operands_str = _strip_comment(operands_str)
         
-        if current:
-            values.append(''.join(current).strip())
+        # Split by commas, but respect quotes (empty items are dropped)
+        values = [item.strip() for item in _LIST_ITEM_RE.findall(operands_str)]
         
         # Parse each value
         parsed_values = []
@@ -183,31 +197,46 @@ class DataDirective:
             Encoded bytes
         """
         size = self.DATA_SIZES[directive.upper()]
-        result = bytearray()
+        
+        # Fast path: an all-integer list (dd 1,2,3) is packed with one
+        # struct.pack call. Negative values use the signed code, like the
+        # signed=(value < 0) of the general loop below, so the accepted
+        # ranges are the same; out-of-range values fall through to it
+        codes = self.PACK_CODES.get(size)
+        if codes and values and all(type(value) is int for value in values):
+            prefix = self._struct_prefix
+            if min(values) >= 0:
+                fmt = f'{prefix}{len(values)}{codes[0]}'
+            else:
+                fmt = prefix + ''.join([codes[value < 0] for value in values])
+            try:
+                return struct.pack(fmt, *values)
+            except struct.error:
+                pass  # Reported with the offending value below
+        
+        # Encoded pieces, joined with one copy at the end
+        chunks = []
         
         for value in values:
             if isinstance(value, bytes):
                 # String/character data - append as-is
-                result.extend(value)
+                chunks.append(value)
             elif isinstance(value, float):
                 # Floating point encoding
                 if size == 4:
-                    result.extend(struct.pack(f'<f' if self.endianness == 'little' else '>f', value))
+                    chunks.append(struct.pack(self._f32_fmt, value))
                 elif size == 8:
-                    result.extend(struct.pack(f'<d' if self.endianness == 'little' else '>d', value))
+                    chunks.append(struct.pack(self._f64_fmt, value))
                 else:
                     raise ValueError(f"Cannot encode float with size {size}")
             elif isinstance(value, int):
                 # Integer encoding
                 try:
-                    if self.endianness == 'little':
-                        result.extend(value.to_bytes(size, 'little', signed=(value < 0)))
-                    else:
-                        result.extend(value.to_bytes(size, 'big', signed=(value < 0)))
+                    chunks.append(value.to_bytes(size, self._byteorder, signed=(value < 0)))
                 except OverflowError:
                     raise ValueError(f"Value {value} too large for {directive} (max {size} bytes)")
         
-        return bytes(result)
+        return b''.join(chunks)
     
     def calculate_size(self, line: str, current_address: int = 0) -> int:
         """
@@ -222,16 +251,7 @@ class DataDirective:
         """
         # Remove comments first (but respect quotes)
         if ';' in line:
-            in_quotes = False
-            quote_char = None
-            for i, char in enumerate(line):
-                if char in ['"', "'"] and (not in_quotes or char == quote_char):
-                    in_quotes = not in_quotes
-                    if in_quotes:
-                        quote_char = char
-                elif char == ';' and not in_quotes:
-                    line = line[:i]
-                    break
+            line = _strip_comment(line)
         
         parts = line.strip().split(None, 1)
         if not parts:
@@ -255,8 +275,16 @@ class DataDirective:
             if len(parts) < 2:
                 return 0
             
-            values = self.parse_data_list(parts[1])
+            operands = parts[1]
             size = self.DATA_SIZES[directive]
+            
+            # Without quotes every item is a number or symbol of the unit
+            # size, so counting the comma-separated items is enough
+            if ('"' not in operands and "'" not in operands and ',,' not in operands
+                    and operands[0] != ',' and operands[-1] != ','):
+                return (operands.count(',') + 1) * size
+            
+            values = self.parse_data_list(operands)
             total_size = 0
             
             for value in values:
@@ -279,8 +307,7 @@ class DataDirective:
     
     def _calculate_times_size(self, line: str, current_address: int) -> int:
         """Calculate size for TIMES directive."""
-        # TIMES count instruction/data
-        match = re.match(r'TIMES\s+(\S+)\s+(.+)', line, re.IGNORECASE)
+        match = _TIMES_RE.match(line)
         if not match:
             return 0
         
@@ -398,8 +425,7 @@ class DataDirective:
         Returns:
             Tuple of (count, data_to_repeat)
         """
-        # TIMES count instruction/data
-        match = re.match(r'TIMES\s+(\S+)\s+(.+)', line, re.IGNORECASE)
+        match = _TIMES_RE.match(line)
         if not match:
             raise ValueError(f"Invalid TIMES directive: {line}")
         
@@ -14,6 +14,7 @@ Encoding process:
 """
 
 import re
+import sys
 import logging
 from typing import List, Optional, Dict, Tuple, Union
 from dataclasses import dataclass
@@ -30,6 +31,8 @@ logger = logging.getLogger(__name__)
 @dataclass
 class ParsedOperand:
     """Represents a parsed operand with type information."""
+    __slots__ = ('text', 'type')
+    
     text: str  # Original operand text (e.g., "d4", "#1", "[a15]")
     type: str  # Operand type: 'reg_d', 'reg_a', 'reg_e', 'reg_p', 'imm'
     
@@ -40,6 +43,8 @@ class ParsedOperand:
 @dataclass
 class ParsedInstruction:
     """Represents a parsed assembly instruction."""
+    __slots__ = ('mnemonic', 'operands', 'original_line', 'line_number')
+    
     mnemonic: str  # Instruction mnemonic (e.g., "ABS")
     operands: List[ParsedOperand]  # List of typed operands
     original_line: str  # Original assembly line
@@ -119,7 +124,8 @@ class InstructionEncoder:
         if not match:
             return None
         
-        mnemonic = match.group(1).upper()
+        # Interned: the loader's lookups by mnemonic then hit on identity
+        mnemonic = sys.intern(match.group(1).upper())
         operands_str = match.group(2).strip()
         
         # Strip GCC-style annotations (e.g., #function_name or whitespace#function_name)
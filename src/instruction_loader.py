@@ -9,8 +9,12 @@ used by the instruction encoder for efficient lookup and encoding operations.
 """
 
 import pandas as pd
+import hashlib
 import json
+import os
+import pickle
 import re
+import sys
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Dict, List, Optional, Union, Any
@@ -25,6 +29,19 @@ try:
 except ImportError:
     CONFIG_AVAILABLE = False
 
+# On-disk cache of parsed instruction sets, keyed by file content and by
+# this module's mtime (so edits to InstructionDefinition or the parsers
+# invalidate it). ISET_CACHE_VERSION can still force a reset.
+ISET_CACHE_VERSION = 1
+ISET_CACHE_DIR = Path.home() / '.cache' / 'tasm' / 'isets'
+_iset_cache_enabled = True
+
+
+def set_instruction_set_cache(enabled: bool) -> None:
+    """Enable or disable the on-disk instruction set cache (TASM --no-cache)"""
+    global _iset_cache_enabled
+    _iset_cache_enabled = enabled
+
 
 @dataclass
 class InstructionDefinition:
@@ -208,24 +225,80 @@ class InstructionSetLoader:
     def load_instruction_set(self, file_path: Union[str, Path]) -> bool:
         """
         Delegates to the appropriate private loader based on file extension.
+        
+        Parsed instruction sets are cached on disk (see ISET_CACHE_DIR), so
+        unchanged files are not re-parsed on later runs.
         """
         if isinstance(file_path, str):
             file_path = Path(file_path)
+        
+        cache_file = self._cache_file(file_path)
+        if cache_file is not None and self._load_cache(cache_file):
+            logger.info(f"Loaded instruction set from cache: {cache_file}")
+            return True
+        
         try:
             if file_path.suffix.lower() in ['.xlsx', '.xls']:
-                return self._load_excel(file_path)
+                loaded = self._load_excel(file_path)
             elif file_path.suffix.lower() == '.csv':
-                return self._load_csv(file_path)
+                loaded = self._load_csv(file_path)
             elif file_path.suffix.lower() == '.json':
-                return self._load_json(file_path)
+                loaded = self._load_json(file_path)
             elif file_path.suffix.lower() == '.xml':
-                return self._load_xml(file_path)
+                loaded = self._load_xml(file_path)
             else:
                 logger.error(f"Unsupported file format: {file_path.suffix}")
                 return False
         except Exception as e:
             logger.error(f"Failed to load instruction set from {file_path}: {e}")
             return False
+        
+        if loaded and cache_file is not None:
+            self._save_cache(cache_file)
+        return loaded
+    
+    @staticmethod
+    def _cache_file(file_path: Path) -> Optional[Path]:
+        """Cache file for an instruction set, keyed by its content, or None if unreadable or disabled."""
+        if not _iset_cache_enabled:
+            return None
+        try:
+            digest = hashlib.blake2b(file_path.read_bytes(), digest_size=8)
+            module_mtime = Path(__file__).stat().st_mtime_ns
+        except OSError:
+            return None
+        digest.update(f"{ISET_CACHE_VERSION}:{module_mtime}:{file_path.suffix.lower()}".encode())
+        return ISET_CACHE_DIR / f"{digest.hexdigest()}.pkl"
+    
+    def _load_cache(self, cache_file: Path) -> bool:
+        """Restore parsed instructions from the cache. Returns False on a miss."""
+        try:
+            with open(cache_file, 'rb') as f:
+                instructions, instruction_list = pickle.load(f)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable instruction set cache {cache_file}: {e}")
+            return False
+        # Unpickled keys are fresh strings; intern them like freshly loaded ones
+        self.instructions = {sys.intern(mnemonic): variants for mnemonic, variants in instructions.items()}
+        self._instruction_list = instruction_list
+        return bool(instruction_list)
+    
+    def _save_cache(self, cache_file: Path) -> None:
+        """Write parsed instructions to the cache (best effort)."""
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, 'wb') as f:
+                pickle.dump((self.instructions, self._instruction_list), f, protocol=5)
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            logger.debug(f"Could not write instruction set cache {cache_file}: {e}")
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
 
     def split_compound_operands(self, operand_str: str) -> List[str]:
         """
@@ -373,7 +446,7 @@ class InstructionSetLoader:
                     )
                     
                     # Add to instruction dictionary (grouped by mnemonic)
-                    mnemonic = instruction.instruction.upper()
+                    mnemonic = sys.intern(instruction.instruction.upper())
                     if mnemonic not in self.instructions:
                         self.instructions[mnemonic] = []
                     self.instructions[mnemonic].append(instruction)
@@ -435,7 +508,7 @@ class InstructionSetLoader:
                     op5_len=instr_data.get('op5_len', 0)
                 )
                 
-                mnemonic = instruction.instruction.upper()
+                mnemonic = sys.intern(instruction.instruction.upper())
                 if mnemonic not in self.instructions:
                     self.instructions[mnemonic] = []
                 self.instructions[mnemonic].append(instruction)
@@ -486,7 +559,7 @@ class InstructionSetLoader:
                     op5_len=int(instr_elem.get('op5_len', 0))
                 )
                 
-                mnemonic = instruction.instruction.upper()
+                mnemonic = sys.intern(instruction.instruction.upper())
                 if mnemonic not in self.instructions:
                     self.instructions[mnemonic] = []
                 self.instructions[mnemonic].append(instruction)
@@ -502,7 +575,11 @@ class InstructionSetLoader:
     
     def get_instruction_variants(self, mnemonic: str) -> List[InstructionDefinition]:
         """Get all variants of an instruction by mnemonic."""
-        return self.instructions.get(mnemonic.upper(), [])
+        # Parsed mnemonics are already upper case; skip the copy made by upper()
+        variants = self.instructions.get(mnemonic)
+        if variants is None:
+            variants = self.instructions.get(mnemonic.upper(), [])
+        return variants
     
     def get_all_instructions(self) -> List[InstructionDefinition]:
         """Get all loaded instruction definitions."""
@@ -537,7 +614,7 @@ class InstructionSetLoader:
         
         # TEMPORARY: For LOOP instructions with labels, always use the largest variant
         # This ensures that large branch displacements can be encoded
-        if mnemonic.upper() == 'LOOP' and operands:
+        if operands and mnemonic.upper() == 'LOOP':
             operand_strs = [op.text if hasattr(op, 'text') else str(op) for op in operands]
             # Check if any operand looks like a label (not a register or immediate)
             has_label = False
@@ -8,9 +8,12 @@ combining object files, and generating the final executable binary.
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Set
 from dataclasses import dataclass
+from bisect import bisect_right
 import re
+import struct
+import threading
 
-from logger import log_info, log_error, log_warning, log_debug, log_abort, get_logger
+from logger import log_info, log_error, log_warning, log_debug, log_abort, get_logger, LogLevel
 from config_loader import get_config
 
 try:
@@ -18,7 +21,39 @@ try:
     INTELHEX_AVAILABLE = True
 except ImportError:
     INTELHEX_AVAILABLE = False
-    log_warning("intelhex library not available, falling back to custom implementation")
+
+# Output format -> name used in log messages
+_FORMAT_NAMES = {'bin': 'binary', 'hex': 'Intel HEX', 'txt': 'plain text'}
+
+# TOBJ object file records (little endian), as written by AssemblerEngine
+_OBJ_INSTRUCTION = struct.Struct('<IIBIH')  # address, opcode, size, line, text length
+_OBJ_SYMBOL = struct.Struct('<II')          # address, line (after a length-prefixed name)
+_OBJ_U16 = struct.Struct('<H')
+_OBJ_U32 = struct.Struct('<I')
+_OBJ_I32 = struct.Struct('<i')
+
+
+def _read_named_record(data: bytes, pos: int) -> Tuple[str, int, int, int]:
+    """Read a label/symbol record at pos: (name, address, line, next position)"""
+    name_len, = _OBJ_U16.unpack_from(data, pos)
+    pos += 2
+    name = data[pos:pos + name_len].decode('utf-8')
+    pos += name_len
+    address, line_num = _OBJ_SYMBOL.unpack_from(data, pos)
+    return name, address, line_num, pos + _OBJ_SYMBOL.size
+
+
+# Buffer size for output files (fully buffered: hex/txt/map/listing emit many short lines)
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+
+def _format_opcode(opcode: int, size: int, byteorder: str) -> str:
+    """Opcode bytes for the listing CODE column, in memory order (blank for odd sizes)"""
+    if size == 1:
+        return f"{opcode:02X}"
+    if size == 2 or size == 4:
+        return (opcode & ((1 << (size * 8)) - 1)).to_bytes(size, byteorder).hex(' ').upper()
+    return ""
 
 @dataclass
 class ObjectFile:
@@ -55,6 +90,7 @@ class Linker:
         self.max_addr = 0
         self.instruction_count = 0
         self.map_file_path = None
+        self.bytes_written = 0  # Size of the generated output file
         
     def link_files(self, object_files: List[Path], output_file: Path, 
                   base_address: int = 0x8000, output_format: str = 'bin', force_32bit: bool = False,
@@ -98,16 +134,17 @@ class Linker:
         for obj_file in self.object_files:
             updated_labels = {}
             
+            instruction_lines = obj_file.instruction_lines
             for label_name, label_addr in obj_file.labels.items():
                 label_line = obj_file.label_lines[label_name]
                 
                 # Find the first instruction AFTER this label's line number
+                # (instructions are stored in source order)
                 next_inst_addr = None
-                for idx, inst_line in enumerate(obj_file.instruction_lines):
-                    if inst_line > label_line:
-                        next_inst_addr = obj_file.instructions[idx][0]
-                        log_info(f"  Label '{label_name}' (line {label_line}) -> instruction at line {inst_line}, address 0x{next_inst_addr:08X}")
-                        break
+                idx = bisect_right(instruction_lines, label_line)
+                if idx < len(instruction_lines):
+                    next_inst_addr = obj_file.instructions[idx][0]
+                    log_info(f"  Label '{label_name}' (line {label_line}) -> instruction at line {instruction_lines[idx]}, address 0x{next_inst_addr:08X}")
                 
                 if next_inst_addr is not None:
                     updated_labels[label_name] = next_inst_addr
@@ -159,84 +196,80 @@ class Linker:
             return False
         
         try:
-            with open(obj_file, 'rb') as f:
-                # Read TOBJ header
-                magic = f.read(4)
-                if magic != b'TOBJ':
-                    log_error(f"Invalid object file format: {obj_file.name}", 
-                             str(obj_file), error_code="INVALID_OBJECT_FORMAT")
-                    return False
-                
-                version = f.read(2)
-                if version != b'\x01\x00':
-                    log_error(f"Unsupported object file version: {obj_file.name}", 
-                             str(obj_file), error_code="UNSUPPORTED_VERSION")
-                    return False
-                
-                # Read source file name
-                name_len = int.from_bytes(f.read(2), 'little')
-                source_name = f.read(name_len).decode('utf-8')
-                
-                # Read instruction count
-                instruction_count = int.from_bytes(f.read(4), 'little')
-                
-                # Read instructions
-                instructions = []
-                instruction_lines = []
-                for _ in range(instruction_count):
-                    address = int.from_bytes(f.read(4), 'little')
-                    opcode = int.from_bytes(f.read(4), 'little')
-                    size = int.from_bytes(f.read(1), 'little')
-                    line_num = int.from_bytes(f.read(4), 'little')  # Read source line number
-                    
-                    # Read source text
-                    text_len = int.from_bytes(f.read(2), 'little')
-                    source_text = f.read(text_len).decode('utf-8')
-                    
-                    # Store instruction and its line number separately
-                    instructions.append((address, opcode, None, source_text, size))
-                    instruction_lines.append(line_num)
-                    log_debug(f"Loaded instruction at line {line_num}: 0x{address:08X} = 0x{opcode:08X} (size: {size} bytes)")
-                
-                # Read label count and labels
-                label_count = int.from_bytes(f.read(4), 'little')
-                labels = {}
-                label_lines = {}
-                for _ in range(label_count):
-                    name_len = int.from_bytes(f.read(2), 'little')
-                    label_name = f.read(name_len).decode('utf-8')
-                    address = int.from_bytes(f.read(4), 'little')
-                    line_num = int.from_bytes(f.read(4), 'little')  # Read label line number
-                    labels[label_name] = address
-                    label_lines[label_name] = line_num
-                    log_debug(f"Found label '{label_name}' at line {line_num}: 0x{address:08X}")
+            data = obj_file.read_bytes()
+            
+            # Read TOBJ header
+            if data[:4] != b'TOBJ':
+                log_error(f"Invalid object file format: {obj_file.name}", 
+                         str(obj_file), error_code="INVALID_OBJECT_FORMAT")
+                return False
+            
+            if data[4:6] != b'\x01\x00':
+                log_error(f"Unsupported object file version: {obj_file.name}", 
+                         str(obj_file), error_code="UNSUPPORTED_VERSION")
+                return False
+            
+            # Read source file name
+            name_len, = _OBJ_U16.unpack_from(data, 6)
+            pos = 8 + name_len
+            source_name = data[8:pos].decode('utf-8')
+            
+            # Read instruction count
+            instruction_count, = _OBJ_U32.unpack_from(data, pos)
+            pos += 4
+            
+            # Read instructions
+            instructions = []
+            instruction_lines = []
+            unpack_instruction = _OBJ_INSTRUCTION.unpack_from
+            record_size = _OBJ_INSTRUCTION.size
+            for _ in range(instruction_count):
+                address, opcode, size, line_num, text_len = unpack_instruction(data, pos)
+                pos += record_size
                 
-                # Read symbol count and symbols
-                symbol_count = int.from_bytes(f.read(4), 'little')
-                unresolved_symbols = []
-                for _ in range(symbol_count):
-                    name_len = int.from_bytes(f.read(2), 'little')
-                    symbol_name = f.read(name_len).decode('utf-8')
-                    address = int.from_bytes(f.read(4), 'little')
-                    line_ref = int.from_bytes(f.read(4), 'little')
-                    unresolved_symbols.append((symbol_name, line_ref))
-                    log_debug(f"Found unresolved symbol: {symbol_name}")
+                # Read source text
+                source_text = data[pos:pos + text_len].decode('utf-8')
+                pos += text_len
                 
-                # Read constant count and constants (EQU directives)
-                constants = {}
-                const_count = int.from_bytes(f.read(4), 'little')
-                for _ in range(const_count):
-                    name_len = int.from_bytes(f.read(2), 'little')
-                    const_name = f.read(name_len).decode('utf-8')
-                    # Read as unsigned, then convert to signed if needed (for Python compatibility)
-                    const_value_unsigned = int.from_bytes(f.read(4), 'little', signed=False)
-                    # If high bit is set, interpret as signed negative
-                    if const_value_unsigned >= 0x80000000:
-                        const_value = const_value_unsigned - 0x100000000
-                    else:
-                        const_value = const_value_unsigned
-                    constants[const_name] = const_value
-                    log_debug(f"Found constant '{const_name}' = {const_value}")
+                # Store instruction and its line number separately
+                instructions.append((address, opcode, None, source_text, size))
+                instruction_lines.append(line_num)
+                log_debug(f"Loaded instruction at line {line_num}: 0x{address:08X} = 0x{opcode:08X} (size: {size} bytes)")
+            
+            # Read label count and labels
+            label_count, = _OBJ_U32.unpack_from(data, pos)
+            pos += 4
+            labels = {}
+            label_lines = {}
+            for _ in range(label_count):
+                label_name, address, line_num, pos = _read_named_record(data, pos)
+                labels[label_name] = address
+                label_lines[label_name] = line_num
+                log_debug(f"Found label '{label_name}' at line {line_num}: 0x{address:08X}")
+            
+            # Read symbol count and symbols
+            symbol_count, = _OBJ_U32.unpack_from(data, pos)
+            pos += 4
+            unresolved_symbols = []
+            for _ in range(symbol_count):
+                symbol_name, address, line_ref, pos = _read_named_record(data, pos)
+                unresolved_symbols.append((symbol_name, line_ref))
+                log_debug(f"Found unresolved symbol: {symbol_name}")
+            
+            # Read constant count and constants (EQU directives)
+            constants = {}
+            const_count, = _OBJ_U32.unpack_from(data, pos)
+            pos += 4
+            for _ in range(const_count):
+                name_len, = _OBJ_U16.unpack_from(data, pos)
+                pos += 2
+                const_name = data[pos:pos + name_len].decode('utf-8')
+                pos += name_len
+                # Stored as 32 bits; a set high bit means a negative value
+                const_value, = _OBJ_I32.unpack_from(data, pos)
+                pos += 4
+                constants[const_name] = const_value
+                log_debug(f"Found constant '{const_name}' = {const_value}")
             
             # Calculate code size
             code_size = len(instructions)
@@ -689,12 +722,7 @@ class Linker:
     
     def _generate_output(self, output_file: Path, output_format: str) -> bool:
         """Generate final output in specified format"""
-        if output_format == 'hex':
-            log_debug("Generating Intel HEX output")
-        elif output_format == 'txt':
-            log_debug("Generating plain text output")
-        else:
-            log_debug("Generating binary output")
+        log_debug(f"Generating {_FORMAT_NAMES.get(output_format, 'binary')} output")
         
         try:
             # Collect all instructions sorted by address
@@ -736,196 +764,205 @@ class Linker:
             if not self._check_address_conflicts(all_instructions):
                 return False
             
-            # Generate memory image
-            memory_image = {}
-            config = get_config()
+            # The final listing only reads the linked instructions and symbol
+            # table, so it is written on a helper thread while the output and
+            # map files are generated; its result is logged after the join
+            listing_file = output_file.parent / (output_file.stem + '.lst')
+            listing_result: List[Tuple[LogLevel, str]] = []
+            listing_thread = threading.Thread(
+                target=lambda: listing_result.append(self._generate_listing_file(listing_file, all_instructions)),
+                name="tasm-listing")
+            listing_thread.start()
+            try:
+                success = self._write_output_files(output_file, output_format, all_instructions)
+            finally:
+                listing_thread.join()
+            if listing_result:
+                get_logger().log(*listing_result[0])
             
-            # Import data directive handler for re-encoding data directives
-            from data_directives import DataDirective
-            endianness = 'little' if config.is_little_endian else 'big'
-            data_handler = DataDirective(endianness=endianness, labels=self.global_symbols)
+            return success
             
-            # Collect all constants from object files and add to data handler
-            for obj_file in self.object_files:
-                data_handler.constants.update(obj_file.constants)
+        except Exception as e:
+            log_error(f"Error generating binary: {str(e)}", 
+                     str(output_file), error_code="BINARY_GENERATION_ERROR")
+            return False
+    
+    def _write_output_files(self, output_file: Path, output_format: str, all_instructions: List[Tuple]) -> bool:
+        """Build the memory image and write the output and map files"""
+        # Generate memory image
+        memory_image = {}
+        config = get_config()
+        
+        # Import data directive handler for re-encoding data directives
+        from data_directives import DataDirective
+        endianness = 'little' if config.is_little_endian else 'big'
+        data_handler = DataDirective(endianness=endianness, labels=self.global_symbols)
+        
+        # Collect all constants from object files and add to data handler
+        for obj_file in self.object_files:
+            data_handler.constants.update(obj_file.constants)
+        
+        for address, opcode, operand, source_text, source_file, size in all_instructions:
+            # Check if this is a data directive by looking at the source
+            parts = source_text.strip().split(maxsplit=1)
+            directive = parts[0].upper() if parts else ''
             
-            for address, opcode, operand, source_text, source_file, size in all_instructions:
-                # Check if this is a data directive by looking at the source
-                parts = source_text.strip().split(maxsplit=1)
-                directive = parts[0].upper() if parts else ''
-                
-                # Check if it's a data directive (DB, DW, DD, etc., RESB, TIMES, INCBIN)
-                is_data_directive = (directive in data_handler.DATA_SIZES or 
-                                    directive in data_handler.RESERVE_SIZES or
-                                    directive in ['TIMES', 'INCBIN'])
-                
-                if is_data_directive:
-                    # Re-encode the data directive to get full data
-                    try:
-                        # Calculate size first
-                        size = data_handler.calculate_size(source_text, address)
-                        
-                        # Handle different directive types
-                        if directive in data_handler.RESERVE_SIZES:
-                            # RESB/RESW etc - write zeros
-                            if size > 10000000:  # Safety check for huge allocations (10MB)
-                                log_error(f"RESB size too large: {size} bytes at 0x{address:08X}")
-                                return False
+            # Check if it's a data directive (DB, DW, DD, etc., RESB, TIMES, INCBIN)
+            is_data_directive = (directive in data_handler.DATA_SIZES or 
+                                directive in data_handler.RESERVE_SIZES or
+                                directive in ['TIMES', 'INCBIN'])
+            
+            if is_data_directive:
+                # Re-encode the data directive to get full data
+                try:
+                    # Calculate size first
+                    size = data_handler.calculate_size(source_text, address)
+                    
+                    # Handle different directive types
+                    if directive in data_handler.RESERVE_SIZES:
+                        # RESB/RESW etc - write zeros
+                        if size > 10000000:  # Safety check for huge allocations (10MB)
+                            log_error(f"RESB size too large: {size} bytes at 0x{address:08X}")
+                            return False
+                        for i in range(size):
+                            memory_image[address + i] = 0
+                    elif directive == 'TIMES':
+                        # TIMES - parse count and data, then repeat
+                        count, rest = data_handler.process_times(source_text, address)
+                        # Parse the repeated directive
+                        rest_parts = rest.strip().split(maxsplit=1)
+                        rest_directive = rest_parts[0].upper() if rest_parts else ''
+                        if rest_directive in data_handler.DATA_SIZES:
+                            rest_operands = rest_parts[1] if len(rest_parts) > 1 else ''
+                            values = data_handler.parse_data_list(rest_operands)
+                            single_data = data_handler.encode_data(rest_directive, values)
+                            # Repeat the data 'count' times
+                            offset = 0
+                            for _ in range(count):
+                                for byte_val in single_data:
+                                    memory_image[address + offset] = byte_val
+                                    offset += 1
+                        else:
+                            # Can't encode, fill with zeros
                             for i in range(size):
                                 memory_image[address + i] = 0
-                        elif directive == 'TIMES':
-                            # TIMES - parse count and data, then repeat
-                            count, rest = data_handler.process_times(source_text, address)
-                            # Parse the repeated directive
-                            rest_parts = rest.strip().split(maxsplit=1)
-                            rest_directive = rest_parts[0].upper() if rest_parts else ''
-                            if rest_directive in data_handler.DATA_SIZES:
-                                rest_operands = rest_parts[1] if len(rest_parts) > 1 else ''
-                                values = data_handler.parse_data_list(rest_operands)
-                                single_data = data_handler.encode_data(rest_directive, values)
-                                # Repeat the data 'count' times
-                                offset = 0
-                                for _ in range(count):
-                                    for byte_val in single_data:
-                                        memory_image[address + offset] = byte_val
-                                        offset += 1
-                            else:
-                                # Can't encode, fill with zeros
-                                for i in range(size):
-                                    memory_image[address + i] = 0
-                        elif directive in data_handler.DATA_SIZES:
-                            # DB, DW, DD etc - re-encode the data
-                            operands = parts[1] if len(parts) > 1 else ''
-                            values = data_handler.parse_data_list(operands)
-                            data = data_handler.encode_data(directive, values)
-                            for i, byte_val in enumerate(data):
-                                memory_image[address + i] = byte_val
-                        elif directive == 'INCBIN':
-                            # INCBIN - read the binary file
-                            from pathlib import Path
-                            operands = parts[1] if len(parts) > 1 else ''
-                            # Determine base directory from source file
-                            source_path = Path(source_file) if source_file else None
-                            base_dir = source_path.parent if source_path and source_path.is_absolute() else None
-                            data = data_handler.process_incbin(operands, base_dir)
-                            for i, byte_val in enumerate(data):
-                                memory_image[address + i] = byte_val
-                    except Exception as e:
-                        log_warning(f"Failed to re-encode data directive at 0x{address:08X}: {e}")
-                        # Fall back to opcode-based encoding
-                        is_data_directive = False
-                
-                if not is_data_directive:
-                    # Regular instruction - store opcode bytes according to configured endianness
-                    # For TriCore and little-endian architectures, the LSB comes first
-                    if config.is_little_endian:
-                        # Little-endian: LSB at lower address
-                        memory_image[address] = opcode & 0xFF
-                        memory_image[address + 1] = (opcode >> 8) & 0xFF
-                        memory_image[address + 2] = (opcode >> 16) & 0xFF
-                        memory_image[address + 3] = (opcode >> 24) & 0xFF
-                    else:
-                        # Big-endian: MSB at lower address
-                        memory_image[address] = (opcode >> 24) & 0xFF
-                        memory_image[address + 1] = (opcode >> 16) & 0xFF
-                        memory_image[address + 2] = (opcode >> 8) & 0xFF
-                        memory_image[address + 3] = opcode & 0xFF
-                
-                # Note: TriCore instructions don't use separate operands, 
-                # everything is encoded in the 32-bit opcode
+                    elif directive in data_handler.DATA_SIZES:
+                        # DB, DW, DD etc - re-encode the data
+                        operands = parts[1] if len(parts) > 1 else ''
+                        values = data_handler.parse_data_list(operands)
+                        data = data_handler.encode_data(directive, values)
+                        for i, byte_val in enumerate(data):
+                            memory_image[address + i] = byte_val
+                    elif directive == 'INCBIN':
+                        # INCBIN - read the binary file
+                        from pathlib import Path
+                        operands = parts[1] if len(parts) > 1 else ''
+                        # Determine base directory from source file
+                        source_path = Path(source_file) if source_file else None
+                        base_dir = source_path.parent if source_path and source_path.is_absolute() else None
+                        data = data_handler.process_incbin(operands, base_dir)
+                        for i, byte_val in enumerate(data):
+                            memory_image[address + i] = byte_val
+                except Exception as e:
+                    log_warning(f"Failed to re-encode data directive at 0x{address:08X}: {e}")
+                    # Fall back to opcode-based encoding
+                    is_data_directive = False
             
-            # Write binary file
-            output_file.parent.mkdir(parents=True, exist_ok=True)
+            if not is_data_directive:
+                # Regular instruction - store opcode bytes according to configured endianness
+                # For TriCore and little-endian architectures, the LSB comes first
+                if endianness == 'little':
+                    # Little-endian: LSB at lower address
+                    memory_image[address] = opcode & 0xFF
+                    memory_image[address + 1] = (opcode >> 8) & 0xFF
+                    memory_image[address + 2] = (opcode >> 16) & 0xFF
+                    memory_image[address + 3] = (opcode >> 24) & 0xFF
+                else:
+                    # Big-endian: MSB at lower address
+                    memory_image[address] = (opcode >> 24) & 0xFF
+                    memory_image[address + 1] = (opcode >> 16) & 0xFF
+                    memory_image[address + 2] = (opcode >> 8) & 0xFF
+                    memory_image[address + 3] = opcode & 0xFF
             
-            if output_format == 'hex':
-                # Generate Intel HEX format
-                if not self._generate_intel_hex(memory_image, output_file):
-                    return False
-                    
-                # Write map file
-                map_file = output_file.with_suffix('.map')
-                self._write_map_file(map_file, all_instructions)
-                
-                min_addr = min(memory_image.keys())
-                max_addr = max(memory_image.keys())
-                
-                # Store statistics for console output
-                self.min_addr = min_addr
-                self.max_addr = max_addr
-                self.instruction_count = len(all_instructions)
-                self.map_file_path = str(map_file)
-                
-                log_info(f"Memory range: 0x{min_addr:08X} - 0x{max_addr:08X}")
-                log_info(f"Data bytes: {len(memory_image)} bytes")
-                log_info(f"Map file generated: {map_file}")
-                
-                # Generate listing file with final linked addresses
-                listing_file = output_file.parent / (output_file.stem + '.lst')
-                self._generate_listing_file(listing_file, all_instructions)
-            elif output_format == 'txt':
-                # Generate plain text format with ADDRESS INSTRUCTION
-                if not self._generate_plain_text(all_instructions, output_file):
-                    return False
-                    
-                # Write map file
-                map_file = output_file.with_suffix('.map')
-                self._write_map_file(map_file, all_instructions)
-                
-                min_addr = all_instructions[0][0]
-                max_addr = all_instructions[-1][0] + 3  # Add 4 bytes for last instruction
-                
-                # Store statistics for console output
-                self.min_addr = min_addr
-                self.max_addr = max_addr
-                self.instruction_count = len(all_instructions)
-                self.map_file_path = str(map_file)
-                
-                log_info(f"Text file generated: {output_file}")
-                log_info(f"Memory range: 0x{min_addr:08X} - 0x{max_addr:08X}")
-                log_info(f"Instructions: {len(all_instructions)}")
-                log_info(f"Map file generated: {map_file}")
-                
-                # Generate listing file with final linked addresses
-                listing_file = output_file.parent / (output_file.stem + '.lst')
-                self._generate_listing_file(listing_file, all_instructions)
-            else:
-                # Generate binary format
-                min_addr = min(memory_image.keys())
-                max_addr = max(memory_image.keys())
-                
-                binary_data = bytearray(max_addr - min_addr + 1)
-                
-                for addr, byte_val in memory_image.items():
-                    binary_data[addr - min_addr] = byte_val
-                
-                with open(output_file, 'wb') as f:
-                    f.write(binary_data)
-                
-                # Write map file
-                map_file = output_file.with_suffix('.map')
-                self._write_map_file(map_file, all_instructions)
-                
-                # Store statistics for console output
-                self.min_addr = min_addr
-                self.max_addr = max_addr
-                self.instruction_count = len(all_instructions)
-                self.map_file_path = str(map_file)
+            # Note: TriCore instructions don't use separate operands, 
+            # everything is encoded in the 32-bit opcode
+        
+        # Write binary file
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        
+        if output_format == 'hex':
+            # Generate Intel HEX format
+            if not self._generate_intel_hex(memory_image, output_file):
+                return False
                 
-                log_info(f"Binary file generated: {output_file}")
-                log_info(f"Memory range: 0x{min_addr:08X} - 0x{max_addr:08X}")
-                log_info(f"Binary size: {len(binary_data)} bytes")
-                log_info(f"Map file generated: {map_file}")
+            # Write map file
+            map_file = output_file.with_suffix('.map')
+            self._write_map_file(map_file, all_instructions)
+            
+            min_addr = min(memory_image.keys())
+            max_addr = max(memory_image.keys())
+            
+            # Store statistics for console output
+            self.min_addr = min_addr
+            self.max_addr = max_addr
+            self.instruction_count = len(all_instructions)
+            self.map_file_path = str(map_file)
+            
+            log_info(f"Memory range: 0x{min_addr:08X} - 0x{max_addr:08X}")
+            log_info(f"Data bytes: {len(memory_image)} bytes")
+            log_info(f"Map file generated: {map_file}")
+        elif output_format == 'txt':
+            # Generate plain text format with ADDRESS INSTRUCTION
+            if not self._generate_plain_text(all_instructions, output_file):
+                return False
                 
-                # Generate listing file with final linked addresses
-                listing_file = output_file.parent / (output_file.stem + '.lst')
-                self._generate_listing_file(listing_file, all_instructions)
+            # Write map file
+            map_file = output_file.with_suffix('.map')
+            self._write_map_file(map_file, all_instructions)
             
-            return True
+            min_addr = all_instructions[0][0]
+            max_addr = all_instructions[-1][0] + 3  # Add 4 bytes for last instruction
             
-        except Exception as e:
-            log_error(f"Error generating binary: {str(e)}", 
-                     str(output_file), error_code="BINARY_GENERATION_ERROR")
-            return False
+            # Store statistics for console output
+            self.min_addr = min_addr
+            self.max_addr = max_addr
+            self.instruction_count = len(all_instructions)
+            self.map_file_path = str(map_file)
+            
+            log_info(f"Text file generated: {output_file}")
+            log_info(f"Memory range: 0x{min_addr:08X} - 0x{max_addr:08X}")
+            log_info(f"Instructions: {len(all_instructions)}")
+            log_info(f"Map file generated: {map_file}")
+        else:
+            # Generate binary format
+            min_addr = min(memory_image.keys())
+            max_addr = max(memory_image.keys())
+            
+            binary_data = bytearray(max_addr - min_addr + 1)
+            
+            for addr, byte_val in memory_image.items():
+                binary_data[addr - min_addr] = byte_val
+            
+            with open(output_file, 'wb', buffering=OUTPUT_BUFFER_SIZE) as f:
+                f.write(binary_data)
+            self.bytes_written = len(binary_data)
+            
+            # Write map file
+            map_file = output_file.with_suffix('.map')
+            self._write_map_file(map_file, all_instructions)
+            
+            # Store statistics for console output
+            self.min_addr = min_addr
+            self.max_addr = max_addr
+            self.instruction_count = len(all_instructions)
+            self.map_file_path = str(map_file)
+            
+            log_info(f"Binary file generated: {output_file}")
+            log_info(f"Memory range: 0x{min_addr:08X} - 0x{max_addr:08X}")
+            log_info(f"Binary size: {len(binary_data)} bytes")
+            log_info(f"Map file generated: {map_file}")
+        
+        return True
     
     def _check_address_conflicts(self, instructions: List[Tuple]) -> bool:
         """Check for overlapping addresses"""
@@ -962,7 +999,8 @@ class Linker:
         
         return True
     
-    def _update_listing_from_ls1(self, ls1_file: Path, listing_file: Path, all_instructions: List[Tuple]) -> bool:
+    def _update_listing_from_ls1(self, ls1_file: Path, listing_file: Path,
+                                 all_instructions: List[Tuple]) -> Tuple[LogLevel, str]:
         """
         Update preliminary listing (.ls1) with final linked addresses to create final .lst file.
         
@@ -973,6 +1011,9 @@ class Linker:
             ls1_file: Input preliminary listing file
             listing_file: Output final listing file
             all_instructions: List of final instructions with linked addresses
+            
+        Returns:
+            (level, message) to log; runs on the listing thread, which does not log itself
         """
         try:
             from datetime import datetime
@@ -987,15 +1028,15 @@ class Linker:
                         line_num = obj_file.instruction_lines[idx]
                         line_to_final_instruction[line_num] = (address, opcode, size)
             
-            # Get config for endianness
-            config = get_config()
+            # Byte order for the opcode bytes, resolved once for the whole listing
+            byteorder = 'little' if get_config().is_little_endian else 'big'
             
             # Read the .ls1 file
             with open(ls1_file, 'r', encoding='utf-8') as f:
                 ls1_lines = f.readlines()
             
             # Write updated .lst file
-            with open(listing_file, 'w', encoding='utf-8') as f:
+            with open(listing_file, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as f:
                 # Update timestamp but keep same format
                 timestamp = datetime.now().strftime('%m/%d/%y  %H:%M:%S')
                 
@@ -1050,30 +1091,7 @@ class Linker:
                                     addr_str = f"{address:08X}"
                                     
                                     # Format opcode bytes
-                                    code_bytes = []
-                                    if size == 1:
-                                        code_bytes.append(f"{opcode:02X}")
-                                    elif size == 2:
-                                        if config.is_little_endian:
-                                            code_bytes.append(f"{opcode & 0xFF:02X}")
-                                            code_bytes.append(f"{(opcode >> 8) & 0xFF:02X}")
-                                        else:
-                                            code_bytes.append(f"{(opcode >> 8) & 0xFF:02X}")
-                                            code_bytes.append(f"{opcode & 0xFF:02X}")
-                                    elif size == 4:
-                                        if config.is_little_endian:
-                                            code_bytes.append(f"{opcode & 0xFF:02X}")
-                                            code_bytes.append(f"{(opcode >> 8) & 0xFF:02X}")
-                                            code_bytes.append(f"{(opcode >> 16) & 0xFF:02X}")
-                                            code_bytes.append(f"{(opcode >> 24) & 0xFF:02X}")
-                                        else:
-                                            code_bytes.append(f"{(opcode >> 24) & 0xFF:02X}")
-                                            code_bytes.append(f"{(opcode >> 16) & 0xFF:02X}")
-                                            code_bytes.append(f"{(opcode >> 8) & 0xFF:02X}")
-                                            code_bytes.append(f"{opcode & 0xFF:02X}")
-                                    
-                                    code_str = ' '.join(code_bytes)
-                                    code_str = f"{code_str:<12}"
+                                    code_str = f"{_format_opcode(opcode, size, byteorder):<12}"
                                     
                                     line_str = f"{line_num:5d}"
                                     
@@ -1086,16 +1104,14 @@ class Linker:
                     # Pass through unchanged
                     f.write(line)
             
-            log_info(f"Final listing file generated from {ls1_file.name}: {listing_file}")
-            return True
+            return LogLevel.INFO, f"Final listing file generated from {ls1_file.name}: {listing_file}"
             
         except Exception as e:
-            log_warning(f"Could not update listing from .ls1: {e}")
             import traceback
             traceback.print_exc()
-            return False
+            return LogLevel.WARNING, f"Could not update listing from .ls1: {e}"
     
-    def _generate_listing_file(self, listing_file: Path, all_instructions: List[Tuple]) -> bool:
+    def _generate_listing_file(self, listing_file: Path, all_instructions: List[Tuple]) -> Tuple[LogLevel, str]:
         """
         Generate final listing file (.lst) after linking with correct addresses.
         
@@ -1113,6 +1129,9 @@ class Linker:
         Args:
             listing_file: Path to output .lst file
             all_instructions: List of (address, opcode, operand, source_text, source_file, size)
+            
+        Returns:
+            (level, message) to log; a failure is reported as a warning (non-fatal)
         """
         try:
             from datetime import datetime
@@ -1135,10 +1154,10 @@ class Linker:
                         line_num = obj_file.instruction_lines[idx]
                         instruction_line_map[(address, opcode)] = line_num
             
-            # Get config for endianness
-            config = get_config()
+            # Byte order for the opcode bytes, resolved once for the whole listing
+            byteorder = 'little' if get_config().is_little_endian else 'big'
             
-            with open(listing_file, 'w', encoding='utf-8') as f:
+            with open(listing_file, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as f:
                 # Page 1: Code Listing
                 timestamp = datetime.now().strftime('%m/%d/%y  %H:%M:%S')
                 f.write(f"TASM Assembler  Version 1.0.0  {timestamp}  Page 1\n")
@@ -1155,32 +1174,8 @@ class Linker:
                     # Format address (8 hex digits)
                     addr_str = f"{address:08X}"
                     
-                    # Format code bytes based on size and endianness
-                    code_bytes = []
-                    if size == 1:
-                        code_bytes.append(f"{opcode:02X}")
-                    elif size == 2:
-                        if config.is_little_endian:
-                            code_bytes.append(f"{opcode & 0xFF:02X}")
-                            code_bytes.append(f"{(opcode >> 8) & 0xFF:02X}")
-                        else:
-                            code_bytes.append(f"{(opcode >> 8) & 0xFF:02X}")
-                            code_bytes.append(f"{opcode & 0xFF:02X}")
-                    elif size == 4:
-                        if config.is_little_endian:
-                            code_bytes.append(f"{opcode & 0xFF:02X}")
-                            code_bytes.append(f"{(opcode >> 8) & 0xFF:02X}")
-                            code_bytes.append(f"{(opcode >> 16) & 0xFF:02X}")
-                            code_bytes.append(f"{(opcode >> 24) & 0xFF:02X}")
-                        else:
-                            code_bytes.append(f"{(opcode >> 24) & 0xFF:02X}")
-                            code_bytes.append(f"{(opcode >> 16) & 0xFF:02X}")
-                            code_bytes.append(f"{(opcode >> 8) & 0xFF:02X}")
-                            code_bytes.append(f"{opcode & 0xFF:02X}")
-                    
-                    # Format code string (up to 12 characters for alignment)
-                    code_str = ' '.join(code_bytes)
-                    code_str = f"{code_str:<12}"
+                    # Format code bytes (up to 12 characters for alignment)
+                    code_str = f"{_format_opcode(opcode, size, byteorder):<12}"
                     
                     # Format line number (5 digits)
                     line_str = f"{line_num:5d}" if line_num else "     "
@@ -1198,19 +1193,17 @@ class Linker:
                 for name, symbol in sorted(self.global_symbols.items(), key=lambda x: x[1].address):
                     f.write(f"{symbol.address:08X} {name}\n")
             
-            log_info(f"Listing file generated: {listing_file}")
-            return True
+            return LogLevel.INFO, f"Listing file generated: {listing_file}"
             
         except Exception as e:
-            log_warning(f"Could not generate listing file: {e}")
             import traceback
             traceback.print_exc()
-            return True  # Non-fatal
+            return LogLevel.WARNING, f"Could not generate listing file: {e}"  # Non-fatal
     
     def _write_map_file(self, map_file: Path, instructions: List[Tuple]) -> bool:
         """Write linker map file"""
         try:
-            with open(map_file, 'w', encoding='utf-8') as f:
+            with open(map_file, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as f:
                 f.write("Linker Map File\n")
                 f.write("===============\n\n")
                 
@@ -1268,6 +1261,11 @@ class Linker:
     
     def _generate_intel_hex(self, memory_image: Dict[int, int], output_file: Path) -> bool:
         """Generate Intel HEX format output using custom implementation with proper 32-bit addressing"""
+        if not INTELHEX_AVAILABLE:
+            # Only a note: the custom writer below is used either way. Logged
+            # here (not at import) so it appears only for hex output and is
+            # not counted as a build warning
+            log_debug("intelhex library not available, falling back to custom implementation")
         try:
             # Always use custom implementation for proper Extended Linear Address support
             # The intelhex library defaults to segmented addressing which doesn't work well
@@ -1282,13 +1280,14 @@ class Linker:
     def _generate_intel_hex_custom(self, memory_image: Dict[int, int], output_file: Path) -> bool:
         """Custom Intel HEX generator (fallback when intelhex library not available)"""
         try:
-            with open(output_file, 'w') as f:
+            with open(output_file, 'w', buffering=OUTPUT_BUFFER_SIZE) as f:
                 # Group consecutive bytes into records
                 addresses = sorted(memory_image.keys())
                 if not addresses:
                     log_warning("No data to write to Intel HEX file")
                     # Write empty hex file with end record
                     f.write(":00000001FF\n")
+                    self.bytes_written = f.tell()
                     return True
                 
                 current_extended_addr = None
@@ -1334,6 +1333,7 @@ class Linker:
                 
                 # Write end-of-file record
                 f.write(":00000001FF\n")
+                self.bytes_written = f.tell()
                 
             log_info(f"Intel HEX file written using custom implementation: {output_file}")
             return True
@@ -1369,18 +1369,11 @@ class Linker:
         record_type = 0x00  # Data record
         
         # Calculate checksum
-        checksum = byte_count + address_high + address_low + record_type
-        for byte_val in data:
-            checksum += byte_val
+        checksum = byte_count + address_high + address_low + record_type + sum(data)
         checksum = (-checksum) & 0xFF
         
-        # Write record
-        record = f":{byte_count:02X}{address_16bit:04X}{record_type:02X}"
-        for byte_val in data:
-            record += f"{byte_val:02X}"
-        record += f"{checksum:02X}\n"
-        
-        f.write(record)
+        # Write record (data bytes hex-encoded in one call)
+        f.write(f":{byte_count:02X}{address_16bit:04X}{record_type:02X}{bytes(data).hex().upper()}{checksum:02X}\n")
     
     def _generate_plain_text(self, instructions: List[Tuple], output_file: Path) -> bool:
         """Generate plain text format with ADDRESS INSTRUCTIONS"""
@@ -1389,7 +1382,7 @@ class Linker:
             output_file.parent.mkdir(parents=True, exist_ok=True)
             log_debug(f"Writing plain text to: {output_file}")
             
-            with open(output_file, 'w', encoding='utf-8') as f:
+            with open(output_file, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as f:
                 for address, opcode, operand, source_text, source_file, size in instructions:
                     # Format based on actual size from instruction record
                     if size == 1:
@@ -1409,6 +1402,7 @@ class Linker:
                         hex_digits = size * 2  # 2 hex digits per byte
                         format_str = f"{{:0{hex_digits}X}}"
                         f.write(f"{address:08X}  {format_str.format(opcode)}\n")
+                self.bytes_written = f.tell()
                         
             log_debug("Plain text file written successfully")
             return True
@@ -5,8 +5,10 @@ This module provides structured logging capabilities that mimic compiler output
 with categorized error/warning/info reporting and summary statistics.
 """
 
-import logging
+import atexit
+import os
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
@@ -14,6 +16,12 @@ from dataclasses import dataclass, field
 from enum import Enum
 import json
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 class LogLevel(Enum):
     """Log levels matching compiler-style output"""
     ERROR = "error"
@@ -22,6 +30,55 @@ class LogLevel(Enum):
     DEBUG = "debug"
     ABORT = "abort"
     FATAL = "fatal"
+    
+    def __init__(self, value):
+        # Position in declaration order, used to index LogStats counters
+        self.index = len(self.__class__.__members__)
+
+# Levels that count as build errors
+ERROR_LEVELS = frozenset((LogLevel.ERROR, LogLevel.ABORT, LogLevel.FATAL))
+_IS_ERROR_LEVEL = [level in ERROR_LEVELS for level in LogLevel]
+
+# Build log write buffer; the log is flushed on errors, at build end and on exit
+_LOG_BUFFER_SIZE = 1 << 16
+
+# Verbosity levels that show info messages on the console (--info, --verbose, --debug);
+# per-file phase records are then written as readable info entries
+INFO_VERBOSITY_LEVELS = frozenset(("info", "verbose", "debug"))
+
+# Verbosity level -> levels shown on the console; any other level is "standard"
+_CONSOLE_LEVELS = {
+    # Info / verbose: show info + warnings + errors + aborts + fatal, not debug
+    "info": frozenset(level for level in LogLevel if level is not LogLevel.DEBUG),
+    "verbose": frozenset(level for level in LogLevel if level is not LogLevel.DEBUG),
+    # Debug: show all messages including debug
+    "debug": frozenset(LogLevel),
+}
+# Standard: show only errors and aborts (quiet console)
+_STANDARD_CONSOLE_LEVELS = ERROR_LEVELS
+
+class LogStats:
+    """Per-level message counters stored in a list indexed by LogLevel.index"""
+    
+    __slots__ = ('counts',)
+    
+    def __init__(self):
+        self.counts = [0] * len(LogLevel)
+    
+    def __getitem__(self, level: LogLevel) -> int:
+        return self.counts[level.index]
+    
+    def __setitem__(self, level: LogLevel, count: int) -> None:
+        self.counts[level.index] = count
+    
+    def keys(self) -> List[LogLevel]:
+        return list(LogLevel)
+    
+    def values(self) -> List[int]:
+        return list(self.counts)
+    
+    def items(self):
+        return zip(LogLevel, self.counts)
 
 @dataclass
 class LogEntry:
@@ -111,46 +168,47 @@ class CompilerLogger:
         self.output_file = output_file
         self.console_output = console_output
         self.verbosity_level = verbosity_level  # "standard", "info", "verbose", "debug"
-        self.start_time = datetime.now()
+        self.start_time = datetime.now()  # Wall-clock start, for display
+        self.start_perf_ns = time.perf_counter_ns()  # Monotonic start, for durations
         
         # Statistics counters
-        self.stats = {
-            LogLevel.ERROR: 0,
-            LogLevel.WARNING: 0,
-            LogLevel.INFO: 0,
-            LogLevel.DEBUG: 0,
-            LogLevel.ABORT: 0,
-            LogLevel.FATAL: 0
-        }
+        self.stats = LogStats()
+        # Running total of ERROR + ABORT + FATAL entries
+        self.error_total = 0
         
         # Setup file logging if specified and clear any existing log
+        self._log_stream = None
         if self.output_file:
             self.output_file.parent.mkdir(parents=True, exist_ok=True)
-            # Clear the log file at the start of each compilation
-            with open(self.output_file, 'w', encoding='utf-8') as f:
-                f.write(f"=== TASM Build Log - {self.start_time.strftime('%Y-%m-%d %H:%M:%S')} ===\n")
+            # Clear the log file at the start of each compilation and keep it
+            # open; entries are buffered instead of reopening the file per entry
+            self._log_stream = open(self.output_file, 'w', encoding='utf-8',
+                                    buffering=_LOG_BUFFER_SIZE)
+            self._log_stream.write(f"=== TASM Build Log - {self.start_time.strftime('%Y-%m-%d %H:%M:%S')} ===\n")
+    
+    def elapsed(self) -> float:
+        """Seconds since the build started (monotonic clock)"""
+        return (time.perf_counter_ns() - self.start_perf_ns) / 1e9
+    
+    def flush(self) -> None:
+        """Write buffered log file output to disk"""
+        if self._log_stream is not None:
+            self._log_stream.flush()
+    
+    def close(self) -> None:
+        """Flush and close the log file"""
+        if self._log_stream is not None:
+            self._log_stream.close()
+            self._log_stream = None
     
     def _should_show_in_console(self, level: LogLevel) -> bool:
         """Determine if a log entry should be shown in console based on verbosity level"""
-        import os
-        
         # Check for quiet mode environment variable (used by test_encoder_validation.py)
         if os.environ.get('TASM_QUIET_MODE') == '1':
             # In quiet mode, suppress all console output
             return False
         
-        if self.verbosity_level == "verbose":
-            # Verbose: show all messages except debug
-            return level in [LogLevel.INFO, LogLevel.WARNING, LogLevel.ERROR, LogLevel.ABORT, LogLevel.FATAL]
-        elif self.verbosity_level == "debug":
-            # Debug: show all messages including debug
-            return True
-        elif self.verbosity_level == "info":
-            # Info: show info + warnings + errors + aborts + fatal
-            return level in [LogLevel.INFO, LogLevel.WARNING, LogLevel.ERROR, LogLevel.ABORT, LogLevel.FATAL]
-        else:
-            # Standard: show only errors and aborts (quiet console)
-            return level in [LogLevel.ERROR, LogLevel.ABORT, LogLevel.FATAL]
+        return level in _CONSOLE_LEVELS.get(self.verbosity_level, _STANDARD_CONSOLE_LEVELS)
     
     def log(self, level: LogLevel, message: str, file_path: Optional[str] = None, 
             line_number: Optional[int] = None, column: Optional[int] = None,
@@ -170,8 +228,21 @@ class CompilerLogger:
             error_token_index=error_token_index
         )
         
+        self._emit(entry)
+    
+    def merge_entries(self, entries: List[LogEntry]) -> None:
+        """Record entries logged elsewhere (e.g. by a worker process) as if logged here"""
+        for entry in entries:
+            self._emit(entry)
+    
+    def _emit(self, entry: LogEntry) -> None:
+        """Record an entry, update statistics and write it to console and log file"""
+        level = entry.level
         self.entries.append(entry)
-        self.stats[level] += 1
+        index = level.index
+        self.stats.counts[index] += 1
+        if _IS_ERROR_LEVEL[index]:
+            self.error_total += 1
         
         # Format and output
         formatted_entry = entry.format_entry()
@@ -191,9 +262,11 @@ class CompilerLogger:
             color = color_codes.get(level, '')
             print(f"{color}{formatted_entry}{reset_code}")
         
-        if self.output_file:
-            with open(self.output_file, 'a', encoding='utf-8') as f:
-                f.write(f"{entry.timestamp.strftime('%Y-%m-%d %H:%M:%S')} - {formatted_entry}\n")
+        if self._log_stream is not None:
+            self._log_stream.write(f"{entry.timestamp.strftime('%Y-%m-%d %H:%M:%S')} - {formatted_entry}\n")
+            if _IS_ERROR_LEVEL[index]:
+                # Errors reach the log file right away
+                self._log_stream.flush()
     
     def error(self, message: str, file_path: Optional[str] = None, 
               line_number: Optional[int] = None, column: Optional[int] = None,
@@ -233,10 +306,27 @@ class CompilerLogger:
         """Log a fatal error"""
         self.log(LogLevel.FATAL, message, file_path, line_number, column, error_code)
     
+    def log_file_phase(self, phase: str, file_path: str, status: str, duration_s: float) -> None:
+        """
+        Record the result of one build phase for one file as a single line
+        
+        When info messages are shown on the console (--info, --verbose, --debug)
+        this is a regular info entry. Otherwise one JSON record is appended to
+        the log file, without the per-entry formatting and statistics cost.
+        """
+        if self.verbosity_level in INFO_VERBOSITY_LEVELS:
+            self.info(f"{phase} {status} for {Path(file_path).name} ({duration_s:.3f}s)", str(file_path))
+            return
+        
+        if self._log_stream is not None:
+            record = json.dumps({"phase": phase, "file": str(file_path),
+                                 "status": status, "duration_s": round(duration_s, 6)})
+            self._log_stream.write(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - phase: {record}\n")
+    
     def print_summary(self) -> None:
         """Print compiler-style summary"""
         end_time = datetime.now()
-        duration = end_time - self.start_time
+        duration = self.elapsed()
         
         # Calculate totals - don't count aborts as errors
         total_errors = self.stats[LogLevel.ERROR] + self.stats[LogLevel.FATAL]
@@ -248,7 +338,7 @@ class CompilerLogger:
         print("="*60)
         print(f"Build started: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"Build finished: {end_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"Duration: {duration.total_seconds():.2f} seconds")
+        print(f"Duration: {duration:.2f} seconds")
         print()
         
         # Detailed statistics
@@ -287,18 +377,19 @@ class CompilerLogger:
         print("="*60)
         
         # Write summary to file if specified
-        if self.output_file:
+        if self._log_stream is not None:
             self.write_summary_to_file(duration, total_errors, total_warnings, total_messages)
     
-    def write_summary_to_file(self, duration, total_errors: int, total_warnings: int, total_messages: int) -> None:
+    def write_summary_to_file(self, duration: float, total_errors: int, total_warnings: int, total_messages: int) -> None:
         """Write summary to log file"""
-        with open(self.output_file, 'a', encoding='utf-8') as f:
+        f = self._log_stream
+        if f is not None:
             f.write(f"\n{'='*60}\n")
             f.write(f"COMPILATION SUMMARY\n")
             f.write(f"{'='*60}\n")
             f.write(f"Build started: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
             f.write(f"Build finished: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Duration: {duration.total_seconds():.2f} seconds\n\n")
+            f.write(f"Duration: {duration:.2f} seconds\n\n")
             
             f.write(f"STATISTICS:\n")
             f.write(f"  Errors:   {self.stats[LogLevel.ERROR]:>6}\n")
@@ -321,6 +412,7 @@ class CompilerLogger:
             f.write(f"BUILD {status}\n")
             f.write(f"{total_errors} error(s), {total_warnings} warning(s)\n")
             f.write(f"{'='*60}\n")
+            f.flush()
     
     def export_json_summary(self, json_file: Path) -> None:
         """Export summary as JSON for programmatic access"""
@@ -328,7 +420,7 @@ class CompilerLogger:
             "build_info": {
                 "start_time": self.start_time.isoformat(),
                 "end_time": datetime.now().isoformat(),
-                "duration_seconds": (datetime.now() - self.start_time).total_seconds()
+                "duration_seconds": self.elapsed()
             },
             "statistics": {
                 "errors": self.stats[LogLevel.ERROR],
@@ -353,9 +445,15 @@ class CompilerLogger:
             ]
         }
         
+        # Serialize to one UTF-8 buffer and write it in a single call
+        if ORJSON_AVAILABLE:
+            data = orjson.dumps(summary, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(summary, indent=2, ensure_ascii=False).encode('utf-8')
+        
         json_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False)
+        with open(json_file, 'wb') as f:
+            f.write(data)
 
 # Global logger instance
 _global_logger: Optional[CompilerLogger] = None
@@ -363,6 +461,8 @@ _global_logger: Optional[CompilerLogger] = None
 def initialize_logger(output_file: Optional[Path] = None, console_output: bool = True, verbosity_level: str = "standard") -> CompilerLogger:
     """Initialize the global logger"""
     global _global_logger
+    if _global_logger is not None:
+        _global_logger.close()
     _global_logger = CompilerLogger(output_file, console_output, verbosity_level)
     return _global_logger
 
@@ -373,6 +473,13 @@ def get_logger() -> CompilerLogger:
         _global_logger = CompilerLogger()
     return _global_logger
 
+def _close_global_logger() -> None:
+    """Flush the global logger's build log at interpreter exit"""
+    if _global_logger is not None:
+        _global_logger.close()
+
+atexit.register(_close_global_logger)
+
 # Convenience functions for global logger
 def log_error(message: str, file_path: Optional[str] = None, 
               line_number: Optional[int] = None, column: Optional[int] = None,
@@ -410,6 +517,10 @@ def log_fatal(message: str, file_path: Optional[str] = None,
     """Log a fatal error using global logger"""
     get_logger().fatal(message, file_path, line_number, column, error_code)
 
+def log_file_phase(phase: str, file_path: str, status: str, duration_s: float) -> None:
+    """Record a per-file phase result using global logger"""
+    get_logger().log_file_phase(phase, file_path, status, duration_s)
+
 def print_build_summary() -> None:
     """Print build summary using global logger"""
     get_logger().print_summary()
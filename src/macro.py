@@ -7,7 +7,7 @@ It processes #define directives and expands macro calls throughout the source.
 
 import re
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Set, Union
+from typing import Dict, List, Tuple, Optional, Set, Union, TextIO
 from dataclasses import dataclass
 
 from logger import log_info, log_error, log_warning, log_debug, log_abort, get_logger
@@ -43,44 +43,78 @@ class MacroExpander:
         Returns:
             True if successful, False if errors occurred
         """
+        expanded_lines = self._expand_file(input_file)
+        if expanded_lines is None:
+            return False
+        
+        try:
+            # Write expanded output
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.writelines(expanded_lines)
+        except Exception as e:
+            log_error(f"Unexpected error during macro expansion: {str(e)}", 
+                     str(input_file), error_code="MACRO_EXPANSION_ERROR")
+            return False
+        
+        log_info(f"Macro expansion completed successfully", str(output_file))
+        log_info(f"Generated {len(expanded_lines)} lines of expanded code")
+        return True
+    
+    def process_stream(self, input_file: Path, out: TextIO) -> bool:
+        """
+        Process assembly file and write the expanded source to an open text stream
+        
+        Args:
+            input_file: Source assembly file
+            out: Writable text stream (e.g. sys.stdout)
+            
+        Returns:
+            True if successful, False if errors occurred
+        """
+        expanded_lines = self._expand_file(input_file)
+        if expanded_lines is None:
+            return False
+        
+        try:
+            out.writelines(expanded_lines)
+        except Exception as e:
+            log_error(f"Unexpected error during macro expansion: {str(e)}", 
+                     str(input_file), error_code="MACRO_EXPANSION_ERROR")
+            return False
+        
+        log_info(f"Macro expansion completed successfully")
+        log_info(f"Generated {len(expanded_lines)} lines of expanded code")
+        return True
+    
+    def _expand_file(self, input_file: Path) -> Optional[List[str]]:
+        """Read a source file, collect its macro definitions and expand it"""
         self.current_file = str(input_file)
         log_info(f"Starting macro expansion for {input_file.name}", str(input_file))
         
         try:
-            # Read source file
-            if not input_file.exists():
+            # Read source file (a missing file is reported by open, no extra stat)
+            try:
+                with open(input_file, 'r', encoding='utf-8') as f:
+                    source_lines = f.readlines()
+            except FileNotFoundError:
                 log_error(f"Source file not found: {input_file.name}", 
                          str(input_file), error_code="FILE_NOT_FOUND")
-                return False
-            
-            with open(input_file, 'r', encoding='utf-8') as f:
-                source_lines = f.readlines()
+                return None
             
             log_info(f"Read {len(source_lines)} lines from source file", str(input_file))
             
             # First pass: collect macro definitions
             if not self._collect_macros(source_lines):
-                return False
+                return None
             
             # Second pass: expand macros
-            expanded_lines = self._expand_macros(source_lines)
-            if expanded_lines is None:
-                return False
-            
-            # Write expanded output
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.writelines(expanded_lines)
-            
-            log_info(f"Macro expansion completed successfully", str(output_file))
-            log_info(f"Generated {len(expanded_lines)} lines of expanded code")
-            
-            return True
+            return self._expand_macros(source_lines)
             
         except Exception as e:
             log_error(f"Unexpected error during macro expansion: {str(e)}", 
                      str(input_file), error_code="MACRO_EXPANSION_ERROR")
-            return False
+            return None
     
     def process_macro_file(self, macro_file: Path) -> bool:
         """
@@ -95,16 +129,15 @@ class MacroExpander:
         log_info(f"Processing macro file: {macro_file.name}", str(macro_file))
         
         try:
-            # Check if macro file exists
-            if not macro_file.exists():
+            # Read macro file (a missing file is reported by open, no extra stat)
+            try:
+                with open(macro_file, 'r', encoding='utf-8') as f:
+                    macro_lines = f.readlines()
+            except FileNotFoundError:
                 log_error(f"Macro file not found: {macro_file.name}", 
                          str(macro_file), error_code="MACRO_FILE_NOT_FOUND")
                 return False
             
-            # Read macro file
-            with open(macro_file, 'r', encoding='utf-8') as f:
-                macro_lines = f.readlines()
-            
             log_debug(f"Read {len(macro_lines)} lines from macro file", str(macro_file))
             
             # Collect macro definitions from this file
@@ -11,6 +11,7 @@ Supports all NASM numeric formats:
 """
 
 import re
+from functools import lru_cache
 from typing import Union
 
 
@@ -182,10 +183,15 @@ class NumericParser:
             return NumericParser.parse(value_str)
 
 
+@lru_cache(maxsize=4096)
 def parse_numeric(value_str: str) -> int:
     """
     Convenience function to parse a numeric constant.
     
+    Results are memoized by string: programs reuse a small set of immediates
+    (0, 1, -1, masks), so most calls are a cache hit. Invalid strings raise
+    on every call and are never cached.
+    
     Args:
         value_str: String representation of the number
         
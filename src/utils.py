@@ -5,12 +5,11 @@ This module contains common utility functions that can be used
 across the application.
 """
 
-import logging
 from datetime import datetime
 from pathlib import Path
 from config_loader import get_config
 
-def setup_logging(log_level=logging.INFO, log_file=None):
+def setup_logging(log_level=None, log_file=None):
     """
     Set up logging configuration.
     
@@ -18,6 +17,10 @@ def setup_logging(log_level=logging.INFO, log_file=None):
         log_level: Logging level (default: INFO)
         log_file: Optional log file path
     """
+    # The logging package is only needed here, not on every TASM run
+    import logging
+    if log_level is None:
+        log_level = logging.INFO
     format_str = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     
     if log_file:
@@ -0,0 +1,100 @@
+"""
+Test command line argument parsing
+
+Tests for TASM.parse_arguments() covering the NASM-compatible option forms.
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from TASM import parse_arguments
+
+
+def test_defaults():
+    """Test option defaults with a single input file."""
+    opts, error = parse_arguments(["test.asm"])
+    assert error is None
+    assert opts['input_files'] == ["test.asm"]
+    assert opts['output_format'] == 'bin'
+    assert opts['output_file'] is None
+    assert opts['listing_file'] is None
+    assert opts['macro_files'] == []
+
+
+def test_separated_and_attached_values():
+    """Test -X value, -Xvalue and --option=value forms."""
+    opts, error = parse_arguments(["-o", "out.bin", "-fhex", "-sset.json",
+                                   "--macros=a.mac", "-m", "b.mac",
+                                   "--output-dir=build", "test.asm"])
+    assert error is None
+    assert opts['output_file'] == "out.bin"
+    assert opts['user_specified_output']
+    assert opts['output_format'] == 'hex'
+    assert opts['instruction_set_file'] == "set.json"
+    assert opts['macro_files'] == ["a.mac", "b.mac"]
+    assert opts['output_dir_override'] == "build"
+
+
+def test_listing_does_not_consume_source_file():
+    """Test that -l followed by an .asm file auto-generates the listing name."""
+    opts, error = parse_arguments(["-l", "test.asm"])
+    assert error is None
+    assert opts['listing_file'] is True
+    assert opts['input_files'] == ["test.asm"]
+
+    opts, error = parse_arguments(["-l", "test.lst", "test.asm"])
+    assert opts['listing_file'] == "test.lst"
+    assert opts['input_files'] == ["test.asm"]
+
+
+def test_ignored_nasm_options():
+    """Test that ignored NASM options skip their argument."""
+    opts, error = parse_arguments(["-I", "include", "-g", "test.asm"])
+    assert error is None
+    assert opts['input_files'] == ["test.asm"]
+
+
+def test_optimization_flags():
+    """Test -O32 and -Ono-implicit flags."""
+    opts, error = parse_arguments(["-O32", "-Ono-implicit", "test.asm"])
+    assert error is None
+    assert opts['force_32bit']
+    assert opts['no_implicit']
+
+
+def test_no_cache_flag():
+    """Test that --no-cache disables the object cache."""
+    opts, error = parse_arguments(["test.asm"])
+    assert opts['use_cache']
+    opts, error = parse_arguments(["--no-cache", "test.asm"])
+    assert error is None
+    assert not opts['use_cache']
+
+
+def test_jobs_option():
+    """Test -j/--jobs in separated and attached forms."""
+    for args in (["-j", "4"], ["-j4"], ["--jobs", "4"], ["--jobs=4"]):
+        opts, error = parse_arguments(args + ["test.asm"])
+        assert error is None
+        assert opts['max_jobs'] == 4
+    assert parse_arguments(["test.asm"])[0]['max_jobs'] is None
+
+
+@pytest.mark.parametrize("args, message", [
+    (["-o"], "-o requires an argument"),
+    (["-f"], "-f requires an argument"),
+    (["--output-dir"], "--output-dir requires an argument"),
+    (["-f", "elf", "test.asm"], "unknown output format 'elf'"),
+    (["-fxyz", "test.asm"], "unknown output format 'xyz'"),
+    (["-j", "0", "test.asm"], "invalid number of jobs '0'"),
+    (["--jobs=x", "test.asm"], "invalid number of jobs 'x'"),
+])
+def test_errors(args, message):
+    """Test error messages for missing or invalid option values."""
+    opts, error = parse_arguments(args)
+    assert opts is None
+    assert error == message
@@ -0,0 +1,56 @@
+"""
+Test build cache eviction
+
+Tests for TASM._prune_cache(), the LRU eviction of the on-disk caches.
+"""
+
+import os
+import pytest
+from pathlib import Path
+import sys
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import TASM
+
+
+def _make_entries(cache_dir, count, size=10):
+    """Create cache entries whose atime increases with their index."""
+    for i in range(count):
+        entry = cache_dir / f"{i:02d}.obj"
+        entry.write_bytes(b"x" * size)
+        os.utime(entry, ns=(i * 1_000_000_000, i * 1_000_000_000))
+
+
+def test_prune_keeps_most_recently_used(temp_dir, monkeypatch):
+    """Entries beyond the cap are evicted oldest atime first."""
+    monkeypatch.setattr(TASM, 'CACHE_MAX_ENTRIES', 3)
+    _make_entries(temp_dir, 5)
+    TASM._prune_cache(temp_dir, '.obj')
+    assert sorted(p.name for p in temp_dir.iterdir()) == ["02.obj", "03.obj", "04.obj"]
+
+
+def test_prune_enforces_size_cap(temp_dir, monkeypatch):
+    """The byte cap evicts entries even below the entry cap."""
+    monkeypatch.setattr(TASM, 'CACHE_MAX_BYTES', 25)
+    _make_entries(temp_dir, 4)
+    TASM._prune_cache(temp_dir, '.obj')
+    assert sorted(p.name for p in temp_dir.iterdir()) == ["02.obj", "03.obj"]
+
+
+def test_prune_ignores_other_files(temp_dir, monkeypatch):
+    """Only entries with the cache's suffix are counted and evicted."""
+    monkeypatch.setattr(TASM, 'CACHE_MAX_ENTRIES', 1)
+    _make_entries(temp_dir, 2)
+    (temp_dir / "other.tmp").write_bytes(b"x")
+    TASM._prune_cache(temp_dir, '.obj')
+    assert sorted(p.name for p in temp_dir.iterdir()) == ["01.obj", "other.tmp"]
+
+
+def test_fetch_refreshes_atime(temp_dir):
+    """A cache hit marks the entry as recently used."""
+    _make_entries(temp_dir, 1)
+    entry = temp_dir / "00.obj"
+    assert TASM._cache_fetch(entry, temp_dir / "target.obj")
+    assert entry.stat().st_atime_ns > 0
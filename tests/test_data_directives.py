@@ -0,0 +1,44 @@
+"""
+Test data directives module
+
+Tests for operand list splitting and comment handling in DataDirective.
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from data_directives import DataDirective
+
+@pytest.fixture
+def directive():
+    return DataDirective()
+
+def test_comma_inside_string_does_not_split(directive):
+    """Commas inside quoted strings are part of the string."""
+    assert directive.parse_data_list('"a,b", 1') == [b'a,b', 1]
+    assert directive.parse_data_list("'x,y',2") == [b'x,y', 2]
+
+def test_comment_is_removed(directive):
+    """Text after an unquoted ';' is a comment."""
+    assert directive.parse_data_list('1, 2 ; three, four') == [1, 2]
+
+def test_semicolon_inside_string_is_data(directive):
+    """A ';' inside quotes does not start a comment."""
+    assert directive.parse_data_list('"a;b", 3 ; comment') == [b'a;b', 3]
+    assert directive.calculate_size('db "a;b", 0 ; comment') == 4
+
+def test_other_quote_inside_string(directive):
+    """A quote of the other kind inside a string does not close it."""
+    assert directive.parse_data_list('"it\'s", 0') == [b"it's", 0]
+
+def test_backslash_is_not_an_escape(directive):
+    """NASM double-quoted strings take a backslash literally."""
+    assert directive.parse_data_list(r'"a\", 1') == [b'a\\', 1]
+
+def test_empty_items_are_dropped(directive):
+    """Empty list items between commas produce no data."""
+    assert directive.parse_data_list(',1,,2,') == [1, 2]
@@ -17,7 +17,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 from logger import (
     CompilerLogger, LogLevel, LogEntry, initialize_logger,
     log_info, log_error, log_warning, log_debug, log_abort, log_fatal,
-    export_build_summary_json
+    export_build_summary_json, get_logger
 )
 
 
@@ -65,6 +65,7 @@ class TestCompilerLogger:
             logger = CompilerLogger(log_file, console_output=False)
             assert logger is not None
             assert log_file.exists()
+            logger.close()
         finally:
             if log_file.exists():
                 log_file.unlink()
@@ -97,6 +98,7 @@ class TestCompilerLogger:
             assert len(logger.entries) == 6
             
             # Verify log file content
+            logger.close()
             content = log_file.read_text(encoding='utf-8')
             assert "Test error" in content
             assert "Test warning" in content
@@ -141,6 +143,74 @@ class TestCompilerLogger:
         total = sum(logger.stats.values())
         assert total == 9
 
+    def test_error_total_tracking(self):
+        """Test that error_total counts errors, aborts and fatals only"""
+        logger = CompilerLogger(console_output=False)
+        assert logger.error_total == 0
+
+        logger.warning("Warning")
+        logger.info("Info message")
+        logger.debug("Debug message")
+        assert logger.error_total == 0
+
+        logger.error("Error")
+        logger.abort("Abort")
+        logger.fatal("Fatal")
+        assert logger.error_total == 3
+        assert logger.error_total == (logger.stats[LogLevel.ERROR] +
+                                      logger.stats[LogLevel.ABORT] +
+                                      logger.stats[LogLevel.FATAL])
+
+    def test_file_phase_record(self):
+        """Test per-file phase records in standard and verbose mode"""
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.log') as f:
+            log_file = Path(f.name)
+
+        try:
+            # Standard verbosity: one JSON line in the log file, no entry
+            logger = CompilerLogger(log_file, console_output=False)
+            logger.log_file_phase("Assembly", "main.asm", "completed", 0.25)
+            assert logger.entries == []
+            logger.close()
+
+            last_line = log_file.read_text(encoding='utf-8').splitlines()[-1]
+            record = json.loads(last_line.split(" - phase: ", 1)[1])
+            assert record == {"phase": "Assembly", "file": "main.asm",
+                              "status": "completed", "duration_s": 0.25}
+
+            # Verbose: regular info entry
+            logger = CompilerLogger(log_file, console_output=False, verbosity_level="verbose")
+            logger.log_file_phase("Assembly", "main.asm", "completed", 0.25)
+            assert logger.stats[LogLevel.INFO] == 1
+            assert logger.entries[0].message == "Assembly completed for main.asm (0.250s)"
+            logger.close()
+        finally:
+            if log_file.exists():
+                log_file.unlink()
+
+    def test_log_file_buffering(self):
+        """Test that log file output is buffered until flushed, except errors"""
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.log') as f:
+            log_file = Path(f.name)
+
+        try:
+            logger = CompilerLogger(log_file, console_output=False)
+            logger.info("Buffered info")
+            assert "Buffered info" not in log_file.read_text(encoding='utf-8')
+
+            logger.error("Immediate error")
+            content = log_file.read_text(encoding='utf-8')
+            assert "Buffered info" in content
+            assert "Immediate error" in content
+
+            logger.warning("Buffered warning")
+            logger.flush()
+            assert "Buffered warning" in log_file.read_text(encoding='utf-8')
+            logger.close()
+        finally:
+            if log_file.exists():
+                log_file.unlink()
+
 
 class TestJSONExport:
     """Test JSON summary export functionality"""
@@ -208,6 +278,34 @@ class TestJSONExport:
             if json_file.exists():
                 json_file.unlink()
 
+    def test_json_export_without_orjson(self, monkeypatch):
+        """Test that the stdlib fallback writes the same UTF-8 JSON"""
+        import logger as logger_module
+        
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
+            json_file = Path(f.name)
+        
+        try:
+            logger = CompilerLogger(console_output=False)
+            logger.warning("Überlauf in Zeile 3", "test.asm", 3)
+            
+            logger.export_json_summary(json_file)
+            with open(json_file, 'r', encoding='utf-8') as f:
+                default_data = json.load(f)
+            
+            monkeypatch.setattr(logger_module, "ORJSON_AVAILABLE", False)
+            logger.export_json_summary(json_file)
+            with open(json_file, 'r', encoding='utf-8') as f:
+                fallback_data = json.load(f)
+            
+            assert fallback_data["entries"] == default_data["entries"]
+            assert fallback_data["statistics"] == default_data["statistics"]
+            assert fallback_data["entries"][0]["message"] == "Überlauf in Zeile 3"
+            
+        finally:
+            if json_file.exists():
+                json_file.unlink()
+
 
 class TestGlobalLoggerFunctions:
     """Test global logger convenience functions"""
@@ -220,6 +318,7 @@ class TestGlobalLoggerFunctions:
     
     def teardown_method(self):
         """Cleanup test files"""
+        get_logger().close()
         if self.log_file.exists():
             self.log_file.unlink()
     
@@ -242,6 +341,7 @@ class TestGlobalLoggerFunctions:
         """Test global log functions with location info"""
         log_error("Error with location", "test.asm", 42, 15, "ERR_CODE")
         log_warning("Warning with location", "main.asm", 67, error_code="WARN_CODE")
+        get_logger().flush()
         
         content = self.log_file.read_text(encoding='utf-8')
         assert "test.asm" in content